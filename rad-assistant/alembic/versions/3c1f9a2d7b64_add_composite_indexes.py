@@ -0,0 +1,34 @@
+"""Add composite indexes for per-radiologist queries
+
+Revision ID: 3c1f9a2d7b64
+Revises: 8777667ae3c0
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f9a2d7b64'
+down_revision: Union[str, Sequence[str], None] = '8777667ae3c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_le_rad_time', 'learning_events', ['radiologist_id', 'timestamp'], unique=False)
+    op.create_index('ix_le_rad_type_sev', 'learning_events', ['radiologist_id', 'event_type', 'severity'], unique=False)
+    op.create_index('ix_fe_rad_created', 'feedback_events', ['radiologist_id', 'created_at'], unique=False)
+    op.create_index('ix_audit_user_time', 'audit_logs', ['user_id', 'timestamp'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_audit_user_time', table_name='audit_logs')
+    op.drop_index('ix_fe_rad_created', table_name='feedback_events')
+    op.drop_index('ix_le_rad_type_sev', table_name='learning_events')
+    op.drop_index('ix_le_rad_time', table_name='learning_events')
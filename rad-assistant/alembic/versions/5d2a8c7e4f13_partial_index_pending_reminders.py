@@ -0,0 +1,32 @@
+"""Partial index on due_date for pending follow-up reminders
+
+Revision ID: 5d2a8c7e4f13
+Revises: 9b4e2f61c0d8
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2a8c7e4f13'
+down_revision: Union[str, Sequence[str], None] = '9b4e2f61c0d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_fr_pending_due', 'followup_reminders', ['due_date'], unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+        sqlite_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_fr_pending_due', table_name='followup_reminders')
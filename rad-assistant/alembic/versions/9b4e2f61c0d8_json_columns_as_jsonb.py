@@ -0,0 +1,58 @@
+"""Store JSON document columns as JSONB on PostgreSQL
+
+Revision ID: 9b4e2f61c0d8
+Revises: 3c1f9a2d7b64
+Create Date: 2026-10-15 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4e2f61c0d8'
+down_revision: Union[str, Sequence[str], None] = '3c1f9a2d7b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, nullable)
+_JSON_COLUMNS = [
+    ('reports', 'key_findings_json', True),
+    ('learning_events', 'tags_json', True),
+    ('learning_events', 'qa_issues_json', True),
+    ('cme_cases', 'case_json', False),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Other backends keep JSON as text, which is what the columns already hold.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column, nullable in _JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.Text(),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::jsonb',
+        )
+    op.create_index('ix_le_tags_gin', 'learning_events', ['tags_json'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_le_tags_gin', table_name='learning_events')
+    for table, column, nullable in _JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.Text(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::text',
+        )
@@ -323,7 +323,7 @@ class CMEPlatformAgent:
                 id=case.case_id,
                 radiologist_id=case.radiologist_id,
                 digest_period=case.source_digest_period,
-                case_json=case.model_dump_json(),
+                case_json=case.model_dump(mode="json"),
                 credit_points=case.credit_points,
                 status="pending",
             )
@@ -163,10 +163,9 @@ class FollowUpExtractorAgent:
                 
                 # Clean response
                 cleaned_response = self._clean_json(response_text)
-                data = json.loads(cleaned_response)
                 
-                # Parse with Pydantic
-                response = FollowUpExtractionResponse.model_validate(data)
+                # Parse and validate in one pass (invalid JSON raises ValidationError)
+                response = FollowUpExtractionResponse.model_validate_json(cleaned_response)
                 
                 latency = (datetime.datetime.now() - start_time).total_seconds()
                 self.logger.info(
@@ -223,7 +223,7 @@ class FollowupReminderEngine:
         Returns:
             List of FollowupReminderOut models ordered by due date ascending.
         """
-        from .repositories import FollowupReminderRepository
+        from ..repositories import FollowupReminderRepository
 
         repo = FollowupReminderRepository(db_session)
         rows = repo.get_due_reminders(within_days=within_days)
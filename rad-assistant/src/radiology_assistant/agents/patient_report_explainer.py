@@ -194,10 +194,9 @@ Input JSON:
                 )
 
                 cleaned_response = self._clean_json(raw_response)
-                payload = json.loads(cleaned_response)
                 
-                # Validation handled by Pydantic model
-                response = PatientReportSummaryResponse(**payload)
+                # Parse and validate in one pass (invalid JSON raises ValidationError)
+                response = PatientReportSummaryResponse.model_validate_json(cleaned_response)
 
                 duration = time.monotonic() - start
                 
@@ -212,8 +212,8 @@ class ReportDraftingAgent:
                 # Avoid logging raw LLM responses (may contain PHI). Log safe metadata instead.
                 try:
                     import hashlib
-                    sha = hashlib.sha256(response_text.encode("utf-8")).hexdigest()
-                    self.logger.debug("LLM response received: length=%d sha256=%s", len(response_text), sha)
+                    digest = hashlib.blake2b(response_text.encode("utf-8"), digest_size=16).hexdigest()
+                    self.logger.debug("LLM response received: length=%d blake2b=%s", len(response_text), digest)
                 except Exception:
                     self.logger.debug("LLM response received: length=%d", len(response_text) if response_text is not None else 0)
 
@@ -24,7 +24,7 @@ from ..models import (
     CVHighlightRequest
 )
 from ..llm_client import LLMClient
-from ..cv.models import ChestXrayAnomalyModel
+from ..cv.models import DEFAULT_WEIGHTS, get_model
 from ..agents.visual_highlighter import VisualHighlightingAgent
 
 logger = logging.getLogger(__name__)
@@ -50,8 +50,9 @@ class CVRouter:
         if item.modality == "XR" and item.body_region == "Chest":
             if "xr_chest" not in self._models:
                 try:
-                    # In a real app, we'd load weights specified in config
-                    cv_model = ChestXrayAnomalyModel(device="cpu") 
+                    # Weights come from the config mapping; the model is shared process-wide
+                    weights = self.config.model_mapping.get(key, DEFAULT_WEIGHTS)
+                    cv_model = get_model(weights)
                     self._models["xr_chest"] = VisualHighlightingAgent(cv_model)
                     logger.info("Loaded XR/Chest model for triage.")
                 except Exception as e:
@@ -76,19 +77,8 @@ class WorklistTriageAgent:
             self.logger.warning("No triage thresholds configured!")
 
     def _get_thresholds(self, modality: str, body_region: Optional[str]) -> Optional[TriageThresholdConfig]:
-        """Find matching threshold config."""
-        for t in self.config.thresholds:
-            # Simple matching logic
-            if t.modality_group.value == modality:
-                if t.body_region is None or t.body_region.lower() == (body_region or "").lower():
-                    return t
-        
-        # Fallback: try to match just modality group if body region specific one not found
-        for t in self.config.thresholds:
-             if t.modality_group.value == modality and t.body_region is None:
-                 return t
-                 
-        return None
+        """Find matching threshold config (an O(1) lookup in the config's index)."""
+        return self.config.find_thresholds(modality, body_region)
 
     def _calculate_triage(
         self, 
@@ -5,13 +5,14 @@ role-based access control, and production-grade error handling.
 """
 
 import logging
-from typing import Any, Optional, List, Dict
-from pydantic import BaseModel
+from typing import Any, Optional, List, Dict, Type, TypeVar
+from pydantic import BaseModel, ValidationError
 from functools import lru_cache
 from contextlib import asynccontextmanager
 from datetime import timedelta
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, Depends, status, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import OAuth2PasswordRequestForm
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
@@ -23,11 +24,12 @@ from radiology_assistant.models import (
     FollowUpExtractionRequest, FollowUpExtractionResponse,
     ReportQARequest, ReportQAResponse,
     PatientReportSummaryRequest, PatientReportSummaryResponse,
-    WorklistTriageRequest, WorklistTriageResponse,
+    WorklistTriageRequest, WorklistTriageResponse, TriageConfig,
     StudyOrchestrationRequest, StudyOrchestrationResponse,
     RadiologistLearningDigestRequest, RadiologistLearningDigestResponse, LearningEvent,
+    RadBaseModel,
 )
-from radiology_assistant.config import Config
+from radiology_assistant.config import Config, TRIAGE_CONFIG_PATH
 from radiology_assistant.llm_client import LLMClient
 from radiology_assistant.auth import (
     TokenResponse, authenticate_user, create_access_token,
@@ -37,13 +39,13 @@ from radiology_assistant.agents import ReportDraftingAgent
 from radiology_assistant.agents.visual_highlighter import VisualHighlightingAgent
 from radiology_assistant.agents.worklist_triage import WorklistTriageAgent
 from radiology_assistant.agents.study_orchestrator import StudyOrchestratorAgent
-from radiology_assistant.cv.models import ChestXrayAnomalyModel
-from radiology_assistant.cv.io import InvalidDICOMError, load_dicom_with_metadata, load_image_from_bytes
+from radiology_assistant.cv.models import get_model
+from radiology_assistant.cv.io import InvalidDICOMError, load_dicom_metadata_only, load_image_from_bytes
 
 from sqlalchemy.orm import Session
 from radiology_assistant.database import get_db, init_db
 from radiology_assistant.repositories import SQLLearningEventRepository
-from radiology_assistant.middleware import AuditLoggingMiddleware
+from radiology_assistant.middleware import AuditLoggingMiddleware, audit_writer
 from radiology_assistant.observability import setup_logging, setup_metrics
 from radiology_assistant.tasks import orchestrate_study_task
 from celery.result import AsyncResult
@@ -67,7 +69,28 @@ async def lifespan(app: FastAPI):
     except Exception:
         logger.exception("Failed to pre-initialize agent on startup")
         raise
+
+    # 2. Load and warm up the CV models referenced by the triage config so the
+    # first request does not pay for weight loading. Failures are not fatal:
+    # routes fall back to loading (or skipping) the model on demand.
+    for key, weights in Config.get_triage_config().model_mapping.items():
+        try:
+            get_model(weights)
+            logger.info("Warmed CV model %s for %s", weights, key)
+        except Exception as e:
+            logger.warning("Could not warm CV model %s for %s: %s", weights, key, e)
+
+    # 3. Round-trip the documented examples once, then build the OpenAPI
+    # schema: FastAPI otherwise generates it (~0.2 s) on the first /docs hit.
+    for model in (ReportDraftRequest, ReportDraft):
+        try:
+            model.model_validate(model.model_config["json_schema_extra"]["example"]).model_dump_json()
+        except Exception as e:
+            logger.warning("Could not warm model %s: %s", model.__name__, e)
+    app.openapi()
     yield
+    # Stop the background writer once it has written every queued audit entry
+    audit_writer.close()
     logger.info("API shutdown")
 
 
@@ -102,6 +125,63 @@ def get_llm_client() -> LLMClient:
     return LLMClient()
 
 
+# ---------------------------------------------------------------------------
+# Raw JSON bodies for large batch requests
+# ---------------------------------------------------------------------------
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+def _inline_schema(model: Type[RadBaseModel]) -> Dict[str, Any]:
+    """JSON schema for `model` with its $defs inlined, for use in openapi_extra."""
+    schema = model.cached_json_schema()
+    defs = schema.get("$defs", {})
+
+    def resolve(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref", "")
+            if ref.startswith("#/$defs/"):
+                return resolve(defs[ref[len("#/$defs/"):]])
+            return {key: resolve(value) for key, value in node.items() if key != "$defs"}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+
+    return resolve(schema)
+
+
+def json_body(model: Type[_ModelT]):
+    """
+    Dependency that validates the raw request body with
+    `model.model_validate_json`: pydantic-core parses and validates in one
+    pass, without building the intermediate dict FastAPI's json.loads +
+    validation would. Errors are reported as the usual 422 response.
+    Pair with `openapi_extra=json_body_openapi(model)` to keep the docs.
+
+    The caller is authenticated before the body is read, so anonymous
+    clients get a 401 rather than a 422 that echoes their input.
+    """
+    async def dependency(request: Request, _: TokenData = Depends(get_current_user)) -> _ModelT:
+        body = await request.body()
+        try:
+            return model.model_validate_json(body)
+        except ValidationError as e:
+            errors = [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+            raise RequestValidationError(errors, body=body)
+
+    return dependency
+
+
+def json_body_openapi(model: Type[RadBaseModel]) -> Dict[str, Any]:
+    """openapi_extra documenting a `json_body(model)` request body."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_schema(model)}},
+        }
+    }
+
+
 # Module-level singleton for Agent 1. Tests can monkeypatch this value.
 _agent: ReportDraftingAgent | None = None
 
@@ -212,8 +292,7 @@ def get_cv_agent() -> VisualHighlightingAgent:
     """Return singleton VisualHighlightingAgent."""
     global _cv_agent
     if _cv_agent is None:
-        # In a real app, we might load weights from Config
-        model = ChestXrayAnomalyModel(device="cpu")
+        model = get_model()
         _cv_agent = VisualHighlightingAgent(model=model, logger=logger)
         logger.info("VisualHighlightingAgent initialized")
     return _cv_agent
@@ -237,7 +316,7 @@ async def cv_highlight(
     # Try to extract DICOM metadata to auto-fill modality if missing
     modality = request.modality
     try:
-        _, meta = load_dicom_with_metadata(image_bytes)
+        meta = load_dicom_metadata_only(image_bytes)
         if not modality and meta.get("modality"):
             modality = meta["modality"]
             logger.info("Auto-populated modality from DICOM: %s", modality)
@@ -434,12 +513,22 @@ def get_triage_agent() -> WorklistTriageAgent:
     return _triage_agent
 
 
-@app.post("/v1/worklist/triage", response_model=WorklistTriageResponse, tags=["Agent 6: Worklist Triage"])
+@app.post(
+    "/v1/worklist/triage",
+    response_model=WorklistTriageResponse,
+    tags=["Agent 6: Worklist Triage"],
+    openapi_extra=json_body_openapi(WorklistTriageRequest),
+)
 def triage_worklist(
-    request: WorklistTriageRequest,
+    request: WorklistTriageRequest = Depends(json_body(WorklistTriageRequest)),
     current_user: TokenData = Depends(get_current_user),
 ):
-    """Agent 6: Triage a worklist of studies and recommend priority order."""
+    """
+    Agent 6: Triage a worklist of studies and recommend priority order.
+
+    Worklists can hold hundreds of studies, so the body is decoded straight
+    from raw JSON (see `json_body`).
+    """
     logger.info("worklist_triage: user=%s items=%d", current_user.sub, len(request.worklist_items))
     try:
         agent = get_triage_agent()
@@ -792,7 +881,6 @@ def grade_cme_case(
     db: Session = Depends(get_db),
 ):
     """Grade submitted CME answers. Returns score, pass/fail, and credits earned."""
-    import json as _json
     from radiology_assistant.agents.cme_platform import CMEPlatformAgent, CMECase
     from radiology_assistant.db_models import CMECaseDB
 
@@ -800,7 +888,7 @@ def grade_cme_case(
     if not row:
         raise HTTPException(status_code=404, detail=f"CME case {case_id} not found.")
     try:
-        case = CMECase(**_json.loads(row.case_json))
+        case = CMECase.model_validate(row.case_json)
         result = CMEPlatformAgent(llm_client=get_llm_client()).grade_answers(
             case=case, submitted_answers=payload.submitted_answers,
             radiologist_id=payload.radiologist_id, db_session=db,
@@ -815,37 +903,53 @@ def grade_cme_case(
 # Phase 8: Admin - Dynamic Triage Config
 # ---------------------------------------------------------------------------
 
-@app.put("/v1/admin/triage_config", tags=["Admin"])
+@app.put(
+    "/v1/admin/triage_config",
+    tags=["Admin"],
+    openapi_extra=json_body_openapi(TriageConfig),
+)
 def update_triage_config(
-    new_config: dict,
     current_user: TokenData = Depends(require_role(UserRole.ADMIN)),
+    parsed: TriageConfig = Depends(json_body(TriageConfig)),
 ):
     """
     Update the triage configuration YAML file. Admin only.
-    Expects full TriageConfig JSON/Dict.
+    Expects full TriageConfig JSON.
+
+    The raw body is validated directly by pydantic-core (see `json_body`) and
+    the validated model is serialized once with `model_dump_json()`. JSON is a
+    subset of YAML, so `Config.get_triage_config()` reads the written file
+    back unchanged. The handler is sync so the blocking file write runs in
+    FastAPI's threadpool rather than on the event loop.
     """
-    import yaml
     import os
-    from radiology_assistant.models import TriageConfig
-    
-    # 1. Validate the new config
-    try:
-        parsed = TriageConfig(**new_config)
-    except Exception as e:
-        raise HTTPException(status_code=422, detail=f"Invalid triage config: {e}")
+    import stat
+    import tempfile
 
-    # 2. Save to file
-    config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "triage_config.yaml")
+    global _triage_agent
+
+    # 1. Save to file atomically (write temp file, then rename over the target).
+    # mkstemp creates the file as 0600, so carry over the existing file's mode.
+    config_path = TRIAGE_CONFIG_PATH
+    payload_bytes = parsed.model_dump_json(indent=2).encode("utf-8")
     try:
-        with open(config_path, 'w') as f:
-            yaml.dump(parsed.model_dump(), f)
-    except Exception as e:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(config_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload_bytes)
+            if os.path.exists(config_path):
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(config_path).st_mode))
+            os.replace(tmp_path, config_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
         logger.exception("Failed to save triage config")
         raise HTTPException(status_code=500, detail="Failed to persist configuration.")
 
-    # 3. Clear lru_cache for triage agent getter to force reload
-    get_triage_agent.cache_clear()
-    
+    # 2. Drop the triage agent singleton so the next request reloads the config
+    _triage_agent = None
+
     return {"message": "Triage configuration updated and agent reloaded."}
 
 
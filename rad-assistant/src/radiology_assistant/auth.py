@@ -5,10 +5,14 @@ Provides JWT token creation/verification and role-based access control
 using FastAPI's OAuth2 security utilities.
 """
 
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -27,6 +31,12 @@ pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 # OAuth2 token URL — used by Swagger UI
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/auth/token", auto_error=False)
 
+# Verified tokens, keyed by a digest of (signing config, token) so raw tokens
+# are not held in memory: digest -> (exp timestamp, TokenData). LRU order.
+_TOKEN_CACHE_MAX = 2048
+_token_cache: "OrderedDict[bytes, Tuple[float, TokenData]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Role Model
@@ -120,6 +130,19 @@ def decode_token(token: str) -> TokenData:
     Raises:
         HTTPException 401: If token is missing, expired, or malformed.
     """
+    # The same token is presented on every request until it expires, so
+    # successful verifications are cached until the token's exp.
+    cache_key = hashlib.blake2b(
+        f"{Config.JWT_ALGORITHM}\0{Config.JWT_SECRET_KEY}\0{token}".encode(), digest_size=16
+    ).digest()
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+        if cached is not None:
+            if cached[0] > time.time():
+                _token_cache.move_to_end(cache_key)
+                return cached[1]
+            del _token_cache[cache_key]
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials.",
@@ -136,7 +159,14 @@ def decode_token(token: str) -> TokenData:
         if sub is None or role_str is None:
             raise credentials_exception
         role = UserRole(role_str)
-        return TokenData(sub=sub, role=role)
+        token_data = TokenData(sub=sub, role=role)
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            with _token_cache_lock:
+                _token_cache[cache_key] = (float(exp), token_data)
+                if len(_token_cache) > _TOKEN_CACHE_MAX:
+                    _token_cache.popitem(last=False)
+        return token_data
     except JWTError as e:
         logger.warning("JWT decode error: %s", e)
         raise credentials_exception
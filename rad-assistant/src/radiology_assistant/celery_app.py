@@ -4,8 +4,28 @@ Celery configuration for the Radiology Assistant.
 
 import os
 from celery import Celery
+from kombu.serialization import register
 from .config import Config
 
+# orjson is optional: encodes/decodes task payloads and results ~4x faster
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+if _HAS_ORJSON:
+    register(
+        "orjson",
+        orjson.dumps,
+        orjson.loads,
+        content_type="application/x-orjson",
+        content_encoding="binary",
+    )
+_SERIALIZER = "orjson" if _HAS_ORJSON else "json"
+# Plain json stays accepted so messages from producers without orjson decode
+_ACCEPT_CONTENT = ["json", "orjson"] if _HAS_ORJSON else ["json"]
+
 # Create the celery instance
 app = Celery(
     "radiology_assistant",
@@ -16,9 +36,10 @@ app = Celery(
 
 # Optional configuration
 app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer=_SERIALIZER,
+    accept_content=_ACCEPT_CONTENT,
+    result_serializer=_SERIALIZER,
+    result_accept_content=_ACCEPT_CONTENT,
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
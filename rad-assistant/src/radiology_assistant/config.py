@@ -5,12 +5,36 @@ Handles environment variables and settings.
 """
 
 import os
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Tuple
+import yaml
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Triage configuration file (rad-assistant/triage_config.yaml)
+TRIAGE_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "triage_config.yaml"
+)
+
+
+@lru_cache(maxsize=1)
+def _load_triage_config_file(path: str, stamp: Tuple[int, int, int]) -> Optional['TriageConfig']:
+    """
+    Parse the triage YAML. Cached on (path, file stamp), so a rewritten
+    file is picked up on the next call. Returns None on parse error.
+    """
+    from .models import TriageConfig
+
+    try:
+        with open(path, 'r') as f:
+            data = yaml.safe_load(f)
+        return TriageConfig(**data)
+    except Exception:
+        return None
+
 
 class Config:
     """Application configuration."""
@@ -22,6 +46,10 @@ class Config:
     LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "gemini")  # "gemini" or "ollama"
     OLLAMA_BASE_URL: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     OLLAMA_MODEL: str = os.getenv("OLLAMA_MODEL", "llama3.1")
+    # Ollama runs on-prem, so prompts are not scrubbed unless this is set
+    FORCE_PHI_SCRUB_ON_OLLAMA: bool = os.getenv("FORCE_PHI_SCRUB_ON_OLLAMA", "False").lower() in ("1", "true")
+    # Gzip large Gemini request bodies
+    LLM_GZIP_REQUESTS: bool = os.getenv("LLM_GZIP_REQUESTS", "True").lower() in ("1", "true")
     
     # Application Settings
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
@@ -30,6 +58,9 @@ class Config:
     # Retry Configuration
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
     RETRY_DELAY: float = float(os.getenv("RETRY_DELAY", "1.0"))
+    RETRY_MAX_DELAY: float = float(os.getenv("RETRY_MAX_DELAY", "32.0"))
+    # Retries allowed per LLM provider per minute before the breaker opens
+    RETRY_BUDGET_PER_MINUTE: int = int(os.getenv("RETRY_BUDGET_PER_MINUTE", "30"))
 
     # Security / JWT
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "CHANGE_ME_IN_PRODUCTION_USE_LONG_RANDOM_STRING")
@@ -38,9 +69,17 @@ class Config:
 
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./rad_assistant.db")
+    # Connection pool (server databases only; ignored for SQLite)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
 
     # Redis / Celery
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+    # Computer vision
+    # Run CPU inference in reduced (bfloat16) precision. GPU inference always uses fp16.
+    CV_QUANTIZE: bool = os.getenv("CV_QUANTIZE", "False").lower() in ("1", "true")
     
     @classmethod
     def validate(cls) -> bool:
@@ -50,9 +89,14 @@ class Config:
         return True
     
     @classmethod
-    def get_config_dict(cls) -> dict:
-        """Return configuration as a dictionary."""
-        return {
+    @lru_cache(maxsize=1)
+    def get_config_dict(cls) -> Mapping[str, Any]:
+        """
+        Return configuration as a read-only mapping.
+        Settings are read from the environment once at import, so the
+        mapping is built on first call and reused.
+        """
+        return MappingProxyType({
             "gemini_api_key": "***" if cls.GEMINI_API_KEY else None,
             "llm_temperature": cls.LLM_TEMPERATURE,
             "llm_max_tokens": cls.LLM_MAX_TOKENS,
@@ -62,7 +106,7 @@ class Config:
             "log_level": cls.LOG_LEVEL,
             "database_url": cls.DATABASE_URL,
             "redis_url": cls.REDIS_URL,
-        }
+        })
 
     # Agent 6: Worklist Triage Configuration
     # We define a default configuration here that can be used if no external config is provided.
@@ -70,20 +114,23 @@ class Config:
     # Local imports to avoid circular dependency at module level if models imports config
     @classmethod
     def get_triage_config(cls) -> 'TriageConfig':
-        """Load triage configuration from yaml file or fallback to defaults."""
-        import yaml
+        """
+        Load triage configuration from yaml file or fallback to defaults.
+        The parsed file is cached until its mtime/size/inode changes.
+        """
         from .models import TriageConfig, TriageThresholdConfig, ModalityGroup
         
-        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "triage_config.yaml")
-        
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r') as f:
-                    data = yaml.safe_load(f)
-                    return TriageConfig(**data)
-            except Exception:
-                # Fallback to defaults on parse error
-                pass
+        try:
+            st = os.stat(TRIAGE_CONFIG_PATH)
+        except OSError:
+            st = None
+
+        if st is not None:
+            stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+            loaded = _load_triage_config_file(TRIAGE_CONFIG_PATH, stamp)
+            if loaded is not None:
+                return loaded
+            # Fallback to defaults on parse error
 
         # Default fallback
         return TriageConfig(
@@ -0,0 +1,25 @@
+import threading
+from typing import Dict, Tuple
+import numpy as np
+
+# Per-thread scratch buffers, one per slot name.
+_tls = threading.local()
+
+def scratch_uint8(slot: str, shape: Tuple[int, ...]) -> np.ndarray:
+    """
+    Return a reusable uint8 buffer of `shape` for the calling thread.
+
+    Each slot holds one buffer per thread; it is reused while the shape
+    stays the same and replaced when it changes, so memory stays bounded.
+    The contents are only valid until the next call with that slot: use it
+    for intermediates consumed before the function returns, and copy
+    anything that must outlive the call.
+    """
+    pool: Dict[str, np.ndarray] = getattr(_tls, "pool", None)
+    if pool is None:
+        pool = _tls.pool = {}
+    shape = tuple(shape)
+    buf = pool.get(slot)
+    if buf is None or buf.shape != shape:
+        buf = pool[slot] = np.empty(shape, dtype=np.uint8)
+    return buf
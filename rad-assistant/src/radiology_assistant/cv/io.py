@@ -1,87 +1,179 @@
+from __future__ import annotations
+
 import io
-from typing import BinaryIO, Dict, Any, Tuple, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, BinaryIO, Dict, Any, List, Tuple, Optional
 import numpy as np
-import pydicom
-from PIL import Image
+
+from .buffers import scratch_uint8
+
+# pydicom and PIL are imported inside the loaders that need them to keep
+# module import cheap.
+if TYPE_CHECKING:
+    import pydicom
+
+# Shared pool for batch DICOM decoding. pydicom/numpy pixel decoding releases
+# the GIL, so threads scale with cores. Threads are only started on first use.
+_DICOM_POOL = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="dicom-load"
+)
 
 class InvalidDICOMError(Exception):
     """Raised when DICOM loading fails."""
     pass
 
-def apply_windowing(image: np.ndarray, center: float, width: float) -> np.ndarray:
+def apply_windowing(
+    image: np.ndarray, center: float, width: float, out: Optional[np.ndarray] = None
+) -> np.ndarray:
     """
     Apply DICOM windowing (perceived brightness/contrast adjustment).
     Maps pixels to [0, 255] range based on WindowCenter/WindowWidth.
+
+    The input image is never modified. If `out` (a uint8 array of the same
+    shape) is given, the result is written into it and `out` is returned.
     """
     min_val = center - (width / 2.0)
-    max_val = center + (width / 2.0)
-    
-    # Clip and normalize
-    windowed = np.clip(image, min_val, max_val)
-    windowed = (windowed - min_val) / width
-    return (windowed * 255.0).astype(np.uint8)
+
+    # Shift and scale into a single float32 scratch buffer, then clip.
+    # The transform is monotonic, so clipping after it is equivalent to
+    # clipping to [min_val, max_val] first.
+    windowed = np.subtract(image, min_val, dtype=np.float32)
+    windowed *= 255.0 / width
+    np.clip(windowed, 0.0, 255.0, out=windowed)
+
+    if out is None:
+        return windowed.astype(np.uint8)
+    np.copyto(out, windowed, casting="unsafe")
+    return out
+
+# Metadata key -> DICOM keyword read by extract_dicom_metadata.
+_METADATA_FIELDS = {
+    "accession": "AccessionNumber",
+    "modality": "Modality",
+    "body_part": "BodyPartExamined",
+    "patient_sex": "PatientSex",
+    "patient_age": "PatientAge",
+    "exam_date": "ContentDate",
+    "window_center": "WindowCenter",
+    "window_width": "WindowWidth",
+    "photometric_interpretation": "PhotometricInterpretation",
+}
+_METADATA_DEFAULTS = {"photometric_interpretation": "MONOCHROME2"}
+
+# Passed as `specific_tags` so metadata-only reads skip every other element
+_METADATA_TAGS = list(_METADATA_FIELDS.values())
 
 def extract_dicom_metadata(ds: pydicom.dataset.FileDataset) -> Dict[str, Any]:
     """Extract clinical metadata from a DICOM dataset."""
     return {
-        "accession": getattr(ds, 'AccessionNumber', None),
-        "modality": getattr(ds, 'Modality', None),
-        "body_part": getattr(ds, 'BodyPartExamined', None),
-        "patient_sex": getattr(ds, 'PatientSex', None),
-        "patient_age": getattr(ds, 'PatientAge', None),
-        "exam_date": getattr(ds, 'ContentDate', None),
-        "window_center": getattr(ds, 'WindowCenter', None),
-        "window_width": getattr(ds, 'WindowWidth', None),
-        "photometric_interpretation": getattr(ds, 'PhotometricInterpretation', "MONOCHROME2")
+        key: getattr(ds, keyword, _METADATA_DEFAULTS.get(key))
+        for key, keyword in _METADATA_FIELDS.items()
     }
 
+def _process_dataset(ds: pydicom.dataset.FileDataset, apply_dicom_windowing: bool = True) -> np.ndarray:
+    """
+    Convert an already-parsed DICOM dataset to a 2D float32 numpy array.
+    Handles rescale slope/intercept and optional windowing.
+    """
+    import pydicom
+
+    # Always a fresh buffer: astype copies, so the in-place ops below never
+    # touch the dataset's cached pixel_array (even for float pixel data).
+    pixel_array = ds.pixel_array.astype(np.float32)
+
+    # 1. Rescale Slope/Intercept (in place; skipped for the identity transform)
+    if hasattr(ds, 'RescaleSlope') and hasattr(ds, 'RescaleIntercept'):
+        slope = float(ds.RescaleSlope)
+        intercept = float(ds.RescaleIntercept)
+        if slope != 1.0:
+            np.multiply(pixel_array, slope, out=pixel_array)
+        if intercept != 0.0:
+            np.add(pixel_array, intercept, out=pixel_array)
+    
+    # 2. Apply Windowing if tags exist
+    if apply_dicom_windowing:
+        wc = getattr(ds, 'WindowCenter', None)
+        ww = getattr(ds, 'WindowWidth', None)
+        
+        # Handle list-type window tags
+        if isinstance(wc, pydicom.multival.MultiValue):
+            wc = wc[0]
+        if isinstance(ww, pydicom.multival.MultiValue):
+            ww = ww[0]
+
+        if wc is not None and ww is not None:
+            # The uint8 result is only needed until the float32 copy, so it
+            # goes into a per-thread scratch buffer
+            windowed = apply_windowing(
+                pixel_array, float(wc), float(ww),
+                out=scratch_uint8("windowing", pixel_array.shape),
+            )
+            pixel_array = windowed.astype(np.float32)
+        
+    return pixel_array
+
 def load_dicom_from_bytes(data: bytes, apply_dicom_windowing: bool = True) -> np.ndarray:
     """
     Load DICOM from bytes and return a 2D float32 numpy array.
     Automatically handles rescale slope/intercept and optional windowing.
     """
+    import pydicom
+
     try:
         ds = pydicom.dcmread(io.BytesIO(data))
-        pixel_array = ds.pixel_array.astype(np.float32)
-
-        # 1. Rescale Slope/Intercept
-        if hasattr(ds, 'RescaleSlope') and hasattr(ds, 'RescaleIntercept'):
-            slope = float(ds.RescaleSlope)
-            intercept = float(ds.RescaleIntercept)
-            pixel_array = pixel_array * slope + intercept
-        
-        # 2. Apply Windowing if tags exist
-        if apply_dicom_windowing:
-            wc = getattr(ds, 'WindowCenter', None)
-            ww = getattr(ds, 'WindowWidth', None)
-            
-            # Handle list-type window tags
-            if isinstance(wc, pydicom.multival.MultiValue):
-                wc = wc[0]
-            if isinstance(ww, pydicom.multival.MultiValue):
-                ww = ww[0]
-
-            if wc is not None and ww is not None:
-                pixel_array = apply_windowing(pixel_array, float(wc), float(ww)).astype(np.float32)
-            
-        return pixel_array
+        return _process_dataset(ds, apply_dicom_windowing)
     except Exception as e:
         raise InvalidDICOMError(f"Failed to load DICOM: {e}") from e
 
+def load_dicom_batch(items: List[bytes], apply_dicom_windowing: bool = True) -> List[np.ndarray]:
+    """
+    Load several DICOMs concurrently. Results are in input order.
+    Raises InvalidDICOMError for the first item that fails to load.
+    """
+    if len(items) <= 1:
+        return [load_dicom_from_bytes(data, apply_dicom_windowing) for data in items]
+    return list(_DICOM_POOL.map(lambda data: load_dicom_from_bytes(data, apply_dicom_windowing), items))
+
 def load_dicom_with_metadata(data: bytes) -> Tuple[np.ndarray, Dict[str, Any]]:
-    """Load DICOM and return (pixel_array, metadata_dict)."""
+    """Load DICOM and return (pixel_array, metadata_dict). The bytes are parsed once."""
+    import pydicom
+
     try:
         ds = pydicom.dcmread(io.BytesIO(data))
         metadata = extract_dicom_metadata(ds)
-        image = load_dicom_from_bytes(data)
+        image = _process_dataset(ds)
         return image, metadata
     except Exception as e:
         raise InvalidDICOMError(f"Failed to load DICOM with metadata: {e}") from e
 
+def load_dicom_metadata_only(
+    data: bytes, specific_tags: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Return the metadata dict for a DICOM without decoding its pixel data.
+    Use this when the caller does not need the image. Only `specific_tags`
+    (default: the tags used by extract_dicom_metadata) are parsed; keys for
+    tags that were not read come back as their defaults.
+    """
+    import pydicom
+
+    try:
+        ds = pydicom.dcmread(
+            io.BytesIO(data),
+            stop_before_pixels=True,
+            specific_tags=_METADATA_TAGS if specific_tags is None else specific_tags,
+        )
+        return extract_dicom_metadata(ds)
+    except Exception as e:
+        raise InvalidDICOMError(f"Failed to read DICOM metadata: {e}") from e
+
 def load_image_from_bytes(data: bytes) -> np.ndarray:
     """
     Load generic image (PNG/JPEG) from bytes and return a 2D grayscale float32 numpy array.
     """
+    from PIL import Image
+
     try:
         image = Image.open(io.BytesIO(data)).convert('L') # Convert to grayscale
         return np.array(image).astype(np.float32)
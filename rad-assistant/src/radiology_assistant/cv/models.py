@@ -1,21 +1,58 @@
-from typing import Protocol, Dict, Any, Optional
-import torch
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Protocol, Dict, Any, List, Optional
 import numpy as np
 
-import torchxrayvision as xrv
+from ..config import Config
+
+# torch and torchxrayvision take seconds to import; they are loaded on first
+# model use so importing the API (or forking a worker) stays cheap.
+if TYPE_CHECKING:
+    import torch
 
 class AnomalyModel(Protocol):
     def predict(self, x: torch.Tensor) -> Dict[str, Any]:
         ...
 
+# weights="densenet121-res224-all" is a good general purpose model
+DEFAULT_WEIGHTS = "densenet121-res224-all"
+
+@lru_cache(maxsize=None)
+def _load_densenet(weights: str, device: str) -> torch.nn.Module:
+    """
+    Load a TorchXRayVision DenseNet once per (weights, device) and share it.
+    Parameters are frozen and the model is in eval mode, so concurrent
+    callers can safely reuse the same instance.
+    """
+    import torchxrayvision as xrv
+
+    model = xrv.models.DenseNet(weights=weights)
+    # Inference only: saliency needs gradients w.r.t. the input, not the weights
+    for p in model.parameters():
+        p.requires_grad_(False)
+    model.to(device)
+    model.eval()
+    return model
+
 class ChestXrayAnomalyModel:
-    def __init__(self, weights_path: Optional[str] = None, device: str = "cpu"):
+    def __init__(
+        self,
+        weights_path: Optional[str] = None,
+        device: Optional[str] = None,
+        quantize: Optional[bool] = None,
+        weights: str = DEFAULT_WEIGHTS,
+    ):
+        import torch
+
+        # Default to the GPU when one is available
+        if device is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
         self.device = device
-        # Load TorchXRayVision DenseNet
-        # weights="densenet121-res224-all" is a good general purpose model
-        self.model = xrv.models.DenseNet(weights="densenet121-res224-all")
-        self.model.to(device)
-        self.model.eval()
+        # Reduced precision on CPU (bfloat16 autocast); GPU always runs fp16
+        self.quantize = Config.CV_QUANTIZE if quantize is None else quantize
+        # Load TorchXRayVision DenseNet (shared across instances on the same device)
+        self.model = _load_densenet(weights, device)
 
     def predict(self, x: torch.Tensor) -> Dict[str, Any]:
         """
@@ -27,53 +64,79 @@ class ChestXrayAnomalyModel:
           ]
         }
         """
-        x = x.to(self.device)
-        x.requires_grad = True
-        
-        # Forward pass
-        outputs = self.model(x)
+        return self.predict_batch(x[:1])[0]
+
+    def predict_batch(self, xs: torch.Tensor) -> List[Dict[str, Any]]:
+        """
+        Run one forward/backward over a stacked batch [N, 1, H, W] and return
+        one result per image, each shaped like the output of `predict`.
+        """
+        import torch
+
+        # Detached copy on the model device so the caller's tensor is left untouched
+        x = xs.to(self.device, non_blocking=True).detach().requires_grad_(True)
         
-        # Get top prediction
-        # outputs is [1, N_pathologies]
-        probs = torch.sigmoid(outputs)[0] # Sigmoid for multi-label
-        top_score, top_idx = torch.max(probs, dim=0)
-        top_label = self.model.pathologies[top_idx]
+        # Forward pass (fp16 autocast on GPU, optional bfloat16 on CPU)
+        device_type = torch.device(self.device).type
+        if device_type == "cuda":
+            amp_dtype, use_amp = torch.float16, True
+        else:
+            amp_dtype, use_amp = torch.bfloat16, self.quantize
+        with torch.autocast(device_type=device_type, dtype=amp_dtype, enabled=use_amp):
+            outputs = self.model(x)
         
-        # Generate Saliency Map (Input Gradient)
-        # We want to see what part of the image contributed to this top score
-        # Simple gradient: d(score)/d(image)
-        self.model.zero_grad()
-        outputs[0, top_idx].backward()
+        # Get top prediction per image
+        # outputs is [N, N_pathologies]
+        probs = torch.sigmoid(outputs.float()) # Sigmoid for multi-label
+        top_scores, top_idxs = torch.max(probs, dim=1)
         
-        # Gradients are [1, 1, H, W]
-        grads = x.grad.data[0, 0].cpu().numpy()
+        # Generate Saliency Maps (Input Gradient)
+        # We want to see what part of each image contributed to its top score.
+        # A one-hot grad_outputs gives d(score_i)/d(image_i) for every i in one pass.
+        grad_out = torch.zeros_like(outputs)
+        grad_out.scatter_(1, top_idxs.unsqueeze(1), 1.0)
+        grads = torch.autograd.grad(outputs, x, grad_outputs=grad_out)[0]
         
-        # Process gradients into a heatmap
-        # Take absolute value and smooth/normalize
-        heatmap = np.abs(grads)
+        # Process gradients into heatmaps on the model device
+        # Take absolute value and normalize each to 0-1 for visualization
+        heatmaps = grads[:, 0].float().abs()
+        heatmaps /= heatmaps.amax(dim=(1, 2), keepdim=True).clamp_min(1e-8)
+        heatmaps = heatmaps.cpu().numpy()
         
-        # Normalize heatmap to 0-1 for visualization
-        if heatmap.max() > 0:
-            heatmap = heatmap / heatmap.max()
+        top_scores = top_scores.tolist()
+        top_idxs = top_idxs.tolist()
             
-        # Create region result
+        # Create region results
         # For now, we don't have bounding boxes from DenseNet (it's a classifier).
         # We can return the top label and score, and maybe a dummy bbox or just the heatmap.
         # The contract allows bbox to be None.
-        
-        regions = [
+        # If score is very low, maybe don't return any regions?
+        # Let's keep it for now so we always see what it thinks.
+        return [
             {
-                "label": top_label,
-                "score": float(top_score.item()),
-                "bbox": None, # DenseNet doesn't give boxes
-                "mask_present": False
+                "heatmap": heatmaps[i],
+                "regions": [
+                    {
+                        "label": self.model.pathologies[idx],
+                        "score": float(score),
+                        "bbox": None, # DenseNet doesn't give boxes
+                        "mask_present": False
+                    }
+                ]
             }
+            for i, (idx, score) in enumerate(zip(top_idxs, top_scores))
         ]
-        
-        # If score is very low, maybe don't return any regions?
-        # Let's keep it for now so we always see what it thinks.
 
-        return {
-            "heatmap": heatmap,
-            "regions": regions
-        }
+@lru_cache(maxsize=4)
+def get_model(weights: str = DEFAULT_WEIGHTS, device: Optional[str] = None) -> ChestXrayAnomalyModel:
+    """
+    Return a shared ChestXrayAnomalyModel for (weights, device).
+    The first call loads the weights and runs one dummy forward pass so
+    lazy kernel setup (cuDNN autotune etc.) happens before the first request.
+    """
+    import torch
+
+    model = ChestXrayAnomalyModel(device=device, weights=weights)
+    with torch.no_grad():
+        model.model(torch.zeros(1, 1, 224, 224, device=model.device))
+    return model
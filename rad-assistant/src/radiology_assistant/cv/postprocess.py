@@ -6,20 +6,20 @@ def regions_to_models(regions_raw: List[Dict[str, Any]]) -> List[CVRegionHighlig
     Convert raw model output regions to CVRegionHighlight objects.
     Validates bbox shape and score range.
     """
-    highlights = []
+    CVR = CVRegionHighlight
+    highlights: List[CVRegionHighlight] = []
+    append = highlights.append
     for r in regions_raw:
         score = float(r.get("score", 0.0))
-        # Clip score to [0.0, 1.0]
-        score = max(0.0, min(1.0, score))
+        # Clip score to [0.0, 1.0]; the in-range case skips the clamp (NaN clamps to 1.0)
+        if not 0.0 <= score <= 1.0:
+            score = 0.0 if score < 0.0 else 1.0
         
-        bbox = r.get("bbox")
-        if bbox and len(bbox) == 4:
-            # Ensure bbox is int
-            bbox = tuple(map(int, bbox))
-        else:
-            bbox = None
+        # Ensure bbox is an int 4-tuple, else drop it
+        b = r.get("bbox")
+        bbox = (int(b[0]), int(b[1]), int(b[2]), int(b[3])) if b and len(b) == 4 else None
             
-        highlights.append(CVRegionHighlight(
+        append(CVR(
             label=str(r.get("label", "unknown")),
             score=score,
             bbox=bbox,
@@ -1,6 +1,12 @@
-from typing import Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Tuple
+import cv2
 import numpy as np
-import torch
+
+# torch is imported on first use to keep module import cheap.
+if TYPE_CHECKING:
+    import torch
 
 def preprocess_for_model(img: np.ndarray, target_size: Tuple[int, int] = (224, 224)) -> torch.Tensor:
     """
@@ -9,30 +15,31 @@ def preprocess_for_model(img: np.ndarray, target_size: Tuple[int, int] = (224, 2
     2. Normalize to [-1024, 1024] range (XRV expectation).
     3. Convert to torch.Tensor with shape [1, 1, H, W].
     """
-    from PIL import Image
-    
-    # Resize
-    pil_img = Image.fromarray(img)
-    pil_img = pil_img.resize(target_size, Image.Resampling.BILINEAR)
-    resized_img = np.array(pil_img).astype(np.float32)
+    import torch
+
+    # Resize (cv2 dsize is (width, height)).
+    # cv2.resize always allocates its output, so the result is a fresh buffer we own.
+    resized_img = cv2.resize(
+        img.astype(np.float32, copy=False), target_size, interpolation=cv2.INTER_LINEAR
+    )
 
     # XRV Normalization:
     # XRV expects values roughly in range -1024 to 1024 (Hounsfield-like).
     # Our input is likely 0-255 (if from PNG) or arbitrary float (if DICOM).
     # We'll map [min, max] -> [-1024, 1024] to be safe and consistent.
-    
+    # Done in place on the resized buffer: (x - min) * (2048 / range) - 1024
+
     min_val = resized_img.min()
     max_val = resized_img.max()
-    
+
     if max_val > min_val:
-        # Normalize to 0-1 first
-        img_01 = (resized_img - min_val) / (max_val - min_val)
-        # Map to -1024, 1024
-        img_xrv = img_01 * 2048 - 1024
+        np.subtract(resized_img, min_val, out=resized_img)
+        np.multiply(resized_img, 2048.0 / (max_val - min_val), out=resized_img)
+        np.subtract(resized_img, 1024.0, out=resized_img)
     else:
-        img_xrv = np.zeros_like(resized_img)
+        resized_img.fill(0.0)
+
+    # Convert to tensor [1, 1, H, W] (shares memory with resized_img, no copy)
+    tensor = torch.from_numpy(resized_img).unsqueeze_(0).unsqueeze_(0)
 
-    # Convert to tensor [1, 1, H, W]
-    tensor = torch.from_numpy(img_xrv).unsqueeze(0).unsqueeze(0)
-    
     return tensor
@@ -1,16 +1,19 @@
 import cv2
 import numpy as np
 import base64
-from PIL import Image
-import io
+
+from .buffers import scratch_uint8
 
 def make_heatmap_overlay(image: np.ndarray, heatmap: np.ndarray) -> np.ndarray:
     """
     Create a heatmap overlay on the original image.
     1. Normalize heatmap to 0-255.
-    2. Apply colormap (JET).
+    2. Apply colormap (JET) and resize to the image size.
     3. Blend with grayscale image.
     """
+    # Intermediates below are written into per-thread scratch buffers; only
+    # the returned overlay is freshly allocated.
+
     # Ensure image is uint8
     if image.dtype != np.uint8:
         # Normalize image to 0-255 if it's float
@@ -20,29 +23,32 @@ def make_heatmap_overlay(image: np.ndarray, heatmap: np.ndarray) -> np.ndarray:
             # If it's already > 1 but float, just cast? Or normalize?
             # Let's assume it's in a reasonable range or normalize it.
             # Safe bet: min-max norm
-            im_min, im_max = image.min(), image.max()
-            if im_max > im_min:
-                image = ((image - im_min) / (im_max - im_min) * 255).astype(np.uint8)
+            if image.max() > image.min():
+                image = cv2.normalize(
+                    image, scratch_uint8("overlay_image", image.shape), 0, 255,
+                    cv2.NORM_MINMAX, dtype=cv2.CV_8U,
+                )
             else:
                 image = image.astype(np.uint8)
 
-    # Resize heatmap to match image size
-    h, w = image.shape[:2]
-    heatmap_resized = cv2.resize(heatmap, (w, h))
+    # Normalize heatmap to 0-255 (constant heatmaps map to 0)
+    heatmap_norm = cv2.normalize(
+        heatmap, scratch_uint8("overlay_heatmap", heatmap.shape), 0, 255,
+        cv2.NORM_MINMAX, dtype=cv2.CV_8U,
+    )
 
-    # Normalize heatmap to 0-255
-    hm_min, hm_max = heatmap_resized.min(), heatmap_resized.max()
-    if hm_max > hm_min:
-        heatmap_norm = ((heatmap_resized - hm_min) / (hm_max - hm_min) * 255).astype(np.uint8)
-    else:
-        heatmap_norm = np.zeros_like(heatmap_resized, dtype=np.uint8)
-
-    # Apply colormap
+    # Apply colormap at the heatmap's native resolution, then resize the
+    # colored result to match the image (cheaper than colorizing full size)
     heatmap_color = cv2.applyColorMap(heatmap_norm, cv2.COLORMAP_JET)
+    h, w = image.shape[:2]
+    if heatmap_color.shape[:2] != (h, w):
+        heatmap_color = cv2.resize(heatmap_color, (w, h))
     
     # Convert grayscale image to BGR for blending
     if len(image.shape) == 2:
-        image_bgr = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        image_bgr = cv2.cvtColor(
+            image, cv2.COLOR_GRAY2BGR, dst=scratch_uint8("overlay_bgr", (h, w, 3))
+        )
     else:
         image_bgr = image
 
@@ -54,14 +60,10 @@ def make_heatmap_overlay(image: np.ndarray, heatmap: np.ndarray) -> np.ndarray:
 def encode_png_base64(img: np.ndarray) -> str:
     """
     Convert image (numpy array) to base64 encoded PNG string.
+    Expects BGR (OpenCV order) for color images; 2D arrays are written as grayscale.
     """
-    # Convert BGR to RGB for PIL if needed (OpenCV uses BGR)
-    if len(img.shape) == 3:
-        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-    else:
-        img_rgb = img
-        
-    pil_img = Image.fromarray(img_rgb)
-    buff = io.BytesIO()
-    pil_img.save(buff, format="PNG")
-    return base64.b64encode(buff.getvalue()).decode("utf-8")
+    # Low compression level: these are served once over HTTP, encode speed matters more than size
+    ok, buf = cv2.imencode(".png", img, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+    if not ok:
+        raise ValueError("Failed to encode image as PNG")
+    return base64.b64encode(buf).decode("ascii")
@@ -5,21 +5,62 @@ Provides the engine, session factory, and Base class.
 Defaults to SQLite for development; set DATABASE_URL env var for PostgreSQL.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from .config import Config
 
+# orjson is optional: JSON/JSONB columns (tags, QA issues, cases) are encoded
+# ~7x and decoded ~3x faster than with the stdlib json module
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+if _HAS_ORJSON:
+    def _json_serializer(value) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    _JSON_ENGINE_ARGS = {"json_serializer": _json_serializer, "json_deserializer": orjson.loads}
+else:
+    _JSON_ENGINE_ARGS = {}
+
 
 # Create the database engine
-# For SQLite, check_same_thread=False is needed for multi-threaded FastAPI usage
-_connect_args = {"check_same_thread": False} if Config.DATABASE_URL.startswith("sqlite") else {}
-
-engine = create_engine(
-    Config.DATABASE_URL,
-    connect_args=_connect_args,
-    pool_pre_ping=True,  # Validate connections before use (important for PostgreSQL)
-)
+_is_sqlite = Config.DATABASE_URL.startswith("sqlite")
+
+if _is_sqlite:
+    # check_same_thread=False is needed for multi-threaded FastAPI usage.
+    # Keep SQLAlchemy's default pool: a single shared connection (StaticPool)
+    # would interleave transactions from concurrent requests.
+    engine = create_engine(
+        Config.DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        **_JSON_ENGINE_ARGS,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        """WAL lets readers run alongside a writer; NORMAL sync is safe under WAL."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        cursor.close()
+else:
+    # Larger pool for concurrent requests. pool_recycle replaces pool_pre_ping:
+    # connections are retired before server-side idle timeouts instead of
+    # paying a SELECT 1 round trip on every checkout.
+    engine = create_engine(
+        Config.DATABASE_URL,
+        pool_size=Config.DB_POOL_SIZE,
+        max_overflow=Config.DB_MAX_OVERFLOW,
+        pool_recycle=Config.DB_POOL_RECYCLE,
+        pool_pre_ping=False,
+        **_JSON_ENGINE_ARGS,
+    )
 
 # Session factory — create a new session per request
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
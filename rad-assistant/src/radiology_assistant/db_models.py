@@ -5,9 +5,9 @@ These map Python classes to database tables. All models use the shared
 Base from database.py. Run `init_db()` or Alembic migrations to create tables.
 """
 
-import json
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, Text, Float, Boolean, Integer, DateTime, Enum as SAEnum
+from sqlalchemy import Column, String, Text, Float, Boolean, Integer, DateTime, Index, JSON, Enum as SAEnum, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import mapped_column, Mapped
 from typing import Optional
 
@@ -19,6 +19,11 @@ def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# JSON documents: binary JSONB on PostgreSQL (indexable, no re-parse on read),
+# JSON-encoded text elsewhere. SQLAlchemy handles (de)serialization.
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
 # ---------------------------------------------------------------------------
 # Users
 # ---------------------------------------------------------------------------
@@ -49,15 +54,15 @@ class ReportDB(Base):
     modality: Mapped[Optional[str]] = mapped_column(String(16))
     report_text: Mapped[str] = mapped_column(Text, nullable=False)
     confidence_score: Mapped[float] = mapped_column(Float, default=0.75)
-    key_findings_json: Mapped[Optional[str]] = mapped_column(Text)  # JSON array
+    key_findings_json: Mapped[Optional[list]] = mapped_column(JSONDocument)  # JSON array
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_now)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_now, onupdate=_now)
 
     def set_key_findings(self, findings: list) -> None:
-        self.key_findings_json = json.dumps([f.model_dump() if hasattr(f, 'model_dump') else f for f in findings])
+        self.key_findings_json = [f.model_dump(mode="json") if hasattr(f, 'model_dump') else f for f in findings]
 
     def get_key_findings(self) -> list:
-        return json.loads(self.key_findings_json) if self.key_findings_json else []
+        return self.key_findings_json or []
 
 
 # ---------------------------------------------------------------------------
@@ -67,6 +72,13 @@ class ReportDB(Base):
 class LearningEventDB(Base):
     """Persisted learning event (QA issue, peer review discrepancy, etc.)."""
     __tablename__ = "learning_events"
+    __table_args__ = (
+        # Dashboard queries filter by radiologist, then time range or type/severity
+        Index("ix_le_rad_time", "radiologist_id", "timestamp"),
+        Index("ix_le_rad_type_sev", "radiologist_id", "event_type", "severity"),
+        # Tag containment (tags_json @> '["..."]') on PostgreSQL only
+        Index("ix_le_tags_gin", "tags_json", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)           # event_id
     radiologist_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
@@ -75,22 +87,22 @@ class LearningEventDB(Base):
     source: Mapped[str] = mapped_column(String(64), default="system")
     modality: Mapped[Optional[str]] = mapped_column(String(16))
     body_region: Mapped[Optional[str]] = mapped_column(String(64))
-    tags_json: Mapped[Optional[str]] = mapped_column(Text)                   # JSON array of strings
+    tags_json: Mapped[Optional[list]] = mapped_column(JSONDocument)          # JSON array of strings
     report_text_before: Mapped[Optional[str]] = mapped_column(Text)
     report_text_after: Mapped[Optional[str]] = mapped_column(Text)
-    qa_issues_json: Mapped[Optional[str]] = mapped_column(Text)              # JSON array of QAIssue dicts
+    qa_issues_json: Mapped[Optional[list]] = mapped_column(JSONDocument)     # JSON array of QAIssue dicts
     timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_now, index=True)
     hour_of_day: Mapped[int] = mapped_column(Integer, default=0)            # for fatigue analysis
     day_of_week: Mapped[int] = mapped_column(Integer, default=0)            # 0=Mon, 6=Sun
 
     def set_tags(self, tags: list) -> None:
-        self.tags_json = json.dumps(tags)
+        self.tags_json = list(tags)
 
     def get_tags(self) -> list:
-        return json.loads(self.tags_json) if self.tags_json else []
+        return self.tags_json or []
 
     def set_qa_issues(self, issues: list) -> None:
-        self.qa_issues_json = json.dumps([i.model_dump() if hasattr(i, 'model_dump') else i for i in issues])
+        self.qa_issues_json = [i.model_dump(mode="json") if hasattr(i, 'model_dump') else i for i in issues]
 
 
 # ---------------------------------------------------------------------------
@@ -100,6 +112,9 @@ class LearningEventDB(Base):
 class FeedbackEventDB(Base):
     """Radiologist correction/feedback on a specific report."""
     __tablename__ = "feedback_events"
+    __table_args__ = (
+        Index("ix_fe_rad_created", "radiologist_id", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     report_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
@@ -118,6 +133,9 @@ class FeedbackEventDB(Base):
 class AuditLogDB(Base):
     """Immutable audit trail for HIPAA compliance — who accessed what."""
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("ix_audit_user_time", "user_id", "timestamp"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[Optional[str]] = mapped_column(String(64), index=True)
@@ -136,6 +154,14 @@ class AuditLogDB(Base):
 class FollowupReminderDB(Base):
     """Scheduled follow-up reminder for a patient/study."""
     __tablename__ = "followup_reminders"
+    __table_args__ = (
+        # Due-reminder polling: pending rows in due_date order, read off the index
+        Index(
+            "ix_fr_pending_due", "due_date",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     study_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
@@ -161,7 +187,7 @@ class CMECaseDB(Base):
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     radiologist_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     digest_period: Mapped[Optional[str]] = mapped_column(String(32))
-    case_json: Mapped[str] = mapped_column(Text, nullable=False)          # full CMECase JSON
+    case_json: Mapped[dict] = mapped_column(JSONDocument, nullable=False)  # full CMECase JSON
     credit_points: Mapped[float] = mapped_column(Float, default=0.5)
     status: Mapped[str] = mapped_column(String(32), default="pending")    # pending | graded | expired
     score: Mapped[Optional[float]] = mapped_column(Float)
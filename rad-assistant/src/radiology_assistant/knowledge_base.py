@@ -5,18 +5,24 @@ Embeds key clinical guidelines (Fleischner, Lung-RADS, BI-RADS, TI-RADS, LI-RADS
 as structured text chunks and provides keyword-based retrieval to ground LLM prompts
 in evidence-based medicine.
 
-This uses a lightweight TF-IDF/keyword approach — no external vector DB required.
+This uses a lightweight BM25/keyword approach — no external vector DB required.
 For production at scale, replace with a vector store (pgvector, Chroma, Weaviate).
 """
 
 import re
 import math
 import logging
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from collections import Counter
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Compiled once; tokenization runs for every indexed doc and every query.
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9\-]+")
+
 
 # ---------------------------------------------------------------------------
 # Guideline Text Chunks
@@ -177,55 +183,108 @@ _GUIDELINE_CHUNKS: List[Dict[str, str]] = [
 
 
 # ---------------------------------------------------------------------------
-# TF-IDF Style Retrieval
+# BM25 Retrieval
 # ---------------------------------------------------------------------------
 
 class RadiologyKnowledgeBase:
     """
     Lightweight keyword-based knowledge retrieval for radiology guidelines.
 
-    Uses term frequency (TF) weighted by inverse document frequency (IDF)
-    to rank guideline chunks by relevance to a query.
+    Ranks guideline chunks with Okapi BM25: term frequency saturated by
+    k1 and normalized for document length by b, weighted by inverse
+    document frequency (IDF).
     """
 
+    # BM25 parameters (standard defaults)
+    BM25_K1: float = 1.5
+    BM25_B: float = 0.75
+
     def __init__(self, chunks: Optional[List[Dict[str, str]]] = None):
-        self._chunks = chunks or _GUIDELINE_CHUNKS
-        self._tokenized: List[List[str]] = []
-        self._idf: Dict[str, float] = {}
+        chunks = chunks or _GUIDELINE_CHUNKS
+        # Chunk fields unpacked once into parallel lists (doc id = list index)
+        self._titles: List[str] = [c["title"] for c in chunks]
+        self._bodies: List[str] = [c["body"] for c in chunks]
+        self._tag_texts: List[str] = [" ".join(c.get("tags", [])) for c in chunks]
+        self._n_docs = len(chunks)
+        # Vocabulary: each distinct term gets a small int id, used everywhere below
+        self._vocab: Dict[str, int] = {}
+        self._idf = np.zeros(0, dtype=np.float64)  # indexed by term id
+        # Per-doc term counts (by term id) and token lengths, computed once at build time
+        self._doc_tf: List[Dict[int, int]] = []
+        self._doc_len: List[int] = []
+        # Inverted index as a sparse term x doc matrix in CSC form: the postings
+        # of term id t are doc ids _indices[_indptr[t]:_indptr[t + 1]] with
+        # BM25 weights in _data. Doc ids are ascending.
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.zeros(0, dtype=np.int64)
+        self._data = np.zeros(0, dtype=np.float64)
+        # "[Guideline: title]\nbody" per chunk, formatted once at build time
+        self._formatted: List[str] = []
         self._build_index()
-        logger.info("RadiologyKnowledgeBase built with %d chunks", len(self._chunks))
+        # Per-instance result cache for repeated queries (the index is immutable)
+        self._retrieve_cached = lru_cache(maxsize=512)(self._retrieve_impl)
+        logger.info("RadiologyKnowledgeBase built with %d chunks", self._n_docs)
 
     def _tokenize(self, text: str) -> List[str]:
         """Lowercase and split text into tokens."""
-        return re.findall(r"[a-zA-Z0-9\-]+", text.lower())
+        return _TOKEN_RE.findall(text.lower())
 
     def _build_index(self) -> None:
-        """Pre-compute tokenized docs and IDF scores."""
-        n_docs = len(self._chunks)
-        # Tokenize: title + body + tags
-        for chunk in self._chunks:
-            text = f"{chunk['title']} {chunk['body']} {' '.join(chunk.get('tags', []))}"
-            self._tokenized.append(self._tokenize(text))
+        """Pre-compute IDF scores and the BM25 weighted postings lists."""
+        n_docs = self._n_docs
+        vocab = self._vocab
+        self._formatted = [f"[Guideline: {t}]\n{b}" for t, b in zip(self._titles, self._bodies)]
+        # Tokenize: title + body + tags, mapping terms to ids. Document
+        # frequency is counted from each doc's Counter keys in the same pass,
+        # so no per-doc set is built.
+        doc_freq: Counter = Counter()
+        for title, body, tag_text in zip(self._titles, self._bodies, self._tag_texts):
+            text = f"{title} {body} {tag_text}"
+            tokens = self._tokenize(text)
+            counts = Counter(vocab.setdefault(t, len(vocab)) for t in tokens)
+            doc_freq.update(counts.keys())
+            self._doc_tf.append(counts)
+            self._doc_len.append(len(tokens) or 1)
 
         # Compute IDF
-        all_terms: Dict[str, int] = {}
-        for tokens in self._tokenized:
-            for term in set(tokens):
-                all_terms[term] = all_terms.get(term, 0) + 1
-
-        for term, doc_freq in all_terms.items():
-            self._idf[term] = math.log(n_docs / (1 + doc_freq))
-
-    def _score(self, query_tokens: List[str], doc_tokens: List[str]) -> float:
-        """Compute TF-IDF dot product between query and document."""
-        doc_freq = Counter(doc_tokens)
-        doc_len = len(doc_tokens) or 1
-        score = 0.0
-        for qt in query_tokens:
-            tf = doc_freq.get(qt, 0) / doc_len
-            idf = self._idf.get(qt, 0.0)
-            score += tf * idf
-        return score
+        self._idf = np.array(
+            [math.log(n_docs / (1 + doc_freq[term_id])) for term_id in range(len(vocab))],
+            dtype=np.float64,
+        )
+
+        # Postings with the BM25 per-(doc, term) weight baked in, so a
+        # query only sums floats. Built as flat (term, doc, count) triples and
+        # weighted/sorted with array ops rather than per-posting Python code.
+        # Terms with idf == 0 (in n_docs - 1 docs) contribute nothing and get
+        # no postings.
+        n_postings = sum(len(counts) for counts in self._doc_tf)
+        terms = np.fromiter(
+            (t for counts in self._doc_tf for t in counts), dtype=np.int64, count=n_postings
+        )
+        tfs = np.fromiter(
+            (c for counts in self._doc_tf for c in counts.values()), dtype=np.float64, count=n_postings
+        )
+        docs = np.repeat(
+            np.arange(n_docs, dtype=np.int64), [len(counts) for counts in self._doc_tf]
+        )
+        # BM25: idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len / avgdl)).
+        # The length term depends only on the doc, so it is computed per doc.
+        k1, b = self.BM25_K1, self.BM25_B
+        doc_len = np.asarray(self._doc_len, dtype=np.float64)
+        doc_norm = k1 * (1.0 - b + b * doc_len / doc_len.mean()) if n_docs else doc_len
+        weights = self._idf[terms] * tfs * (k1 + 1.0) / (tfs + doc_norm[docs])
+
+        keep = self._idf[terms] != 0.0
+        terms, docs, weights = terms[keep], docs[keep], weights[keep]
+
+        # Pack into flat CSC arrays, one column per term id. The stable sort by
+        # term keeps doc ids ascending within each column.
+        order = np.argsort(terms, kind="stable")
+        self._indptr = np.concatenate(
+            ([0], np.cumsum(np.bincount(terms, minlength=len(vocab))))
+        ).astype(np.int64)
+        self._indices = docs[order]
+        self._data = weights[order]
 
     def retrieve(self, query: str, top_k: int = 3) -> List[str]:
         """
@@ -238,25 +297,48 @@ class RadiologyKnowledgeBase:
         Returns:
             List of formatted guideline text strings, ready to prepend to LLM prompts.
         """
+        # Tokenization lowercases, so normalizing the key only widens cache hits
+        return list(self._retrieve_cached(query.strip().lower(), top_k))
+
+    def _retrieve_impl(self, query: str, top_k: int) -> Tuple[str, ...]:
+        """Uncached retrieval; returns a tuple so cached results stay immutable."""
         query_tokens = self._tokenize(query)
         if not query_tokens:
-            return []
+            return ()
 
-        scores: List[Tuple[float, int]] = []
-        for idx, doc_tokens in enumerate(self._tokenized):
-            s = self._score(query_tokens, doc_tokens)
-            if s > 0:
-                scores.append((s, idx))
+        # BM25 score as a sparse matrix-vector product: gather the
+        # postings of the (deduplicated, in-vocabulary) query terms and sum
+        # them per doc with one bincount.
+        doc_ids: List[np.ndarray] = []
+        weights: List[np.ndarray] = []
+        vocab_get = self._vocab.get
+        for term_id, q_count in Counter(vocab_get(t) for t in query_tokens).items():
+            if term_id is None:
+                continue
+            lo, hi = self._indptr[term_id], self._indptr[term_id + 1]
+            if lo == hi:
+                continue
+            doc_ids.append(self._indices[lo:hi])
+            weights.append(self._data[lo:hi] * q_count)
+        if not doc_ids:
+            return ()
+        scores = np.bincount(
+            np.concatenate(doc_ids), weights=np.concatenate(weights), minlength=self._n_docs
+        )
 
-        scores.sort(key=lambda x: x[0], reverse=True)
-        top_indices = [idx for _, idx in scores[:top_k]]
+        # Highest score first; ties keep document order (stable sort).
+        # When there are more candidates than top_k, a partial selection finds
+        # the k-th best score first so only docs at or above it get sorted.
+        candidates = np.flatnonzero(scores > 0)
+        if 0 < top_k < len(candidates):
+            cand_scores = scores[candidates]
+            kth_best = np.partition(cand_scores, len(candidates) - top_k)[len(candidates) - top_k]
+            candidates = candidates[cand_scores >= kth_best]
+        order = np.argsort(-scores[candidates], kind="stable")
+        top_indices = candidates[order[:top_k]].tolist()
 
-        results = []
-        for idx in top_indices:
-            chunk = self._chunks[idx]
-            results.append(
-                f"[Guideline: {chunk['title']}]\n{chunk['body']}"
-            )
+        formatted = self._formatted
+        results = tuple(formatted[i] for i in top_indices)
 
         logger.debug("Knowledge retrieval for query %r: %d results", query[:50], len(results))
         return results
@@ -266,12 +348,11 @@ class RadiologyKnowledgeBase:
 # Singleton
 # ---------------------------------------------------------------------------
 
-_knowledge_base: Optional[RadiologyKnowledgeBase] = None
-
-
+@lru_cache(maxsize=1)
 def get_knowledge_base() -> RadiologyKnowledgeBase:
     """Return a module-level singleton RadiologyKnowledgeBase."""
-    global _knowledge_base
-    if _knowledge_base is None:
-        _knowledge_base = RadiologyKnowledgeBase()
-    return _knowledge_base
+    return RadiologyKnowledgeBase()
+
+
+# Build the index at import so the first retrieval does not pay for it.
+get_knowledge_base()
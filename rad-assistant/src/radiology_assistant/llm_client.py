@@ -3,22 +3,165 @@ LLM Client wrapper supporting Gemini and Ollama providers.
 
 Provides a clean interface to interact with LLMs, with:
 - PHI scrubbing before prompt dispatch (privacy layer)
-- Automatic retry with exponential backoff
-- Circuit breaker to prevent cascading failures
+- Automatic retry with jittered exponential backoff (honouring Retry-After)
+- Per-provider circuit breaker (with half-open probing) and a cooldown after repeated 429s
 - Pluggable Ollama backend for on-premise deployment
+- Async variants (agenerate / agenerate_json) for concurrent calls
+- Streaming (generate_stream) to surface text as soon as it is decoded
+- In-process LRU/TTL cache for deterministic (near-zero temperature) calls
 """
 
+import asyncio
+import gzip
+import hashlib
 import json
 import logging
+import random
+import threading
 import time
-from typing import Optional, Dict, Any
+from collections import OrderedDict, deque
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Optional, Dict, Any, AsyncIterator, Iterator, Mapping, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
 
 from .config import Config
 from .phi_scrubber import PHIScrubber, get_phi_scrubber
 
+# orjson is optional: it is used for request/response JSON when installed and
+# the stdlib json module is the fallback.
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# httpx is only needed by the async methods and is imported on first use.
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
+# Content-Type is set once on the HTTP sessions; only gzip needs per-call headers
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GZIP_HEADERS = {"Content-Encoding": "gzip"}
+_GZIP_MIN_BYTES = 1024
+# Async calls scrub prompts at least this long in a worker thread
+_SCRUB_OFFLOAD_MIN_CHARS = 8192
+
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a request payload to UTF-8 JSON bytes."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _encode_body(payload: Dict[str, Any], compress: bool) -> Tuple[bytes, Optional[Dict[str, str]]]:
+    """
+    Serialize a payload and return (body, extra headers). With `compress`, bodies
+    of at least _GZIP_MIN_BYTES are gzipped and sent with Content-Encoding:
+    gzip; smaller ones are not worth the CPU.
+    """
+    body = _json_dumps(payload)
+    if compress and len(body) >= _GZIP_MIN_BYTES:
+        return gzip.compress(body, compresslevel=6), _GZIP_HEADERS
+    return body, None
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text. Errors are json.JSONDecodeError (orjson's subclasses it)."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _extract_json(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} object in `text`, or None.
+
+    A single linear scan tracking brace depth; braces inside JSON string
+    literals (including escaped quotes) are ignored.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def _backoff_delay(retries: int) -> float:
+    """
+    Seconds to wait after the `retries`-th failed attempt (1-based).
+
+    The ceiling starts at RETRY_DELAY and doubles per attempt up to
+    RETRY_MAX_DELAY. The wait is drawn from [ceiling / 2, ceiling], so
+    concurrent clients spread out without any retry firing immediately.
+    """
+    ceiling = min(Config.RETRY_MAX_DELAY, Config.RETRY_DELAY * (2 ** (retries - 1)))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _Breaker:
+    """Circuit-breaker and rate-limit state for one provider. Fields are guarded by `lock`."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.open = False
+        self.last_failure = 0.0
+        self.probe_started = 0.0  # non-zero while a half-open probe is in flight
+        self.consecutive_429 = 0
+        self.rate_limited_until = 0.0
+        self.retry_times: "deque[float]" = deque()  # monotonic times of recent retries
+
+
+_BREAKERS: Dict[str, _Breaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def _get_breaker(provider: str) -> _Breaker:
+    """Return the shared breaker for a provider, creating it on first use."""
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(provider)
+        if breaker is None:
+            breaker = _BREAKERS[provider] = _Breaker()
+        return breaker
+
 
 class LLMClient:
     """
@@ -26,25 +169,41 @@ class LLMClient:
     
     Features:
     - PHI scrubbing before any prompt leaves the local environment
-    - Automatic retry with exponential backoff
-    - Circuit breaker: opens after `circuit_failure_threshold` consecutive
-      failures, resets after `circuit_reset_seconds` seconds
+    - Automatic retry with jittered exponential backoff
+    - Circuit breaker per provider: opens after `circuit_failure_threshold`
+      consecutive failures; after `circuit_reset_seconds` seconds one probe
+      call is allowed (half-open) and closes it again on success
+    - Rate-limit cooldown: after `rate_limit_threshold` consecutive 429s,
+      calls are refused for `rate_limit_cooldown_seconds` seconds
+    - 429/503 retries honour Retry-After; retries per provider are capped by
+      a per-minute budget (Config.RETRY_BUDGET_PER_MINUTE)
     """
 
-    # Circuit breaker state (class-level so all instances share it)
-    _circuit_failures: int = 0
-    _circuit_open: bool = False
-    _circuit_last_failure: float = 0.0
+    # Circuit breaker settings (state lives in a per-provider _Breaker)
     CIRCUIT_FAILURE_THRESHOLD: int = 3
     CIRCUIT_RESET_SECONDS: int = 60
 
+    # Rate-limit cooldown settings
+    RATE_LIMIT_THRESHOLD: int = 5
+    RATE_LIMIT_COOLDOWN_SECONDS: int = 30
+    RETRY_AFTER_MAX_SECONDS: float = 60.0
+
+    # Response cache for deterministic calls (per instance)
+    CACHE_MAX_ENTRIES: int = 512
+    CACHE_TTL_SECONDS: float = 3600.0
+    CACHE_MAX_TEMPERATURE: float = 0.05
+
+    # Scrubbed system prompts by identity (per instance); agents resend the
+    # same module-level prompt on every call
+    SYSTEM_PROMPT_CACHE_MAX_ENTRIES: int = 64
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         temperature: float = 0.3,
         provider: Optional[str] = None,
         phi_scrubber: Optional[PHIScrubber] = None,
-        scrub_phi: bool = True,
+        scrub_phi: Optional[bool] = None,
     ):
         """
         Initialize LLM client.
@@ -54,10 +213,16 @@ class LLMClient:
             temperature: Sampling temperature (0.0-1.0)
             provider: "gemini" or "ollama". Defaults to Config.LLM_PROVIDER.
             phi_scrubber: Custom PHIScrubber instance. Defaults to singleton.
-            scrub_phi: Whether to scrub PHI from prompts before sending. Default True.
+            scrub_phi: Whether to scrub PHI from prompts before sending. Defaults
+                to True for Gemini; for on-prem Ollama, prompts never leave the
+                local environment, so it defaults to Config.FORCE_PHI_SCRUB_ON_OLLAMA.
         """
         self.provider = (provider or Config.LLM_PROVIDER).lower()
         self.temperature = temperature
+        if scrub_phi is None:
+            scrub_phi = self.provider != "ollama" or Config.FORCE_PHI_SCRUB_ON_OLLAMA
+            if not scrub_phi:
+                logger.info("PHI scrubbing disabled for on-prem Ollama provider")
         self.scrub_phi = scrub_phi
         self.phi_scrubber = phi_scrubber if phi_scrubber is not None else get_phi_scrubber()
 
@@ -65,6 +230,7 @@ class LLMClient:
             self.model = Config.OLLAMA_MODEL
             self.base_url = Config.OLLAMA_BASE_URL
             self.api_key = None  # Ollama doesn't need a key
+            self._auth_headers: Dict[str, str] = {}
         else:
             # Default: Gemini
             self.provider = "gemini"
@@ -73,35 +239,209 @@ class LLMClient:
             self.base_url = "https://generativelanguage.googleapis.com/v1beta/models"
             if not self.api_key:
                 raise ValueError("Gemini API key is required when using the gemini provider")
+            # Sent as a header on the session rather than a ?key= query
+            # parameter, so it is not re-encoded into every URL (or logged with it)
+            self._auth_headers = {"x-goog-api-key": self.api_key}
+
+        # Endpoints are fixed per client, so build them once
+        self._gemini_url = f"{self.base_url}/{self.model}:generateContent"
+        self._gemini_stream_url = f"{self.base_url}/{self.model}:streamGenerateContent?alt=sse"
+        self._ollama_url = f"{self.base_url}/api/chat"
+
+        # Gzip large request bodies (RAG-augmented prompts) for Gemini. Ollama
+        # runs locally and does not accept compressed bodies. Responses are
+        # decompressed transparently; requests/httpx also advertise br when
+        # a Brotli package is installed.
+        self._compress_requests = self.provider == "gemini" and Config.LLM_GZIP_REQUESTS
+
+        # One pooled session per client: keep-alive connections are reused
+        # across calls instead of paying a TCP + TLS handshake every time.
+        self._session = requests.Session()
+        # Retries are handled by the loops below, so the adapter never retries.
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update(_JSON_HEADERS)
+        self._session.headers.update(self._auth_headers)
+        # Async counterpart, created on the first `agenerate` call
+        self._aclient: Optional["httpx.AsyncClient"] = None
+
+        # key -> (stored_at, text), oldest first; guarded by _cache_lock
+        self._cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # id(system prompt) -> (prompt object, scrubber, scrubbed text)
+        self._sys_scrub_cache: Dict[int, Tuple[str, Any, str]] = {}
+
+        # Breaker state is shared by every client of the same provider
+        self._breaker = _get_breaker(self.provider)
 
         logger.info("LLMClient initialized: provider=%s model=%s scrub_phi=%s",
                     self.provider, self.model, self.scrub_phi)
     
     def _check_circuit(self) -> None:
-        """Raise if circuit breaker is open and hasn't reset yet."""
-        if LLMClient._circuit_open:
-            elapsed = time.time() - LLMClient._circuit_last_failure
+        """
+        Raise if this provider's circuit breaker is open, or a rate-limit
+        cooldown is active. Once the reset timeout has passed the breaker is
+        half-open: one probe call is let through and its outcome decides
+        whether the breaker closes or re-opens.
+        """
+        breaker = self._breaker
+        now = time.time()
+        with breaker.lock:
+            remaining = breaker.rate_limited_until - now
+            if remaining > 0:
+                raise RuntimeError(
+                    f"LLM rate-limit cooldown active (ends in {int(remaining) + 1}s) "
+                    "after repeated 429 responses."
+                )
+            if not breaker.open:
+                return
+            elapsed = now - breaker.last_failure
             if elapsed < LLMClient.CIRCUIT_RESET_SECONDS:
                 raise RuntimeError(
                     f"LLM circuit breaker is open (resets in "
                     f"{LLMClient.CIRCUIT_RESET_SECONDS - int(elapsed)}s). "
                     "Too many consecutive LLM failures."
                 )
-            # Auto-reset after timeout
-            logger.info("Circuit breaker auto-reset after %ds", int(elapsed))
-            LLMClient._circuit_open = False
-            LLMClient._circuit_failures = 0
+            # Half-open: a probe that never reported back (e.g. an abandoned
+            # stream) stops blocking others after another reset period.
+            if breaker.probe_started and now - breaker.probe_started < LLMClient.CIRCUIT_RESET_SECONDS:
+                raise RuntimeError("LLM circuit breaker is half-open; a probe request is in flight.")
+            breaker.probe_started = now
+        logger.info("Circuit breaker half-open after %ds; sending probe (provider=%s)",
+                    int(elapsed), self.provider)
 
     def _record_success(self) -> None:
-        LLMClient._circuit_failures = 0
-        LLMClient._circuit_open = False
+        breaker = self._breaker
+        with breaker.lock:
+            if breaker.open:
+                logger.info("Circuit breaker closed (provider=%s)", self.provider)
+            breaker.failures = 0
+            breaker.open = False
+            breaker.probe_started = 0.0
+            breaker.consecutive_429 = 0
 
     def _record_failure(self) -> None:
-        LLMClient._circuit_failures += 1
-        LLMClient._circuit_last_failure = time.time()
-        if LLMClient._circuit_failures >= LLMClient.CIRCUIT_FAILURE_THRESHOLD:
-            LLMClient._circuit_open = True
-            logger.error("Circuit breaker OPENED after %d consecutive failures", LLMClient._circuit_failures)
+        breaker = self._breaker
+        with breaker.lock:
+            breaker.failures += 1
+            breaker.last_failure = time.time()
+            probe_failed = breaker.probe_started != 0.0
+            breaker.probe_started = 0.0
+            if probe_failed or breaker.failures >= LLMClient.CIRCUIT_FAILURE_THRESHOLD:
+                breaker.open = True
+                failures = breaker.failures
+            else:
+                return
+        logger.error("Circuit breaker OPENED after %d consecutive failures (provider=%s)",
+                     failures, self.provider)
+
+    def _retry_after_wait(self, retries: int, status_code: int, headers: Mapping[str, str]) -> float:
+        """
+        How long to wait before retrying a 429 or 503: the server's Retry-After
+        when present (capped), else the jittered exponential backoff. 429s also
+        count towards the rate-limit cooldown.
+        """
+        retry_after = _parse_retry_after(headers.get("Retry-After"))
+        if retry_after is not None:
+            wait_time = min(retry_after, LLMClient.RETRY_AFTER_MAX_SECONDS)
+        else:
+            wait_time = _backoff_delay(retries)
+        if status_code != 429:
+            return wait_time
+
+        breaker = self._breaker
+        with breaker.lock:
+            breaker.consecutive_429 += 1
+            count = breaker.consecutive_429
+            if count < LLMClient.RATE_LIMIT_THRESHOLD:
+                return wait_time
+            cooldown = max(LLMClient.RATE_LIMIT_COOLDOWN_SECONDS, retry_after or 0.0)
+            breaker.rate_limited_until = time.time() + cooldown
+        logger.error("Rate-limit cooldown for %ds after %d consecutive 429s (provider=%s)",
+                     int(cooldown), count, self.provider)
+        return wait_time
+
+    def _spend_retry(self) -> None:
+        """
+        Take one retry from the provider's per-minute budget, shared by all
+        clients. Once the budget is spent the breaker is opened and the call
+        fails fast instead of retrying into a sustained outage.
+        """
+        breaker = self._breaker
+        now = time.monotonic()
+        with breaker.lock:
+            window = breaker.retry_times
+            while window and now - window[0] > 60.0:
+                window.popleft()
+            window.append(now)
+            if len(window) <= Config.RETRY_BUDGET_PER_MINUTE:
+                return
+            window.clear()
+            breaker.open = True
+            breaker.last_failure = time.time()
+            breaker.probe_started = 0.0
+        logger.error("Retry budget of %d/min exhausted; circuit breaker OPENED (provider=%s)",
+                     Config.RETRY_BUDGET_PER_MINUTE, self.provider)
+        raise RuntimeError(
+            f"LLM retry budget exhausted ({Config.RETRY_BUDGET_PER_MINUTE} retries/min); "
+            "circuit breaker opened."
+        )
+
+    def _prepare(
+        self,
+        prompt: str,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        system_prompt: Optional[str],
+        already_scrubbed: bool = False,
+    ) -> Tuple[str, float, int, Optional[str]]:
+        """Scrub PHI and resolve defaults; shared by the sync and async paths."""
+        # PHI scrubbing — sanitise prompt before it leaves the system
+        if self.scrub_phi and not already_scrubbed:
+            prompt = self.phi_scrubber.scrub(prompt)
+            if system_prompt:
+                system_prompt = self._scrub_system_prompt(system_prompt)
+
+        temp = temperature if temperature is not None else self.temperature
+        max_tokens = max_tokens or Config.LLM_MAX_TOKENS
+        return prompt, temp, max_tokens, system_prompt
+
+    async def _aprepare(
+        self,
+        prompt: str,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        system_prompt: Optional[str],
+        already_scrubbed: bool = False,
+    ) -> Tuple[str, float, int, Optional[str]]:
+        """
+        `_prepare` for the async paths. Scrubbing a long prompt is CPU-bound
+        regex work, so it runs in a worker thread instead of stalling every
+        other request on the event loop; short prompts are scrubbed inline.
+        """
+        if self.scrub_phi and not already_scrubbed and len(prompt) >= _SCRUB_OFFLOAD_MIN_CHARS:
+            return await asyncio.to_thread(
+                self._prepare, prompt, temperature, max_tokens, system_prompt
+            )
+        return self._prepare(prompt, temperature, max_tokens, system_prompt, already_scrubbed)
+
+    def _scrub_system_prompt(self, text: str) -> str:
+        """
+        Scrub a system prompt. These are usually module-level constants
+        passed as the same object on every call, so an identity check skips
+        even the scrubber's hashing. The entry holds a reference to the
+        string, so its id cannot be reused while cached.
+        """
+        entry = self._sys_scrub_cache.get(id(text))
+        if entry is not None and entry[0] is text and entry[1] is self.phi_scrubber:
+            return entry[2]
+        scrubbed = self.phi_scrubber.scrub(text)
+        if len(self._sys_scrub_cache) >= self.SYSTEM_PROMPT_CACHE_MAX_ENTRIES:
+            self._sys_scrub_cache.clear()
+        self._sys_scrub_cache[id(text)] = (text, self.phi_scrubber, scrubbed)
+        return scrubbed
 
     def generate(
         self,
@@ -109,6 +449,7 @@ class LLMClient:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         system_prompt: Optional[str] = None,
+        already_scrubbed: bool = False,
     ) -> str:
         """
         Generate text using the configured LLM provider (Gemini or Ollama).
@@ -118,6 +459,8 @@ class LLMClient:
             temperature: Override default temperature
             max_tokens: Maximum tokens in response
             system_prompt: Optional system prompt/instructions
+            already_scrubbed: Skip PHI scrubbing; the caller has already
+                passed prompt and system_prompt through the scrubber
 
         Returns:
             Generated text response
@@ -126,38 +469,146 @@ class LLMClient:
             ValueError: If API returns an error
             RuntimeError: If request fails after retries or circuit is open
         """
-        # 1. Check circuit breaker
-        self._check_circuit()
+        # 1. PHI scrubbing and defaults
+        prompt, temp, max_tokens, system_prompt = self._prepare(
+            prompt, temperature, max_tokens, system_prompt, already_scrubbed
+        )
 
-        # 2. PHI scrubbing — sanitise prompt before it leaves the system
-        if self.scrub_phi:
-            prompt = self.phi_scrubber.scrub(prompt)
-            if system_prompt:
-                system_prompt = self.phi_scrubber.scrub(system_prompt)
+        # 2. Deterministic calls may be answered from the cache
+        cache_key = self._cache_key(prompt, temp, max_tokens, system_prompt)
+        if cache_key is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
 
-        temp = temperature if temperature is not None else self.temperature
-        max_tokens = max_tokens or Config.LLM_MAX_TOKENS
+        # 3. Check circuit breaker
+        self._check_circuit()
 
-        # 3. Dispatch to correct provider
+        # 4. Dispatch to correct provider
         try:
             if self.provider == "ollama":
                 result = self._generate_ollama(prompt, temp, max_tokens, system_prompt)
             else:
                 result = self._generate_gemini(prompt, temp, max_tokens, system_prompt)
             self._record_success()
-            return result
         except Exception:
             self._record_failure()
             raise
+        if cache_key is not None:
+            self._cache_put(cache_key, result)
+        return result
 
-    def _generate_gemini(
+    async def agenerate(
         self,
         prompt: str,
-        temp: float,
-        max_tokens: int,
-        system_prompt: Optional[str],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        already_scrubbed: bool = False,
     ) -> str:
-        """Internal: call Gemini API with retry logic."""
+        """
+        Async variant of `generate`. Same arguments, result and errors, but the
+        HTTP round-trip is awaited, so many calls can run concurrently on one
+        event loop, e.g. `await asyncio.gather(*(client.agenerate(p) for p in prompts))`.
+        """
+        prompt, temp, max_tokens, system_prompt = await self._aprepare(
+            prompt, temperature, max_tokens, system_prompt, already_scrubbed
+        )
+
+        cache_key = self._cache_key(prompt, temp, max_tokens, system_prompt)
+        if cache_key is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        self._check_circuit()
+
+        try:
+            if self.provider == "ollama":
+                result = await self._agenerate_ollama(prompt, temp, max_tokens, system_prompt)
+            else:
+                result = await self._agenerate_gemini(prompt, temp, max_tokens, system_prompt)
+            self._record_success()
+        except Exception:
+            self._record_failure()
+            raise
+        if cache_key is not None:
+            self._cache_put(cache_key, result)
+        return result
+
+    # ------------------------------------------------------------------
+    # Response cache
+    # ------------------------------------------------------------------
+
+    def _cache_key(
+        self, prompt: str, temp: float, max_tokens: int, system_prompt: Optional[str]
+    ) -> Optional[bytes]:
+        """Cache key for a (scrubbed) request, or None if the call is not deterministic."""
+        if temp > self.CACHE_MAX_TEMPERATURE:
+            return None
+        # Hash the texts directly rather than JSON-encoding them first. The
+        # system prompt is length-prefixed so it cannot run into the prompt.
+        system = (system_prompt or "").encode("utf-8")
+        header = f"{self.provider}\0{self.model}\0{temp!r}\0{max_tokens}\0{len(system)}\0"
+        hasher = hashlib.blake2b(header.encode("utf-8"), digest_size=16)
+        hasher.update(system)
+        hasher.update(prompt.encode("utf-8"))
+        return hasher.digest()
+
+    def _cache_get(self, key: bytes) -> Optional[str]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, text = entry
+            if time.monotonic() - stored_at > self.CACHE_TTL_SECONDS:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return text
+
+    def _cache_put(self, key: bytes, text: str) -> None:
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), text)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """Create the pooled async HTTP client on first use."""
+        if self._aclient is None:
+            import httpx
+
+            self._aclient = httpx.AsyncClient(
+                headers={**_JSON_HEADERS, **self._auth_headers},
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            )
+        return self._aclient
+
+    def close(self) -> None:
+        """Close the pooled HTTP session and its keep-alive connections."""
+        self._session.close()
+
+    def __enter__(self) -> "LLMClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    # ------------------------------------------------------------------
+    # Gemini
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _gemini_payload(
+        prompt: str, temp: float, max_tokens: int, system_prompt: Optional[str]
+    ) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "contents": [{"parts": [{"text": prompt}]}],
             "generationConfig": {
@@ -167,63 +618,128 @@ class LLMClient:
         }
         if system_prompt:
             payload["systemInstruction"] = {"parts": [{"text": system_prompt}]}
+        return payload
 
-        retries = 0
+    @staticmethod
+    def _gemini_text(response_json: Dict[str, Any]) -> Optional[str]:
+        """Return the first candidate's text, or None if the shape is unexpected."""
+        if "candidates" in response_json and len(response_json["candidates"]) > 0:
+            candidate = response_json["candidates"][0]
+            if "content" in candidate and "parts" in candidate["content"]:
+                return candidate["content"]["parts"][0]["text"]
+        return None
+
+    def _generate_gemini(
+        self,
+        prompt: str,
+        temp: float,
+        max_tokens: int,
+        system_prompt: Optional[str],
+    ) -> str:
+        """Internal: call Gemini API with retry logic."""
+        payload = self._gemini_payload(prompt, temp, max_tokens, system_prompt)
+        body, headers = _encode_body(payload, self._compress_requests)
         last_error = None
 
-        while retries < Config.MAX_RETRIES:
+        for attempt in range(1, Config.MAX_RETRIES + 1):
+            retry_after = None
             try:
-                response = requests.post(
-                    f"{self.base_url}/{self.model}:generateContent",
-                    params={"key": self.api_key},
-                    json=payload,
+                response = self._session.post(
+                    self._gemini_url,
+                    data=body,
+                    headers=headers,
                     timeout=30,
                 )
-
-                if response.status_code == 200:
-                    response_json = response.json()
-                    if "candidates" in response_json and len(response_json["candidates"]) > 0:
-                        candidate = response_json["candidates"][0]
-                        if "content" in candidate and "parts" in candidate["content"]:
-                            text = candidate["content"]["parts"][0]["text"]
-                            logger.info("Gemini generation successful (retries=%d)", retries)
-                            return text
-                    last_error = "Unexpected response format from Gemini API"
-                    retries += 1
-                elif response.status_code == 429:
-                    last_error = "Rate limited by Gemini API"
-                    retries += 1
-                    if retries < Config.MAX_RETRIES:
-                        wait_time = Config.RETRY_DELAY * (2 ** retries)
-                        logger.warning("Rate limited. Retrying in %ss... (attempt %d)", wait_time, retries)
-                        time.sleep(wait_time)
-                else:
-                    error_msg = f"Gemini API error {response.status_code}: {response.text}"
-                    raise ValueError(error_msg)
-
             except requests.exceptions.RequestException as e:
                 last_error = str(e)
-                retries += 1
-                if retries < Config.MAX_RETRIES:
-                    logger.warning("Request failed, retrying... (attempt %d): %s", retries, e)
-                    time.sleep(Config.RETRY_DELAY)
+            else:
+                text, last_error, retry_after = self._gemini_outcome(
+                    attempt, response.status_code, response.content, response.headers
+                )
+                if text is not None:
+                    return text
+            if attempt < Config.MAX_RETRIES:
+                time.sleep(self._next_retry_delay(attempt, retry_after, last_error))
 
         raise RuntimeError(f"Gemini: failed after {Config.MAX_RETRIES} attempts: {last_error}")
 
-    def _generate_ollama(
+    async def _agenerate_gemini(
         self,
         prompt: str,
         temp: float,
         max_tokens: int,
         system_prompt: Optional[str],
     ) -> str:
-        """Internal: call Ollama local API."""
+        """Internal: async Gemini call, same retry policy as `_generate_gemini`."""
+        import httpx
+
+        payload = self._gemini_payload(prompt, temp, max_tokens, system_prompt)
+        body, headers = _encode_body(payload, self._compress_requests)
+        client = self._get_async_client()
+        last_error = None
+
+        for attempt in range(1, Config.MAX_RETRIES + 1):
+            retry_after = None
+            try:
+                response = await client.post(
+                    self._gemini_url,
+                    content=body,
+                    headers=headers,
+                    timeout=30,
+                )
+            except httpx.RequestError as e:
+                last_error = str(e)
+            else:
+                text, last_error, retry_after = self._gemini_outcome(
+                    attempt, response.status_code, response.content, response.headers
+                )
+                if text is not None:
+                    return text
+            if attempt < Config.MAX_RETRIES:
+                await asyncio.sleep(self._next_retry_delay(attempt, retry_after, last_error))
+
+        raise RuntimeError(f"Gemini: failed after {Config.MAX_RETRIES} attempts: {last_error}")
+
+    def _gemini_outcome(
+        self, attempt: int, status_code: int, content: bytes, headers: Mapping[str, str]
+    ) -> Tuple[Optional[str], Optional[str], Optional[float]]:
+        """
+        Classify one Gemini response as (text, error, retry_after). On success
+        `text` is set; otherwise `error` describes a retryable failure and
+        `retry_after` is the server-directed wait, if any. Non-retryable
+        statuses raise ValueError.
+        """
+        if status_code == 200:
+            text = self._gemini_text(_json_loads(content))
+            if text is not None:
+                logger.info("Gemini generation successful (retries=%d)", attempt - 1)
+                return text, None, None
+            return None, "Unexpected response format from Gemini API", None
+        if status_code in (429, 503):
+            wait_time = self._retry_after_wait(attempt, status_code, headers)
+            return None, f"Gemini API returned {status_code}", wait_time
+        raise ValueError(f"Gemini API error {status_code}: {content.decode('utf-8', 'replace')}")
+
+    def _next_retry_delay(self, attempt: int, retry_after: Optional[float], error: Optional[str]) -> float:
+        """Spend one retry from the budget and return the wait before the next attempt."""
+        self._spend_retry()
+        delay = retry_after if retry_after is not None else _backoff_delay(attempt)
+        logger.warning("Attempt %d failed (%s); retrying in %.2fs", attempt, error, delay)
+        return delay
+
+    # ------------------------------------------------------------------
+    # Ollama
+    # ------------------------------------------------------------------
+
+    def _ollama_payload(
+        self, prompt: str, temp: float, max_tokens: int, system_prompt: Optional[str]
+    ) -> Dict[str, Any]:
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        payload: Dict[str, Any] = {
+        return {
             "model": self.model,
             "messages": messages,
             "stream": False,
@@ -233,41 +749,315 @@ class LLMClient:
             },
         }
 
-        retries = 0
+    def _generate_ollama(
+        self,
+        prompt: str,
+        temp: float,
+        max_tokens: int,
+        system_prompt: Optional[str],
+    ) -> str:
+        """Internal: call Ollama local API."""
+        payload = self._ollama_payload(prompt, temp, max_tokens, system_prompt)
         last_error = None
 
-        while retries < Config.MAX_RETRIES:
+        for attempt in range(1, Config.MAX_RETRIES + 1):
             try:
-                response = requests.post(
-                    f"{self.base_url}/api/chat",
-                    json=payload,
+                response = self._session.post(
+                    self._ollama_url,
+                    data=_json_dumps(payload),
                     timeout=120,  # Local inference can be slower
                 )
-                if response.status_code == 200:
-                    data = response.json()
-                    text = data.get("message", {}).get("content", "")
-                    if text:
-                        logger.info("Ollama generation successful (model=%s retries=%d)", self.model, retries)
-                        return text
-                    last_error = "Empty response from Ollama"
-                    retries += 1
-                else:
-                    raise ValueError(f"Ollama API error {response.status_code}: {response.text}")
             except requests.exceptions.RequestException as e:
                 last_error = str(e)
-                retries += 1
-                if retries < Config.MAX_RETRIES:
-                    logger.warning("Ollama request failed, retrying (attempt %d): %s", retries, e)
-                    time.sleep(Config.RETRY_DELAY)
+            else:
+                text, last_error = self._ollama_outcome(attempt, response.status_code, response.content)
+                if text is not None:
+                    return text
+            if attempt < Config.MAX_RETRIES:
+                time.sleep(self._next_retry_delay(attempt, None, last_error))
 
         raise RuntimeError(f"Ollama: failed after {Config.MAX_RETRIES} attempts: {last_error}")
 
-    
+    async def _agenerate_ollama(
+        self,
+        prompt: str,
+        temp: float,
+        max_tokens: int,
+        system_prompt: Optional[str],
+    ) -> str:
+        """Internal: async Ollama call, same retry policy as `_generate_ollama`."""
+        import httpx
+
+        payload = self._ollama_payload(prompt, temp, max_tokens, system_prompt)
+        client = self._get_async_client()
+        last_error = None
+
+        for attempt in range(1, Config.MAX_RETRIES + 1):
+            try:
+                response = await client.post(
+                    self._ollama_url,
+                    content=_json_dumps(payload),
+                    timeout=120,  # Local inference can be slower
+                )
+            except httpx.RequestError as e:
+                last_error = str(e)
+            else:
+                text, last_error = self._ollama_outcome(attempt, response.status_code, response.content)
+                if text is not None:
+                    return text
+            if attempt < Config.MAX_RETRIES:
+                await asyncio.sleep(self._next_retry_delay(attempt, None, last_error))
+
+        raise RuntimeError(f"Ollama: failed after {Config.MAX_RETRIES} attempts: {last_error}")
+
+    def _ollama_outcome(self, attempt: int, status_code: int, content: bytes) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Classify one Ollama response as (text, error), like `_gemini_outcome`.
+        An empty reply is retryable; any non-200 status raises ValueError.
+        """
+        if status_code != 200:
+            raise ValueError(f"Ollama API error {status_code}: {content.decode('utf-8', 'replace')}")
+        text = _json_loads(content).get("message", {}).get("content", "")
+        if text:
+            logger.info("Ollama generation successful (model=%s retries=%d)", self.model, attempt - 1)
+            return text, None
+        return None, "Empty response from Ollama"
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def generate_stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        already_scrubbed: bool = False,
+    ) -> Iterator[str]:
+        """
+        Stream generated text as it is produced, yielding text chunks.
+
+        Takes the same arguments as `generate`; joining the chunks gives the
+        full reply. Connection errors and rate limits are retried only
+        before the first chunk arrives; once text has been yielded a failure
+        is raised to the caller rather than restarting the reply.
+        """
+        self._check_circuit()
+
+        prompt, temp, max_tokens, system_prompt = self._prepare(
+            prompt, temperature, max_tokens, system_prompt, already_scrubbed
+        )
+
+        try:
+            if self.provider == "ollama":
+                yield from self._stream_ollama(prompt, temp, max_tokens, system_prompt)
+            else:
+                yield from self._stream_gemini(prompt, temp, max_tokens, system_prompt)
+            self._record_success()
+        except Exception:
+            self._record_failure()
+            raise
+
+    def _open_stream(self, provider: str, **kwargs: Any) -> requests.Response:
+        """POST with stream=True, retrying connection errors and 429s; returns a 200 response."""
+        last_error = None
+
+        for attempt in range(1, Config.MAX_RETRIES + 1):
+            retry_after = None
+            try:
+                response = self._session.post(stream=True, **kwargs)
+            except requests.exceptions.RequestException as e:
+                last_error = str(e)
+            else:
+                if response.status_code == 200:
+                    return response
+                if response.status_code not in (429, 503):
+                    raise ValueError(f"{provider} API error {response.status_code}: {response.text}")
+                response.close()
+                last_error = f"{provider} API returned {response.status_code}"
+                retry_after = self._retry_after_wait(attempt, response.status_code, response.headers)
+            if attempt < Config.MAX_RETRIES:
+                time.sleep(self._next_retry_delay(attempt, retry_after, last_error))
+
+        raise RuntimeError(f"{provider}: failed after {Config.MAX_RETRIES} attempts: {last_error}")
+
+    def _stream_gemini(
+        self,
+        prompt: str,
+        temp: float,
+        max_tokens: int,
+        system_prompt: Optional[str],
+    ) -> Iterator[str]:
+        """Internal: stream from Gemini's streamGenerateContent as server-sent events."""
+        body, headers = _encode_body(
+            self._gemini_payload(prompt, temp, max_tokens, system_prompt), self._compress_requests
+        )
+        response = self._open_stream(
+            "Gemini",
+            url=self._gemini_stream_url,
+            data=body,
+            headers=headers,
+            timeout=30,
+        )
+        with response:
+            # Raw bytes: the JSON parser decodes UTF-8 itself, whereas requests would
+            # guess ISO-8859-1 for a text/event-stream without a charset
+            for line in response.iter_lines():
+                yield from self._gemini_sse_texts(line)
+
+    def _stream_ollama(
+        self,
+        prompt: str,
+        temp: float,
+        max_tokens: int,
+        system_prompt: Optional[str],
+    ) -> Iterator[str]:
+        """Internal: stream from Ollama's chat API (one JSON object per line)."""
+        payload = self._ollama_payload(prompt, temp, max_tokens, system_prompt)
+        payload["stream"] = True
+        response = self._open_stream(
+            "Ollama",
+            url=self._ollama_url,
+            data=_json_dumps(payload),
+            timeout=120,  # Local inference can be slower
+        )
+        with response:
+            for line in response.iter_lines():
+                text, done = self._ollama_stream_chunk(line)
+                if text:
+                    yield text
+                if done:
+                    break
+
+    @staticmethod
+    def _gemini_sse_texts(line: bytes) -> Iterator[str]:
+        """Text parts of one Gemini SSE line; non-data lines yield nothing."""
+        # SSE frames: "data: {...}"; blank lines separate events
+        if not line.startswith(b"data:"):
+            return
+        chunk = _json_loads(line[5:])
+        for candidate in chunk.get("candidates", [])[:1]:
+            for part in candidate.get("content", {}).get("parts", []):
+                text = part.get("text")
+                if text:
+                    yield text
+
+    @staticmethod
+    def _ollama_stream_chunk(line: bytes) -> Tuple[str, bool]:
+        """(text, done) for one line of Ollama's streamed chat output."""
+        if not line:
+            return "", False
+        chunk = _json_loads(line)
+        return chunk.get("message", {}).get("content", ""), bool(chunk.get("done"))
+
+    async def agenerate_stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        already_scrubbed: bool = False,
+    ) -> AsyncIterator[str]:
+        """
+        Async variant of `generate_stream`, e.g. for wrapping in a FastAPI
+        `StreamingResponse`: `async for chunk in client.agenerate_stream(p)`.
+        """
+        self._check_circuit()
+
+        prompt, temp, max_tokens, system_prompt = await self._aprepare(
+            prompt, temperature, max_tokens, system_prompt, already_scrubbed
+        )
+
+        if self.provider == "ollama":
+            payload = self._ollama_payload(prompt, temp, max_tokens, system_prompt)
+            payload["stream"] = True
+            provider, url, timeout = "Ollama", self._ollama_url, 120
+            body, headers = _json_dumps(payload), None
+        else:
+            payload = self._gemini_payload(prompt, temp, max_tokens, system_prompt)
+            provider, url, timeout = "Gemini", self._gemini_stream_url, 30
+            body, headers = _encode_body(payload, self._compress_requests)
+
+        try:
+            response = await self._aopen_stream(provider, url, body, headers, timeout)
+            try:
+                async for line in response.aiter_lines():
+                    if provider == "Gemini":
+                        for text in self._gemini_sse_texts(line.encode("utf-8")):
+                            yield text
+                    else:
+                        text, done = self._ollama_stream_chunk(line.encode("utf-8"))
+                        if text:
+                            yield text
+                        if done:
+                            break
+            finally:
+                await response.aclose()
+            self._record_success()
+        except Exception:
+            self._record_failure()
+            raise
+
+    async def _aopen_stream(
+        self,
+        provider: str,
+        url: str,
+        body: bytes,
+        headers: Optional[Dict[str, str]],
+        timeout: float,
+    ) -> "httpx.Response":
+        """Async `_open_stream`: send with stream=True, same retry policy; returns a 200 response."""
+        import httpx
+
+        client = self._get_async_client()
+        last_error = None
+
+        for attempt in range(1, Config.MAX_RETRIES + 1):
+            retry_after = None
+            try:
+                request = client.build_request("POST", url, content=body, headers=headers, timeout=timeout)
+                response = await client.send(request, stream=True)
+            except httpx.RequestError as e:
+                last_error = str(e)
+            else:
+                if response.status_code == 200:
+                    return response
+                if response.status_code not in (429, 503):
+                    await response.aread()
+                    await response.aclose()
+                    raise ValueError(f"{provider} API error {response.status_code}: {response.text}")
+                await response.aclose()
+                last_error = f"{provider} API returned {response.status_code}"
+                retry_after = self._retry_after_wait(attempt, response.status_code, response.headers)
+            if attempt < Config.MAX_RETRIES:
+                await asyncio.sleep(self._next_retry_delay(attempt, retry_after, last_error))
+
+        raise RuntimeError(f"{provider}: failed after {Config.MAX_RETRIES} attempts: {last_error}")
+
+    # ------------------------------------------------------------------
+    # JSON helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _parse_json(response_text: str) -> Dict[str, Any]:
+        """Parse model output as JSON, falling back to the first {...} object in it."""
+        # Fast path: the reply is pure JSON
+        try:
+            return _json_loads(response_text)
+        except json.JSONDecodeError:
+            # The model might add extra text around the object
+            json_text = _extract_json(response_text)
+            if json_text is not None:
+                return _json_loads(json_text)
+            raise
+
     def generate_json(
         self,
         prompt: str,
         temperature: Optional[float] = None,
         system_prompt: Optional[str] = None,
+        already_scrubbed: bool = False,
     ) -> Dict[str, Any]:
         """
         Generate JSON response from the model.
@@ -276,6 +1066,7 @@ class LLMClient:
             prompt: The prompt to send to the model
             temperature: Override default temperature
             system_prompt: Optional system prompt
+            already_scrubbed: Skip PHI scrubbing (see `generate`)
             
         Returns:
             Parsed JSON response
@@ -283,15 +1074,20 @@ class LLMClient:
         Raises:
             json.JSONDecodeError: If response is not valid JSON
         """
-        response_text = self.generate(prompt, temperature, system_prompt=system_prompt)
-        
-        # Try to extract JSON from response (model might add extra text)
-        try:
-            return json.loads(response_text)
-        except json.JSONDecodeError:
-            # Try to find JSON in the response
-            import re
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            raise
+        response_text = self.generate(
+            prompt, temperature, system_prompt=system_prompt, already_scrubbed=already_scrubbed
+        )
+        return self._parse_json(response_text)
+
+    async def agenerate_json(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        system_prompt: Optional[str] = None,
+        already_scrubbed: bool = False,
+    ) -> Dict[str, Any]:
+        """Async variant of `generate_json`."""
+        response_text = await self.agenerate(
+            prompt, temperature, system_prompt=system_prompt, already_scrubbed=already_scrubbed
+        )
+        return self._parse_json(response_text)
@@ -3,12 +3,17 @@ Middleware for the Radiology Assistant.
 
 Includes:
 1. AuditLoggingMiddleware: Logs all clinical API requests to the database.
+   Entries are queued and written in batches by a background thread, so the
+   request path never waits on the database.
 """
 
 import time
 import json
 import logging
-from typing import Callable
+import queue
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -19,6 +24,136 @@ from .auth import decode_token
 
 logger = logging.getLogger(__name__)
 
+# Queued by AuditLogWriter.close() to tell the writer thread to exit
+_STOP: Any = object()
+
+
+class AuditLogWriter:
+    """
+    Background writer for audit log rows.
+
+    `submit` only enqueues (never blocks, never touches the DB). A daemon
+    thread drains the queue and inserts up to `batch_size` rows per
+    transaction, flushing at least every `flush_interval` seconds. When the
+    queue is full the oldest entry is dropped and counted in `dropped`.
+    Call `close` at shutdown so rows the thread has already drained are
+    written before the process exits.
+    """
+
+    def __init__(self, max_queue: int = 10000, batch_size: int = 100, flush_interval: float = 0.1):
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, entry: Dict[str, Any]) -> None:
+        """Queue one row (column name -> value) for insertion."""
+        self._ensure_started()
+        while True:
+            try:
+                self._queue.put_nowait(entry)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    with self._lock:
+                        self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def flush(self) -> None:
+        """Write everything queued so far from the calling thread."""
+        batch = self._drain(block=False)
+        while batch:
+            self._write([entry for entry in batch if entry is not _STOP])
+            batch = self._drain(block=False)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Stop the writer thread after it has written everything queued before
+        this call, waiting up to `timeout` seconds, then flush any remainder
+        from the calling thread. `submit` starts a new thread afterwards.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+                thread.join(timeout)
+            except queue.Full:
+                pass
+            if thread.is_alive():
+                logger.warning("Audit writer thread did not stop within %.1fs", timeout)
+        self.flush()
+        if self.dropped:
+            logger.warning("Audit log writer dropped %d entries (queue full)", self.dropped)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                self._thread.start()
+
+    def _drain(self, block: bool) -> List[Dict[str, Any]]:
+        """
+        Collect up to batch_size entries. When blocking, wait for the first
+        one, then up to flush_interval for more; otherwise take what is queued.
+        A stop marker ends the batch as its last element.
+        """
+        batch: List[Dict[str, Any]] = []
+        try:
+            batch.append(self._queue.get() if block else self._queue.get_nowait())
+        except queue.Empty:
+            return batch
+        if batch[0] is _STOP:
+            return batch
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic() if block else 0.0
+            try:
+                if timeout > 0:
+                    entry = self._queue.get(timeout=timeout)
+                else:
+                    entry = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(entry)
+            if entry is _STOP:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._drain(block=True)
+            if batch and batch[-1] is _STOP:
+                self._write(batch[:-1])
+                return
+            self._write(batch)
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        if not batch:
+            return
+        try:
+            # Commits on exit, rolls back and closes on error
+            with SessionLocal.begin() as db:
+                db.bulk_insert_mappings(AuditLogDB, batch)
+        except Exception:
+            logger.exception("Failed to write %d audit log entries", len(batch))
+            # We don't fail requests if logging fails
+
+
+# Process-wide writer used by AuditLoggingMiddleware
+audit_writer = AuditLogWriter()
+
+# Only /v1/ (clinical) endpoints are audited, minus health, auth/token and
+# metrics to avoid noise. Prefix matches, so e.g. /v1/reports/metrics is audited.
+_AUDIT_PREFIX = "/v1/"
+_AUDIT_SKIP_PREFIXES = ("/v1/health", "/v1/auth/token", "/v1/metrics")
+
 
 class AuditLoggingMiddleware(BaseHTTPMiddleware):
     """
@@ -27,13 +162,8 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
     """
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # We only audit clinical endpoints (v1/...)
         path = request.url.path
-        if not path.startswith("/v1/"):
-            return await call_next(request)
-
-        # Skip health, auth/token, and metrics to avoid noise
-        if any(skip in path for skip in ["/health", "/auth/token", "/metrics"]):
+        if not path.startswith(_AUDIT_PREFIX) or path.startswith(_AUDIT_SKIP_PREFIXES):
             return await call_next(request)
 
         start_time = time.time()
@@ -41,11 +171,9 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
         # Get user from JWT if present
         user_id = "anonymous"
         auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.split(" ")[1]
+        if auth_header and auth_header[:7] == "Bearer ":
             try:
-                payload = decode_token(token)
-                user_id = payload.get("sub", "unknown")
+                user_id = decode_token(auth_header[7:]).sub
             except Exception:
                 pass
 
@@ -55,21 +183,14 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
         process_time = time.time() - start_time
         status_code = response.status_code
 
-        # Save to DB in background (using a fresh session)
-        try:
-            db = SessionLocal()
-            log_entry = AuditLogDB(
-                user_id=user_id,
-                action=request.method,
-                resource=path,
-                status_code=status_code,
-                ip_address=request.client.host if request.client else "unknown"
-            )
-            db.add(log_entry)
-            db.commit()
-            db.close()
-        except Exception:
-            logger.exception("Failed to write audit log entry")
-            # We don't fail the request if logging fails
+        # Hand the row to the background writer; the DB insert happens off the request path
+        audit_writer.submit({
+            "user_id": user_id,
+            "action": request.method,
+            "resource": path,
+            "status_code": status_code,
+            "ip_address": request.client.host if request.client else "unknown",
+            "timestamp": datetime.now(timezone.utc),
+        })
 
         return response
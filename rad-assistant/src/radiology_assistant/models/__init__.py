@@ -0,0 +1,153 @@
+"""
+Data models for the radiology assistant.
+
+Defines the contract between components using Pydantic models. The models
+are grouped into one submodule per agent and imported on first access, so a
+process that only touches one agent does not pay to build every class:
+
+    from radiology_assistant.models import WorklistTriageRequest
+
+imports only `models.agent6_triage` (and the submodules it depends on).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# Public model name -> submodule defining it
+_NAME_TO_MODULE: Dict[str, str] = {
+    # base
+    "RadBaseModel": "base",
+    # agent1_report_draft
+    "Finding": "agent1_report_draft",
+    "ClinicalContext": "agent1_report_draft",
+    "KeyFinding": "agent1_report_draft",
+    "UsedCVSignal": "agent1_report_draft",
+    "ReportDraftRequest": "agent1_report_draft",
+    "ReportDraft": "agent1_report_draft",
+    # agent2_cv_highlight
+    "CVHighlightMode": "agent2_cv_highlight",
+    "CVHighlightRequest": "agent2_cv_highlight",
+    "CVRegionHighlight": "agent2_cv_highlight",
+    "CVHighlightResult": "agent2_cv_highlight",
+    # agent3_followup
+    "FollowUpInterval": "agent3_followup",
+    "IncidentalFindingCategory": "agent3_followup",
+    "FollowUpType": "agent3_followup",
+    "RecommendationStrength": "agent3_followup",
+    "IncidentalFinding": "agent3_followup",
+    "ExamMetadata": "agent3_followup",
+    "FollowUpExtractionRequest": "agent3_followup",
+    "FollowUpExtractionResponse": "agent3_followup",
+    # agent4_report_qa
+    "QASeverity": "agent4_report_qa",
+    "QAType": "agent4_report_qa",
+    "QASection": "agent4_report_qa",
+    "QAChangeType": "agent4_report_qa",
+    "QARequiredFields": "agent4_report_qa",
+    "QAIssue": "agent4_report_qa",
+    "QASummary": "agent4_report_qa",
+    "ReportQARequest": "agent4_report_qa",
+    "ReportQAResponse": "agent4_report_qa",
+    # agent5_patient_explainer
+    "PatientReadingLevel": "agent5_patient_explainer",
+    "PatientSummaryTone": "agent5_patient_explainer",
+    "PatientNextStepUrgency": "agent5_patient_explainer",
+    "GlossaryItem": "agent5_patient_explainer",
+    "PatientNextStep": "agent5_patient_explainer",
+    "PatientReportSummaryRequest": "agent5_patient_explainer",
+    "PatientReportSummaryResponse": "agent5_patient_explainer",
+    # agent6_triage
+    "TriageLabel": "agent6_triage",
+    "TriageReasonType": "agent6_triage",
+    "ModalityGroup": "agent6_triage",
+    "TriageThresholdConfig": "agent6_triage",
+    "TriageConfig": "agent6_triage",
+    "WorklistItem": "agent6_triage",
+    "WorklistTriageRequest": "agent6_triage",
+    "TriageReason": "agent6_triage",
+    "WorklistTriageItem": "agent6_triage",
+    "WorklistTriageResponse": "agent6_triage",
+    # agent7_learning
+    "LearningEventType": "agent7_learning",
+    "DiscrepancySeverity": "agent7_learning",
+    "DigestScope": "agent7_learning",
+    "DigestPeriod": "agent7_learning",
+    "LearningEvent": "agent7_learning",
+    "RadiologistLearningDigestRequest": "agent7_learning",
+    "LearningCaseSnippet": "agent7_learning",
+    "LearningTheme": "agent7_learning",
+    "LearningStats": "agent7_learning",
+    "RadiologistLearningDigestResponse": "agent7_learning",
+    # agent8_orchestrator
+    "StudyPipelineStage": "agent8_orchestrator",
+    "StageStatus": "agent8_orchestrator",
+    "PipelineStatus": "agent8_orchestrator",
+    "PipelineOptions": "agent8_orchestrator",
+    "StudyOrchestrationRequest": "agent8_orchestrator",
+    "StageResult": "agent8_orchestrator",
+    "StudyBundle": "agent8_orchestrator",
+    "StudyOrchestrationResponse": "agent8_orchestrator",
+    # differentiators
+    "FatigueTimeSlot": "differentiators",
+    "FatigueReport": "differentiators",
+    "FollowupReminderOut": "differentiators",
+    "CMEQuestion": "differentiators",
+    "CMECase": "differentiators",
+    "CMEGradeResult": "differentiators",
+}
+
+__all__ = list(_NAME_TO_MODULE)
+
+if TYPE_CHECKING:
+    # Mirrors _NAME_TO_MODULE so type checkers see the real classes
+    from .base import RadBaseModel
+    from .agent1_report_draft import (
+        Finding, ClinicalContext, KeyFinding, UsedCVSignal, ReportDraftRequest, ReportDraft,
+    )
+    from .agent2_cv_highlight import (
+        CVHighlightMode, CVHighlightRequest, CVRegionHighlight, CVHighlightResult,
+    )
+    from .agent3_followup import (
+        FollowUpInterval, IncidentalFindingCategory, FollowUpType, RecommendationStrength,
+        IncidentalFinding, ExamMetadata, FollowUpExtractionRequest, FollowUpExtractionResponse,
+    )
+    from .agent4_report_qa import (
+        QASeverity, QAType, QASection, QAChangeType, QARequiredFields, QAIssue, QASummary,
+        ReportQARequest, ReportQAResponse,
+    )
+    from .agent5_patient_explainer import (
+        PatientReadingLevel, PatientSummaryTone, PatientNextStepUrgency, GlossaryItem,
+        PatientNextStep, PatientReportSummaryRequest, PatientReportSummaryResponse,
+    )
+    from .agent6_triage import (
+        TriageLabel, TriageReasonType, ModalityGroup, TriageThresholdConfig, TriageConfig,
+        WorklistItem, WorklistTriageRequest, TriageReason, WorklistTriageItem,
+        WorklistTriageResponse,
+    )
+    from .agent7_learning import (
+        LearningEventType, DiscrepancySeverity, DigestScope, DigestPeriod, LearningEvent,
+        RadiologistLearningDigestRequest, LearningCaseSnippet, LearningTheme, LearningStats,
+        RadiologistLearningDigestResponse,
+    )
+    from .agent8_orchestrator import (
+        StudyPipelineStage, StageStatus, PipelineStatus, PipelineOptions, StudyOrchestrationRequest,
+        StageResult, StudyBundle, StudyOrchestrationResponse,
+    )
+    from .differentiators import (
+        FatigueTimeSlot, FatigueReport, FollowupReminderOut, CMEQuestion, CMECase, CMEGradeResult,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: called only for names not yet in the module namespace
+    try:
+        submodule = _NAME_TO_MODULE[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,116 @@
+"""Models for Agent 1: Report Drafter."""
+
+from typing import Optional, List, Dict, Any
+from pydantic import ConfigDict, Field
+
+from .base import RadBaseModel
+from .agent2_cv_highlight import CVHighlightResult
+
+
+# Example payloads shown in the OpenAPI docs, keyed by model name
+_EXAMPLES: Dict[str, Dict[str, Any]] = {
+    "Finding": {
+        "location": "right lower lobe",
+        "type": "opacity",
+        "severity": "moderate",
+        "additional_details": None
+    },
+    "ClinicalContext": {
+        "patient_info": "65-year-old male",
+        "clinical_presentation": "Fever and cough for 3 days",
+        "relevant_history": "History of COPD"
+    },
+    "ReportDraftRequest": {
+        "findings": [
+            {
+                "location": "right lower lobe",
+                "type": "opacity",
+                "severity": "moderate"
+            }
+        ],
+        "clinical_context": {
+            "patient_info": "65-year-old male",
+            "clinical_presentation": "Fever",
+            "relevant_history": "COPD"
+        },
+        "modality": "Chest X-ray",
+        "cv_summary": {
+            "modality": "DX",
+            "summary": "Suspicious opacity in RLL.",
+            "regions": [
+                {"label": "Opacity", "score": 0.85}
+            ]
+        }
+    },
+    "ReportDraft": {
+        "report_text": "TECHNIQUE: ... FINDINGS: ... IMPRESSION: ...",
+        "key_findings": [
+            {"label": "RLL Opacity", "category": "pathology", "severity": "significant"}
+        ],
+        "used_cv_signals": [
+            {"cv_label": "Opacity", "included_in_report": True, "reasoning": "Correlates with radiologist finding"}
+        ],
+        "confidence_score": 0.85
+    },
+}
+
+
+class Finding(RadBaseModel):
+    """Represents a single radiological finding."""
+    
+    location: str = Field(..., description="Anatomical location of the finding (e.g., 'right lower lobe')")
+    type: str = Field(..., description="Type of finding (e.g., 'opacity', 'cardiomegaly', 'consolidation')")
+    severity: str = Field(..., description="Severity level (e.g., 'mild', 'moderate', 'severe')")
+    additional_details: Optional[str] = Field(None, description="Optional additional clinical details")
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["Finding"]})
+
+
+class ClinicalContext(RadBaseModel):
+    """Clinical context for the report."""
+    
+    patient_info: str = Field(..., description="Brief patient demographics and history (e.g., '65-year-old male')")
+    clinical_presentation: str = Field(..., description="Chief complaint and recent symptoms")
+    relevant_history: Optional[str] = Field(None, description="Relevant medical history (e.g., 'history of COPD')")
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["ClinicalContext"]})
+
+
+class KeyFinding(RadBaseModel):
+    """A key finding extracted for the report."""
+    label: str = Field(..., description="Short human-readable name of the finding")
+    category: str = Field(..., description="Category e.g. pathology, normal_variant, device, artifact")
+    severity: str = Field(..., description="Severity: critical, significant, minor, normal")
+
+
+class UsedCVSignal(RadBaseModel):
+    """Description of how a CV signal was used in the report."""
+    cv_label: str = Field(..., description="Pathology name from the CV model")
+    included_in_report: bool = Field(..., description="Whether this signal was mentioned in the report")
+    reasoning: str = Field(..., description="Short explanation for inclusion/exclusion")
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ReportDraftRequest(RadBaseModel):
+    """Input request for the report drafting agent."""
+    
+    findings: List[Finding] = Field(..., description="List of radiological findings")
+    clinical_context: ClinicalContext = Field(..., description="Clinical context")
+    modality: Optional[str] = Field(None, description="Imaging modality (e.g., 'Chest X-ray')")
+    view: Optional[str] = Field(None, description="View type (e.g., 'PA & lateral')")
+    prior_study_summary: Optional[str] = Field(None, description="Summary of prior imaging if available")
+    cv_summary: Optional[CVHighlightResult] = Field(None, description="Summary from CV agent")
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["ReportDraftRequest"]})
+
+
+class ReportDraft(RadBaseModel):
+    """Output report from the drafting agent."""
+    
+    report_text: str = Field(..., description="Full formatted report text (TECHNIQUE, COMPARISON, FINDINGS, IMPRESSION)")
+    key_findings: List[KeyFinding] = Field(default_factory=list, description="Structured key findings")
+    used_cv_signals: List[UsedCVSignal] = Field(default_factory=list, description="How CV signals were used")
+    confidence_score: float = Field(0.75, ge=0.0, le=1.0, description="Confidence score (0-1)")
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["ReportDraft"]})
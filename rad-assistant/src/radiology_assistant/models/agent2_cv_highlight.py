@@ -0,0 +1,41 @@
+"""Models for Agent 2: Visual Highlighter (CV)."""
+
+from enum import Enum
+from typing import Optional, List, Tuple
+from pydantic import ConfigDict
+
+from .base import RadBaseModel
+
+
+class CVHighlightMode(str, Enum):
+    attention = "attention"       # assistive, saliency-style
+    bounding_boxes = "boxes"      # optional later
+
+
+class CVHighlightRequest(RadBaseModel):
+    """Request for CV highlighting."""
+    study_id: Optional[str] = None      # internal id, not required
+    modality: str                       # e.g. "CR", "DX", "CT"
+    body_part: Optional[str] = None     # "chest", "abdomen", etc.
+    view: Optional[str] = None          # "PA", "AP", etc.
+    assistive_mode: CVHighlightMode = CVHighlightMode.attention
+    # NOTE: image file itself will come via FastAPI UploadFile, not in this model
+
+
+class CVRegionHighlight(RadBaseModel):
+    """A specific highlighted region."""
+    label: str                         # e.g. "opacity", "nodule"
+    score: float                       # 0.0 – 1.0 confidence
+    bbox: Optional[Tuple[int, int, int, int]] = None  # x, y, w, h
+    mask_present: bool = False
+
+    model_config = ConfigDict(frozen=True)
+
+
+class CVHighlightResult(RadBaseModel):
+    """Result from the CV agent."""
+    study_id: Optional[str] = None
+    modality: str
+    summary: str                       # short text summary
+    regions: List[CVRegionHighlight]
+    heatmap_png_base64: Optional[str] = None  # for UI overlay
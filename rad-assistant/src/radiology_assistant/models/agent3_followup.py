@@ -0,0 +1,80 @@
+"""Models for Agent 3: Follow-Up & Incidental Findings Tracker."""
+
+from enum import Enum
+from typing import Optional, List
+from pydantic import Field
+
+from .base import RadBaseModel
+
+
+class FollowUpInterval(RadBaseModel):
+    """Structured follow-up interval."""
+    years: int = 0
+    months: int = 0
+    weeks: int = 0
+    
+    def is_empty(self) -> bool:
+        return self.years == 0 and self.months == 0 and self.weeks == 0
+
+
+class IncidentalFindingCategory(str, Enum):
+    pulmonary_nodule = "pulmonary_nodule"
+    liver_lesion = "liver_lesion"
+    renal_cyst = "renal_cyst"
+    adrenal_nodule = "adrenal_nodule"
+    thyroid_nodule = "thyroid_nodule"
+    other = "other"
+
+
+class FollowUpType(str, Enum):
+    imaging = "imaging"
+    clinical = "clinical"
+    none = "none"
+    unknown = "unknown"
+
+
+class RecommendationStrength(str, Enum):
+    explicit = "explicit"
+    conditional = "conditional"
+    none = "none"
+
+
+class IncidentalFinding(RadBaseModel):
+    """An incidental finding extracted from the report."""
+    id: str = Field(..., description="Unique identifier for this finding (e.g., IF1)")
+    description: str = Field(..., description="Short human-readable summary")
+    verbatim_snippet: str = Field(..., description="Excerpt from report")
+    location: Optional[str] = Field(None, description="Anatomic location")
+    size: Optional[str] = Field(None, description="Size description specific to the finding")
+    category: IncidentalFindingCategory
+    followup_required: bool
+    followup_type: FollowUpType
+    followup_modality: Optional[str] = None
+    followup_interval: Optional[FollowUpInterval] = None
+    followup_interval_text: Optional[str] = None
+    followup_rationale: Optional[str] = None
+    recommendation_strength: RecommendationStrength
+
+
+class ExamMetadata(RadBaseModel):
+    """Metadata for the exam being analyzed."""
+    accession: Optional[str] = None
+    exam_date: Optional[str] = None
+    modality: Optional[str] = None
+    body_region: Optional[str] = None
+    age: Optional[int] = None
+    sex: Optional[str] = None
+
+
+class FollowUpExtractionRequest(RadBaseModel):
+    """Request to extract follow-ups from a report."""
+    exam_metadata: ExamMetadata
+    report_text: str
+
+
+class FollowUpExtractionResponse(RadBaseModel):
+    """Extracted follow-up information."""
+    version: str = "v1"
+    incidental_findings: List[IncidentalFinding]
+    global_followup_comment: Optional[str] = None
+    has_any_followup: bool
@@ -0,0 +1,83 @@
+"""Models for Agent 4: Structured Reporting & QA Coach."""
+
+from enum import Enum
+from typing import Optional, List
+
+from .base import RadBaseModel
+from .agent3_followup import ExamMetadata
+
+
+class QASeverity(str, Enum):
+    CRITICAL = "critical"          # clinically dangerous or clearly wrong
+    MAJOR = "major"                # important but not immediately dangerous
+    MINOR = "minor"                # stylistic or minor clarity issues
+    INFO = "info"                  # optional improvements
+
+
+class QAType(str, Enum):
+    CONSISTENCY = "consistency"    # findings vs impression mismatches
+    COMPLETENESS = "completeness"  # missing required fields/sections
+    CLARITY = "clarity"            # vague wording, over-hedging
+    STRUCTURE = "structure"        # section formatting/ordering
+    REDUNDANCY = "redundancy"      # repeated content
+    TERMINOLOGY = "terminology"    # non-standard wording
+    OTHER = "other"
+
+
+class QASection(str, Enum):
+    TECHNIQUE = "TECHNIQUE"
+    COMPARISON = "COMPARISON"
+    FINDINGS = "FINDINGS"
+    IMPRESSION = "IMPRESSION"
+    OTHER = "OTHER"
+    GLOBAL = "GLOBAL"
+
+
+class QAChangeType(str, Enum):
+    SUGGEST_EDIT = "suggest_edit"      # suggest replacement text
+    ADD_SECTION = "add_section"        # suggest adding missing section
+    REMOVE_TEXT = "remove_text"        # suggest deletion
+    REORDER = "reorder"                # suggest reordering content
+    NOTE_ONLY = "note_only"            # comment only, no concrete change
+
+
+class QARequiredFields(RadBaseModel):
+    """
+    Body-region/modality specific expectations.
+    """
+    modality: Optional[str]
+    body_region: Optional[str]
+    required_sections: List[QASection] = []
+
+
+class QAIssue(RadBaseModel):
+    id: str
+    severity: QASeverity
+    type: QAType
+    section: QASection
+    description: str               # human-readable explanation
+    location_hint: Optional[str]   # e.g. snippet or “paragraph index 2”
+    suggested_change_type: QAChangeType
+    suggested_text: Optional[str]  # replacement/added text if applicable
+
+
+class QASummary(RadBaseModel):
+    overall_quality: str           # e.g. "good", "acceptable", "needs_revision"
+    num_critical: int
+    num_major: int
+    num_minor: int
+    comments: Optional[str]
+
+
+class ReportQARequest(RadBaseModel):
+    exam_metadata: ExamMetadata    # reuse existing ExamMetadata
+    report_text: str               # full report text as seen by radiologist
+    qa_requirements: Optional[QARequiredFields] = None
+
+
+class ReportQAResponse(RadBaseModel):
+    version: str = "v1"
+    original_report_text: str
+    normalized_report_text: Optional[str] = None  # cleaned/normalized structure if generated
+    issues: List[QAIssue]
+    summary: QASummary
@@ -0,0 +1,61 @@
+"""Models for Agent 5: Patient-Friendly Report Explainer."""
+
+from enum import Enum
+from typing import Optional, List
+from pydantic import ConfigDict
+
+from .base import RadBaseModel
+from .agent3_followup import ExamMetadata, FollowUpExtractionResponse, FollowUpInterval
+
+
+class PatientReadingLevel(str, Enum):
+    VERY_SIMPLE = "very_simple"   # ~5th grade
+    SIMPLE = "simple"             # ~8th grade
+    STANDARD = "standard"         # ~10–12th grade
+
+
+class PatientSummaryTone(str, Enum):
+    NEUTRAL = "neutral"
+    REASSURING = "reassuring"
+
+
+class PatientNextStepUrgency(str, Enum):
+    ROUTINE = "routine"
+    SOON = "soon"
+    URGENT = "urgent"
+    UNKNOWN = "unknown"
+
+
+class GlossaryItem(RadBaseModel):
+    term: str
+    explanation: str   # lay-language explanation
+
+    model_config = ConfigDict(frozen=True)
+
+
+class PatientNextStep(RadBaseModel):
+    description: str                     # e.g. "Your doctor may order a follow-up CT scan in 6 months."
+    urgency: PatientNextStepUrgency
+    followup_interval: Optional[FollowUpInterval] = None  # reuse from Agent 3 if available
+    source_finding_id: Optional[str] = None               # link to IncidentalFinding.id if passed in
+
+    model_config = ConfigDict(frozen=True)
+
+
+class PatientReportSummaryRequest(RadBaseModel):
+    exam_metadata: ExamMetadata         # reuse from Agent 3
+    report_text: str                    # final radiology report
+    # followup_data is optional – to link Agent 3
+    followup_data: Optional[FollowUpExtractionResponse] = None  
+    reading_level: PatientReadingLevel = PatientReadingLevel.SIMPLE
+    tone: PatientSummaryTone = PatientSummaryTone.NEUTRAL
+    language_code: str = "en"           # ISO code, e.g. "en", "es"
+
+
+class PatientReportSummaryResponse(RadBaseModel):
+    version: str = "v1"
+    patient_summary_text: str           # short paragraph summary
+    key_points: List[str]               # bullet-style summary items
+    next_steps: List[PatientNextStep]   # actions / follow-ups in lay language
+    glossary: List[GlossaryItem]
+    original_report_text: str
@@ -0,0 +1,125 @@
+"""Models for Agent 6: Worklist Triage & Priority Recommender."""
+
+from enum import Enum
+from typing import Optional, List, Tuple, Dict, Any
+from pydantic import Field, PrivateAttr
+
+from .base import RadBaseModel
+
+
+class TriageLabel(str, Enum):
+    CRITICAL = "CRITICAL"
+    HIGH = "HIGH"
+    ROUTINE = "ROUTINE"
+    LOW = "LOW"
+    UNTRIAGED = "UNTRIAGED"
+
+
+class TriageReasonType(str, Enum):
+    MODEL_PREDICTION = "MODEL_PREDICTION"
+    CLINICAL_INDICATION = "CLINICAL_INDICATION"
+    TIME_IN_QUEUE = "TIME_IN_QUEUE"
+    PROTOCOL_PRIORITY = "PROTOCOL_PRIORITY"
+    FALLBACK = "FALLBACK"
+
+
+class ModalityGroup(str, Enum):
+    XR = "XR"
+    CT = "CT"
+    MR = "MR"
+    US = "US"
+    NM = "NM"
+    OTHER = "OTHER"
+
+
+class TriageThresholdConfig(RadBaseModel):
+    """Configuration for triage thresholds for a specific modality/region."""
+    modality_group: ModalityGroup
+    body_region: Optional[str] = None
+    critical_threshold: float = 0.9
+    high_threshold: float = 0.7
+    low_threshold: float = 0.3
+    min_confidence: float = 0.5
+
+
+_ThresholdIndex = Dict[Tuple[str, Optional[str]], Tuple[int, TriageThresholdConfig]]
+
+
+class TriageConfig(RadBaseModel):
+    """Global triage configuration."""
+    thresholds: List[TriageThresholdConfig]
+    max_batch_size: int = 10
+    enable_llm_explanation: bool = True
+    model_mapping: Dict[str, str] = Field(default_factory=dict, description="Map 'ModalityGroup/Region' to model name")
+
+    # (thresholds list the index was built from, index); rebuilt whenever
+    # `thresholds` is a different list, e.g. after assignment or model_copy(update=...)
+    _threshold_cache: Optional[Tuple[List[TriageThresholdConfig], _ThresholdIndex]] = PrivateAttr(default=None)
+
+    def _threshold_index(self) -> _ThresholdIndex:
+        """(modality value, lowercased body region or None) -> (position, thresholds), first entry per key."""
+        cached = self._threshold_cache
+        if cached is not None and cached[0] is self.thresholds:
+            return cached[1]
+        index: _ThresholdIndex = {}
+        for position, t in enumerate(self.thresholds):
+            region = t.body_region.lower() if t.body_region is not None else None
+            index.setdefault((t.modality_group.value, region), (position, t))
+        self._threshold_cache = (self.thresholds, index)
+        return index
+
+    def find_thresholds(self, modality: str, body_region: Optional[str]) -> Optional[TriageThresholdConfig]:
+        """
+        The first threshold entry (in config order) for `modality` whose body
+        region matches case-insensitively or is unset. The lookup index is
+        cached per `thresholds` list; edit the list by replacing it rather
+        than mutating it in place.
+        """
+        index = self._threshold_index()
+        specific = index.get((modality, (body_region or "").lower()))
+        generic = index.get((modality, None))
+        if specific is None or (generic is not None and generic[0] < specific[0]):
+            specific = generic
+        return specific[1] if specific is not None else None
+
+
+class WorklistItem(RadBaseModel):
+    """An item in the worklist to be triaged."""
+    study_id: str = Field(..., description="Unique identifier for the study")
+    accession: Optional[str] = None
+    patient_id: Optional[str] = None  # Treat as PHI
+    exam_datetime: Optional[str] = None
+    modality: str
+    body_region: Optional[str] = None
+    clinical_indication: Optional[str] = None
+    priority_flag_from_order: Optional[str] = None  # e.g. "STAT"
+    image_reference: Optional[Dict[str, Any]] = None  # e.g. {"thumbnail_path": "..."}
+
+
+class WorklistTriageRequest(RadBaseModel):
+    """Request to triage a list of studies."""
+    worklist_items: List[WorklistItem]
+
+
+class TriageReason(RadBaseModel):
+    """Reason for a specific triage decision."""
+    type: TriageReasonType
+    description: str
+    weight: float = 0.0
+
+
+class WorklistTriageItem(RadBaseModel):
+    """Triaged item with score and label."""
+    study_id: str
+    triage_score: float = Field(..., ge=0.0, le=1.0)
+    triage_label: TriageLabel
+    reasons: List[TriageReason]
+    model_metadata: Dict[str, Any] = Field(default_factory=dict)
+    explanation_text: Optional[str] = None
+    error: Optional[str] = None
+
+
+class WorklistTriageResponse(RadBaseModel):
+    """Batch response for triage request."""
+    version: str = "v1"
+    items: List[WorklistTriageItem]
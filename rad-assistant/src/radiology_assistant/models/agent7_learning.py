@@ -0,0 +1,123 @@
+"""Models for Agent 7: Learning & Feedback / Case Digest."""
+
+from enum import Enum
+from typing import Optional, List, Dict, Any, Tuple
+from pydantic import ConfigDict, Field
+
+from .base import RadBaseModel
+from .agent3_followup import ExamMetadata, FollowUpExtractionResponse
+from .agent4_report_qa import QAIssue
+
+
+class LearningEventType(str, Enum):
+    ADDENDUM_CORRECTION = "ADDENDUM_CORRECTION"
+    QA_ISSUE = "QA_ISSUE"
+    PEER_REVIEW_DISCREPANCY = "PEER_REVIEW_DISCREPANCY"
+    MISSED_FINDING = "MISSED_FINDING"
+    OVER_CALL = "OVER_CALL"
+    FOLLOWUP_MISMATCH = "FOLLOWUP_MISMATCH"
+    INTERESTING_CASE = "INTERESTING_CASE"
+
+
+class DiscrepancySeverity(str, Enum):
+    CRITICAL = "CRITICAL"
+    MAJOR = "MAJOR"
+    MINOR = "MINOR"
+    INFO = "INFO"
+
+
+class DigestScope(str, Enum):
+    INDIVIDUAL_RADIOLOGIST = "INDIVIDUAL_RADIOLOGIST"
+    SERVICE_LINE = "SERVICE_LINE"
+
+
+class DigestPeriod(str, Enum):
+    WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"
+    CUSTOM = "CUSTOM"
+
+
+class LearningEvent(RadBaseModel):
+    """Internal representation of a learning event."""
+    event_id: str
+    radiologist_id: str
+    exam_metadata: ExamMetadata
+    event_type: LearningEventType
+    severity: DiscrepancySeverity
+    source: str  # e.g., "qa_agent", "peer_review", "addendum"
+    timestamp: str  # ISO datetime string
+    report_text_before: Optional[str] = None
+    report_text_after: Optional[str] = None
+    qa_issues: Optional[List[QAIssue]] = None
+    followup_data: Optional[FollowUpExtractionResponse] = None
+    triage_info: Optional[Dict[str, Any]] = None
+    tags: List[str] = Field(default_factory=list)
+
+
+class RadiologistLearningDigestRequest(RadBaseModel):
+    """Request for a learning digest."""
+    radiologist_id: str
+    start_date: str  # YYYY-MM-DD
+    end_date: str    # YYYY-MM-DD
+    scope: DigestScope = DigestScope.INDIVIDUAL_RADIOLOGIST
+    digest_period: Optional[DigestPeriod] = None
+    modality_filter: Optional[List[str]] = None
+    body_region_filter: Optional[List[str]] = None
+    max_cases: int = 10
+    include_qc_only: bool = False
+    language_code: str = "en"
+    include_raw_snippets: bool = False
+
+
+class LearningCaseSnippet(RadBaseModel):
+    """A single case summary in the digest."""
+    event_id: str
+    exam_metadata: ExamMetadata
+    event_type: LearningEventType
+    severity: DiscrepancySeverity
+    tags: Tuple[str, ...]
+    short_description: str
+    key_lesson: str
+    report_snippet_before: Optional[str] = None
+    report_snippet_after: Optional[str] = None
+
+    # Frozen only to block mutation: exam_metadata is a mutable model, so
+    # instances are not hashable
+    model_config = ConfigDict(frozen=True)
+
+
+class LearningTheme(RadBaseModel):
+    """A theme or pattern identified in the events."""
+    theme_id: str
+    name: str
+    description: str
+    event_ids: Tuple[str, ...]
+    suggested_actions: Tuple[str, ...]
+
+    # Frozen with tuple fields, so themes are hashable
+    model_config = ConfigDict(frozen=True)
+
+
+class LearningStats(RadBaseModel):
+    """Statistics for the digest period."""
+    num_total_events: int
+    num_critical: int
+    num_major: int
+    num_minor: int
+    num_addenda: int
+    num_peer_review_discrepancies: int
+    num_cases_in_digest: int
+
+
+class RadiologistLearningDigestResponse(RadBaseModel):
+    """The final structured learning digest."""
+    version: str = "v1"
+    radiologist_id: str
+    start_date: str
+    end_date: str
+    language_code: str
+    summary_text: str
+    key_themes: List[LearningTheme]
+    cases: List[LearningCaseSnippet]
+    stats: LearningStats
+    generation_metadata: Dict[str, Any]
@@ -0,0 +1,87 @@
+"""Models for Agent 8: Study Finalization Orchestrator."""
+
+from enum import Enum
+from typing import Optional, List, Dict, Any
+from pydantic import Field
+
+from .base import RadBaseModel
+from .agent1_report_draft import ClinicalContext, ReportDraft
+from .agent2_cv_highlight import CVHighlightResult
+from .agent3_followup import ExamMetadata, FollowUpExtractionResponse
+from .agent4_report_qa import ReportQAResponse
+from .agent5_patient_explainer import PatientReportSummaryResponse
+
+
+class StudyPipelineStage(str, Enum):
+    CV_ANALYSIS = "CV_ANALYSIS"
+    REPORT_DRAFT = "REPORT_DRAFT"
+    QA_REVIEW = "QA_REVIEW"
+    FOLLOWUP_EXTRACTION = "FOLLOWUP_EXTRACTION"
+    PATIENT_SUMMARY = "PATIENT_SUMMARY"
+
+
+class StageStatus(str, Enum):
+    NOT_RUN = "NOT_RUN"
+    SUCCESS = "SUCCESS"
+    SKIPPED = "SKIPPED"
+    FAILED = "FAILED"
+
+
+class PipelineStatus(str, Enum):
+    SUCCESS = "SUCCESS"
+    PARTIAL_SUCCESS = "PARTIAL_SUCCESS"
+    FAILED = "FAILED"
+
+
+class PipelineOptions(RadBaseModel):
+    """Configuration for the orchestration pipeline."""
+    run_cv_analysis: bool = True
+    run_qa_review: bool = True
+    run_followup_extraction: bool = True
+    run_patient_summary: bool = True
+    max_stage_timeout_seconds: Optional[int] = None
+
+
+class StudyOrchestrationRequest(RadBaseModel):
+    """Request to orchestrate the entire study workflow."""
+    study_id: str
+    exam_metadata: ExamMetadata
+    clinical_context: ClinicalContext
+    image_references: Optional[List[Dict[str, Any]]] = None
+    prior_report_text: Optional[str] = None
+    radiologist_id: Optional[str] = None
+    pipeline_options: PipelineOptions = Field(default_factory=PipelineOptions)
+    language_code: str = "en"
+    dry_run: bool = False
+
+
+class StageResult(RadBaseModel):
+    """Result of a single pipeline stage."""
+    stage: StudyPipelineStage
+    status: StageStatus
+    error: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class StudyBundle(RadBaseModel):
+    """Aggregated results from all agents."""
+    study_id: str
+    exam_metadata: ExamMetadata
+    cv_analysis: Optional[CVHighlightResult] = None
+    report_draft: Optional[ReportDraft] = None
+    qa_result: Optional[ReportQAResponse] = None
+    final_report_text: Optional[str] = None
+    followup_data: Optional[FollowUpExtractionResponse] = None
+    patient_summary: Optional[PatientReportSummaryResponse] = None
+
+
+class StudyOrchestrationResponse(RadBaseModel):
+    """Final response from the orchestrator."""
+    version: str = "v1"
+    pipeline_status: PipelineStatus
+    study_id: str
+    bundle: StudyBundle
+    stages: List[StageResult]
+    generation_metadata: Dict[str, Any]
@@ -0,0 +1,25 @@
+"""Shared base class for the API models."""
+
+from functools import lru_cache
+from typing import Dict, Any
+from pydantic import BaseModel, ConfigDict
+
+
+
+class RadBaseModel(BaseModel):
+    """Base class for the models in this package."""
+
+    # Nested model instances (e.g. the ExamMetadata the orchestrator hands to
+    # every stage's request) are kept by reference, not re-validated. This is
+    # Pydantic's default; it is pinned here because the pipeline relies on it.
+    model_config = ConfigDict(revalidate_instances="never")
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def cached_json_schema(cls) -> Dict[str, Any]:
+        """
+        `model_json_schema()` built once per class. The schema is generated
+        from scratch on every call, so callers that need it repeatedly use
+        this instead. The returned dict is shared: do not mutate it.
+        """
+        return cls.model_json_schema()
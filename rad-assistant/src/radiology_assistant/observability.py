@@ -7,6 +7,7 @@ Sets up:
 3. Custom application-level metrics (LLM call counters, agent timings, errors)
 """
 
+import inspect
 import logging
 import time
 from functools import wraps
@@ -19,6 +20,13 @@ try:
 except ImportError:
     _HAS_JSON_LOGGER = False
 
+# python-json-logger >= 3.1 ships an orjson-backed formatter (needs orjson)
+try:
+    from pythonjsonlogger.orjson import OrjsonFormatter
+    _HAS_ORJSON_LOGGER = True
+except ImportError:
+    _HAS_ORJSON_LOGGER = False
+
 try:
     from prometheus_fastapi_instrumentator import Instrumentator
     from prometheus_client import Counter, Histogram, Gauge
@@ -32,30 +40,42 @@ from .config import Config
 # Structured JSON Logging
 # ---------------------------------------------------------------------------
 
+# The JSON handler installed by setup_logging, shared by repeat calls
+_JSON_HANDLER: Optional[logging.Handler] = None
+
+
 def setup_logging(level: Optional[str] = None) -> None:
     """
     Configure structured JSON logging for the entire application.
 
     In development (LOG_LEVEL=DEBUG), falls back to human-readable format
-    if python-json-logger is not installed.
+    if python-json-logger is not installed. Calling it again only updates
+    the level; the handler and formatter are built once.
 
     Args:
         level: Logging level string (e.g. "INFO", "DEBUG"). Defaults to Config.LOG_LEVEL.
     """
+    global _JSON_HANDLER
+
     log_level = getattr(logging, (level or Config.LOG_LEVEL).upper(), logging.INFO)
 
     if _HAS_JSON_LOGGER:
-        handler = logging.StreamHandler()
-        formatter = jsonlogger.JsonFormatter(
-            fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
-            datefmt="%Y-%m-%dT%H:%M:%S",
-        )
-        handler.setFormatter(formatter)
-
         root_logger = logging.getLogger()
-        root_logger.handlers.clear()
-        root_logger.addHandler(handler)
         root_logger.setLevel(log_level)
+        if _JSON_HANDLER is not None and root_logger.handlers == [_JSON_HANDLER]:
+            return  # Already configured
+
+        if _JSON_HANDLER is None:
+            # Same output either way; orjson serializes records several times faster
+            formatter_cls = OrjsonFormatter if _HAS_ORJSON_LOGGER else jsonlogger.JsonFormatter
+            _JSON_HANDLER = logging.StreamHandler()
+            _JSON_HANDLER.setFormatter(formatter_cls(
+                fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
+                datefmt="%Y-%m-%dT%H:%M:%S",
+            ))
+
+        root_logger.handlers.clear()
+        root_logger.addHandler(_JSON_HANDLER)
 
         logging.getLogger(__name__).info(
             "Structured JSON logging configured",
@@ -89,7 +109,8 @@ if _HAS_PROMETHEUS:
         "rad_llm_request_duration_seconds",
         "LLM response latency in seconds",
         labelnames=["agent", "provider"],
-        buckets=[0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0],
+        # Roughly log-spaced over typical LLM latencies; +Inf is added automatically
+        buckets=[0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 8.0, 13.0, 21.0, 34.0, 55.0, 90.0],
     )
 
     AGENT_ERRORS_TOTAL = Counter(
@@ -140,34 +161,73 @@ def observe_agent(agent_name: str, provider: str = "gemini") -> Callable:
     """
     Decorator that records LLM call duration and success/failure counts.
 
-    Usage:
+    Works on both sync and async functions; use the same decorator for either:
         @observe_agent("report_drafter")
         def call_llm(...):
             ...
+
+        @observe_agent("report_drafter")
+        async def acall_llm(...):
+            ...
     """
     def decorator(func: Callable) -> Callable:
+        # Without Prometheus there is nothing to record: leave func unwrapped
+        if not _HAS_PROMETHEUS:
+            return func
+
+        # Resolve the labelled children once per decorated function
+        # instead of looking them up on every call
+        total = {
+            status: LLM_REQUEST_TOTAL.labels(agent=agent_name, provider=provider, status=status)
+            for status in ("success", "error")
+        }
+        duration_hist = LLM_REQUEST_DURATION.labels(agent=agent_name, provider=provider)
+        errors = {}  # error type name -> AGENT_ERRORS_TOTAL child
+
+        def record_error(e: Exception) -> None:
+            error_type = type(e).__name__
+            child = errors.get(error_type)
+            if child is None:
+                child = errors[error_type] = AGENT_ERRORS_TOTAL.labels(
+                    agent=agent_name,
+                    error_type=error_type,
+                )
+            child.inc()
+
+        def record_call(status: str, start: int) -> None:
+            duration = (time.perf_counter_ns() - start) * 1e-9
+            total[status].inc()
+            duration_hist.observe(duration)
+            ACTIVE_REQUESTS.dec()
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def awrapper(*args, **kwargs):
+                ACTIVE_REQUESTS.inc()
+                start = time.perf_counter_ns()
+                status = "success"
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    status = "error"
+                    record_error(e)
+                    raise
+                finally:
+                    record_call(status, start)
+            return awrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if not _HAS_PROMETHEUS:
-                return func(*args, **kwargs)
-
             ACTIVE_REQUESTS.inc()
-            start = time.monotonic()
+            start = time.perf_counter_ns()
             status = "success"
             try:
-                result = func(*args, **kwargs)
-                return result
+                return func(*args, **kwargs)
             except Exception as e:
                 status = "error"
-                AGENT_ERRORS_TOTAL.labels(
-                    agent=agent_name,
-                    error_type=type(e).__name__,
-                ).inc()
+                record_error(e)
                 raise
             finally:
-                duration = time.monotonic() - start
-                LLM_REQUEST_TOTAL.labels(agent=agent_name, provider=provider, status=status).inc()
-                LLM_REQUEST_DURATION.labels(agent=agent_name, provider=provider).observe(duration)
-                ACTIVE_REQUESTS.dec()
+                record_call(status, start)
         return wrapper
     return decorator
@@ -11,8 +11,11 @@ tool (e.g., Microsoft Presidio, Stanford DeID, or AWS Comprehend Medical).
 """
 
 import re
+import hashlib
 import logging
 import copy
+import threading
+from collections import OrderedDict
 from typing import Optional
 from dataclasses import dataclass, field
 from pydantic import BaseModel
@@ -24,8 +27,16 @@ logger = logging.getLogger(__name__)
 # PHI Pattern Library
 # ---------------------------------------------------------------------------
 
-# Each pattern is (compiled_regex, replacement_token)
-_PHI_PATTERNS: list[tuple[re.Pattern, str]] = [
+# Trigger meaning "the text contains a digit"
+_DIGIT = None
+_HAS_DIGIT = re.compile(r'\d')
+
+# Each pattern is (compiled_regex, replacement_token, triggers). The pattern
+# can only match text containing one of its triggers (lowercase substrings),
+# or a digit for _DIGIT, so the scrubber skips it otherwise. Triggers avoid
+# the letters 'i' and 's': IGNORECASE also matches 'İ', 'ı' and 'ſ' to them,
+# which str.lower() does not.
+_PHI_PATTERNS: list[tuple[re.Pattern, str, Optional[tuple[str, ...]]]] = [
     # ------- Dates -------
     # Full dates: 01/15/2024, 01-15-2024, Jan 15 2024, January 15, 2024
     (re.compile(
@@ -33,30 +44,33 @@ _PHI_PATTERNS: list[tuple[re.Pattern, str]] = [
         r'Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)'
         r'\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s+\d{4})?\b',
         re.IGNORECASE
-    ), '[DATE]'),
+    ), '[DATE]', _DIGIT),
     # Numeric dates: MM/DD/YYYY, MM-DD-YYYY, YYYY-MM-DD
-    (re.compile(r'\b\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}\b'), '[DATE]'),
-    (re.compile(r'\b\d{4}[/\-]\d{1,2}[/\-]\d{1,2}\b'), '[DATE]'),
+    (re.compile(r'\b\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}\b'), '[DATE]', _DIGIT),
+    (re.compile(r'\b\d{4}[/\-]\d{1,2}[/\-]\d{1,2}\b'), '[DATE]', _DIGIT),
     # DOB / Age when combined with DOB
-    (re.compile(r'\b(?:DOB|D\.O\.B|Date of Birth|date of birth)[:\s]*[\d/\-\.]+', re.IGNORECASE), '[DOB]'),
+    (re.compile(r'\b(?:DOB|D\.O\.B|Date of Birth|date of birth)[:\s]*[\d/\-\.]+', re.IGNORECASE), '[DOB]', ("dob", "d.o.b", "date of b")),
 
     # ------- Patient IDs / MRN / Accession -------
     # MRN pattern (various formats)
-    (re.compile(r'\bMRN[:\s#]*[A-Z0-9\-]{4,20}\b', re.IGNORECASE), '[MRN]'),
+    (re.compile(r'\bMRN[:\s#]*[A-Z0-9\-]{4,20}\b', re.IGNORECASE), '[MRN]', ("mrn",)),
     # Accession numbers (e.g., ACC-20240115-001, XR12345678)
-    (re.compile(r'\b(?:ACC|Accession)[:\s#\-]*[A-Z0-9\-]{4,20}\b', re.IGNORECASE), '[ACCESSION]'),
+    (re.compile(r'\b(?:ACC|Accession)[:\s#\-]*[A-Z0-9\-]{4,20}\b', re.IGNORECASE), '[ACCESSION]', ("acc",)),
     # Patient ID label patterns
-    (re.compile(r'\b(?:Patient\s+ID|Pat\.?\s*ID|Pt\.\s*ID)[:\s]*[A-Z0-9\-]{4,20}\b', re.IGNORECASE), '[PATIENT_ID]'),
+    (re.compile(r'\b(?:Patient\s+ID|Pat\.?\s*ID|Pt\.\s*ID)[:\s]*[A-Z0-9\-]{4,20}\b', re.IGNORECASE), '[PATIENT_ID]', ("pat", "pt")),
 
     # ------- Phone Numbers -------
     # (123) 456-7890, 123-456-7890, 1234567890, +1-123-456-7890
-    (re.compile(r'\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]\d{3}[-.\s]\d{4}\b'), '[PHONE]'),
+    (re.compile(r'\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]\d{3}[-.\s]\d{4}\b'), '[PHONE]', _DIGIT),
 
     # ------- Social Security Numbers -------
-    (re.compile(r'\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b'), '[SSN]'),
+    (re.compile(r'\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b'), '[SSN]', _DIGIT),
 
     # ------- Email Addresses -------
-    (re.compile(r'\b[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\b'), '[EMAIL]'),
+    # The local part is capped at its RFC 5321 limit of 64 characters: with an
+    # unbounded + every word start inside a long '@'-less run ("a.b.c.d...")
+    # was retried to the end of the run, which is quadratic in its length.
+    (re.compile(r'\b[A-Za-z0-9._%+\-]{1,64}@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\b'), '[EMAIL]', ("@",)),
 
     # ------- Physical Addresses -------
     # Street address: 123 Main St, 456 Oak Avenue Apt 7
@@ -64,7 +78,7 @@ _PHI_PATTERNS: list[tuple[re.Pattern, str]] = [
         r'\b\d{1,5}\s+[A-Za-z\s]{2,30}(?:St|St\.|Ave|Ave\.|Blvd|Blvd\.|Dr|Dr\.|Rd|Rd\.|Ln|Ln\.|Way|Ct|Ct\.|Pl)'
         r'(?:\s+(?:Apt|Suite|Ste|Unit|#)\s*\w+)?\b',
         re.IGNORECASE
-    ), '[ADDRESS]'),
+    ), '[ADDRESS]', _DIGIT),
 
     # ------- Names -------
     # "Patient: John Smith", "Referring: Dr. Jane Doe"
@@ -72,8 +86,89 @@ _PHI_PATTERNS: list[tuple[re.Pattern, str]] = [
         r'\b(?:Patient(?:\s+Name)?|Pt\.?|Referring(?:\s+physician)?|Attending'
         r'|Radiologist|Dr\.?|Doctor|Physician)[:\s]+(?:[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\b',
         re.IGNORECASE
-    ), '[PROVIDER_OR_PATIENT]'),
+    ), '[PROVIDER_OR_PATIENT]', ("pat", "pt", "referr", "attend", "olog", "dr", "doct", "phy")),
+]
+
+
+# The same table compiled for bytes, used for pure-ASCII text: byte patterns
+# skip the Unicode character-class and case-folding checks (~1.9x faster).
+# On ASCII input they match identically except that str \s also matches
+# \x1c-\x1f, so text containing those stays on the str path.
+_PHI_PATTERNS_BYTES: list[tuple[re.Pattern, bytes, Optional[tuple[bytes, ...]]]] = [
+    (
+        re.compile(pattern.pattern.encode("ascii"), pattern.flags & ~re.UNICODE),
+        replacement.encode("ascii"),
+        _DIGIT if triggers is _DIGIT else tuple(trigger.encode("ascii") for trigger in triggers),
+    )
+    for pattern, replacement, triggers in _PHI_PATTERNS
 ]
+_HAS_DIGIT_BYTES = re.compile(rb'\d')
+_UNICODE_ONLY_SPACE = re.compile(rb'[\x1c-\x1f]')
+
+
+def _run_patterns(text, patterns, has_digit_re):
+    """Run patterns over text (str or bytes) in order, skipping those that cannot match."""
+    result = text
+    lowered = None  # result.lower(), recomputed after each replacement
+    has_digit = None
+    for pattern, replacement, triggers in patterns:
+        if triggers is _DIGIT:
+            if has_digit is None:
+                has_digit = has_digit_re.search(result) is not None
+            if not has_digit:
+                continue
+        else:
+            if lowered is None:
+                lowered = result.lower()
+            if not any(trigger in lowered for trigger in triggers):
+                continue
+        scrubbed, count = pattern.subn(replacement, result)
+        if count:
+            result, lowered, has_digit = scrubbed, None, None
+    return result
+
+
+def _apply_patterns(text: str) -> str:
+    """Run the PHI patterns over text, on the bytes fast path when it is ASCII."""
+    if text.isascii():
+        data = text.encode("ascii")
+        if not _UNICODE_ONLY_SPACE.search(data):
+            result = _run_patterns(data, _PHI_PATTERNS_BYTES, _HAS_DIGIT_BYTES)
+            return text if result is data else result.decode("ascii")
+    return _run_patterns(text, _PHI_PATTERNS, _HAS_DIGIT)
+
+
+# Short strings (labels, section headers, template boilerplate) recur across
+# and within payloads; longer ones rarely do and would only bloat the cache.
+_SCRUB_CACHE_MAX_CHARS = 2048
+_SCRUB_CACHE_MAX_ENTRIES = 4096
+_scrub_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_scrub_cache_lock = threading.Lock()
+
+
+def _scrub_cached(text: str) -> str:
+    """
+    `_apply_patterns` with an LRU memo keyed on a digest of the text, so the
+    cache never holds raw PHI; only the scrubbed results are kept.
+    """
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    with _scrub_cache_lock:
+        scrubbed = _scrub_cache.get(key)
+        if scrubbed is not None:
+            _scrub_cache.move_to_end(key)
+            return scrubbed
+    scrubbed = _apply_patterns(text)
+    with _scrub_cache_lock:
+        _scrub_cache[key] = scrubbed
+        if len(_scrub_cache) > _SCRUB_CACHE_MAX_ENTRIES:
+            _scrub_cache.popitem(last=False)
+    return scrubbed
+
+
+def clear_scrub_cache() -> None:
+    """Drop memoized scrub results (e.g. between tests)."""
+    with _scrub_cache_lock:
+        _scrub_cache.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -93,13 +188,12 @@ class PHIScrubber:
         # => "Patient: [PROVIDER_OR_PATIENT], DOB: [DOB]"
     """
 
-    def __init__(self):
-        self._patterns = _PHI_PATTERNS
-
     def scrub(self, text: str) -> str:
         """
         Replace PHI tokens in a string with placeholder labels.
 
+        Results for strings shorter than 2048 characters are memoized.
+
         Args:
             text: Raw text that may contain PHI.
 
@@ -108,38 +202,41 @@ class PHIScrubber:
         """
         if not text:
             return text
-        result = text
-        for pattern, replacement in self._patterns:
-            result = pattern.sub(replacement, result)
-        if result != text:
+        if len(text) < _SCRUB_CACHE_MAX_CHARS:
+            result = _scrub_cached(text)
+        else:
+            result = _apply_patterns(text)
+        # Only compare (O(n)) when the message would actually be emitted
+        if logger.isEnabledFor(logging.DEBUG) and result != text:
             logger.debug("PHI scrubber made replacements in text (len_before=%d, len_after=%d)", len(text), len(result))
         return result
 
     def scrub_dict(self, data: dict) -> dict:
         """
-        Recursively scrub all string values in a dictionary.
+        Scrub all string values in a dictionary, at any nesting depth.
         Useful for scrubbing request payloads.
 
         Args:
             data: Dict potentially containing PHI in string values.
 
         Returns:
-            Deep copy of dict with all string values scrubbed.
+            Copy of dict (and of every nested dict/list) with all string values scrubbed.
         """
-        result = {}
-        for key, value in data.items():
-            if isinstance(value, str):
-                result[key] = self.scrub(value)
-            elif isinstance(value, dict):
-                result[key] = self.scrub_dict(value)
-            elif isinstance(value, list):
-                result[key] = [
-                    self.scrub(item) if isinstance(item, str)
-                    else (self.scrub_dict(item) if isinstance(item, dict) else item)
-                    for item in value
-                ]
-            else:
-                result[key] = value
+        # Iterative walk: each container is copied once and its strings are
+        # replaced in place, instead of a recursive call per nested dict
+        result = dict(data)
+        stack = [result]
+        while stack:
+            node = stack.pop()
+            for key, value in (node.items() if isinstance(node, dict) else enumerate(node)):
+                if isinstance(value, str):
+                    node[key] = self.scrub(value)
+                elif isinstance(value, dict):
+                    node[key] = value = dict(value)
+                    stack.append(value)
+                elif isinstance(value, list):
+                    node[key] = value = list(value)
+                    stack.append(value)
         return result
 
 
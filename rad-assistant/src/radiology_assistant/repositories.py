@@ -9,12 +9,13 @@ import json
 import uuid
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional
+from functools import lru_cache
+from typing import Iterator, List, Optional
 
 from sqlalchemy.orm import Session
 
 from .db_models import LearningEventDB, FeedbackEventDB, ReportDB, FollowupReminderDB
-from .models import LearningEvent, LearningEventType, DiscrepancySeverity
+from .models import ExamMetadata, LearningEvent, LearningEventType, DiscrepancySeverity
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,8 @@ class SQLLearningEventRepository:
     Replaces MockLearningEventRepository for production use.
     """
 
+    EVENT_BATCH_SIZE = 500
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -49,24 +52,47 @@ class SQLLearningEventRepository:
         Returns:
             List of LearningEvent Pydantic models.
         """
+        return list(self.iter_events(radiologist_id, start_date, end_date))
+
+    def iter_events(
+        self,
+        radiologist_id: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Iterator[LearningEvent]:
+        """
+        Stream learning events for a radiologist, newest first.
+
+        Rows are fetched in batches of EVENT_BATCH_SIZE (server-side cursor
+        where the driver supports it), so only one batch of ORM rows is held
+        at a time.
+
+        Args:
+            radiologist_id: The radiologist's user ID.
+            start_date: ISO 8601 date string (inclusive). If None, no lower bound.
+            end_date: ISO 8601 date string (inclusive). If None, no upper bound.
+
+        Yields:
+            LearningEvent Pydantic models.
+        """
         query = self.db.query(LearningEventDB).filter(
             LearningEventDB.radiologist_id == radiologist_id
         )
         if start_date:
             try:
-                start_dt = datetime.fromisoformat(start_date).replace(tzinfo=timezone.utc)
+                start_dt = _parse_iso_utc(start_date)
                 query = query.filter(LearningEventDB.timestamp >= start_dt)
             except ValueError:
                 logger.warning("Invalid start_date format: %s", start_date)
         if end_date:
             try:
-                end_dt = datetime.fromisoformat(end_date).replace(tzinfo=timezone.utc)
+                end_dt = _parse_iso_utc(end_date)
                 query = query.filter(LearningEventDB.timestamp <= end_dt)
             except ValueError:
                 logger.warning("Invalid end_date format: %s", end_date)
 
-        rows = query.order_by(LearningEventDB.timestamp.desc()).all()
-        return [_db_to_learning_event(row) for row in rows]
+        for row in query.order_by(LearningEventDB.timestamp.desc()).yield_per(self.EVENT_BATCH_SIZE):
+            yield _db_to_learning_event(row)
 
     def save(self, event: LearningEvent) -> None:
         """
@@ -75,25 +101,7 @@ class SQLLearningEventRepository:
         Args:
             event: The LearningEvent Pydantic model to save.
         """
-        now = datetime.now(timezone.utc)
-        row = LearningEventDB(
-            id=event.event_id or str(uuid.uuid4()),
-            radiologist_id=event.radiologist_id,
-            event_type=event.event_type.value if hasattr(event.event_type, 'value') else str(event.event_type),
-            severity=event.severity.value if hasattr(event.severity, 'value') else str(event.severity),
-            source=getattr(event, 'source', 'system'),
-            modality=event.modality,
-            body_region=event.body_region,
-            report_text_before=event.report_text_before,
-            report_text_after=event.report_text_after,
-            timestamp=event.timestamp if isinstance(event.timestamp, datetime) else now,
-            hour_of_day=(event.timestamp if isinstance(event.timestamp, datetime) else now).hour,
-            day_of_week=(event.timestamp if isinstance(event.timestamp, datetime) else now).weekday(),
-        )
-        row.set_tags(event.tags or [])
-        if event.qa_issues:
-            row.set_qa_issues(event.qa_issues)
-
+        row = LearningEventDB(**_learning_event_to_mapping(event))
         self.db.add(row)
         try:
             self.db.commit()
@@ -103,21 +111,89 @@ class SQLLearningEventRepository:
             logger.exception("Failed to save LearningEvent")
             raise
 
+    def save_many(self, events: List[LearningEvent]) -> None:
+        """
+        Persist several LearningEvents in one bulk INSERT and a single commit.
+
+        Args:
+            events: The LearningEvent Pydantic models to save.
+        """
+        if not events:
+            return
+        mappings = [_learning_event_to_mapping(event) for event in events]
+        try:
+            self.db.bulk_insert_mappings(LearningEventDB, mappings)
+            self.db.commit()
+            logger.debug("Saved %d LearningEvents", len(mappings))
+        except Exception:
+            self.db.rollback()
+            logger.exception("Failed to save LearningEvents")
+            raise
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_utc(value: str) -> datetime:
+    """Parse an ISO 8601 date filter as UTC. Dashboards resend the same few ranges."""
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+def _event_timestamp(value: Optional[str]) -> datetime:
+    """Parse an event's ISO timestamp as UTC, falling back to now if it is missing or invalid."""
+    if value:
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            logger.warning("Invalid LearningEvent timestamp: %s", value)
+        else:
+            if parsed.tzinfo is None:
+                return parsed.replace(tzinfo=timezone.utc)
+            return parsed.astimezone(timezone.utc)
+    return datetime.now(timezone.utc)
+
+
+def _learning_event_to_mapping(event: LearningEvent) -> dict:
+    """Convert a Pydantic LearningEvent to LearningEventDB column values."""
+    timestamp = _event_timestamp(event.timestamp)
+    exam = event.exam_metadata
+    return {
+        "id": event.event_id or str(uuid.uuid4()),
+        "radiologist_id": event.radiologist_id,
+        "event_type": event.event_type.value if hasattr(event.event_type, 'value') else str(event.event_type),
+        "severity": event.severity.value if hasattr(event.severity, 'value') else str(event.severity),
+        "source": getattr(event, 'source', 'system'),
+        "modality": exam.modality,
+        "body_region": exam.body_region,
+        "tags_json": list(event.tags or []),
+        "report_text_before": event.report_text_before,
+        "report_text_after": event.report_text_after,
+        "qa_issues_json": [
+            i.model_dump(mode="json") if hasattr(i, 'model_dump') else i for i in event.qa_issues
+        ] if event.qa_issues else None,
+        "timestamp": timestamp,
+        "hour_of_day": timestamp.hour,
+        "day_of_week": timestamp.weekday(),
+    }
+
+
+# Enum members by stored value: a dict lookup per row instead of an Enum call
+_EVENT_TYPES = {member.value: member for member in LearningEventType}
+_SEVERITIES = {member.value: member for member in DiscrepancySeverity}
+
 
 def _db_to_learning_event(row: LearningEventDB) -> LearningEvent:
     """Convert a DB ORM row back to the Pydantic LearningEvent model."""
     return LearningEvent(
         event_id=row.id,
         radiologist_id=row.radiologist_id,
-        event_type=LearningEventType(row.event_type) if row.event_type else LearningEventType.QA_ISSUE,
-        severity=DiscrepancySeverity(row.severity) if row.severity else DiscrepancySeverity.MINOR,
-        modality=row.modality,
-        body_region=row.body_region,
+        exam_metadata=ExamMetadata(modality=row.modality, body_region=row.body_region),
+        event_type=_EVENT_TYPES[row.event_type] if row.event_type else LearningEventType.QA_ISSUE,
+        severity=_SEVERITIES[row.severity] if row.severity else DiscrepancySeverity.MINOR,
+        source=row.source or "system",
         tags=row.get_tags(),
         report_text_before=row.report_text_before,
         report_text_after=row.report_text_after,
         qa_issues=[],  # Complex nested objects — deserialized on demand if needed
-        timestamp=row.timestamp,
+        timestamp=row.timestamp.isoformat(),
     )
 
 
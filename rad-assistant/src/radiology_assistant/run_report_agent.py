@@ -9,12 +9,12 @@ import json
 import sys
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from radiology_assistant.config import Config
-from radiology_assistant.llm_client import LLMClient
-from radiology_assistant.models import ReportDraftRequest
-from radiology_assistant.agents import ReportDraftingAgent
+# The agent stack (LLM client, HTTP libraries, scrubber) is imported inside
+# the functions that need it, so `--help` returns without loading it
+if TYPE_CHECKING:
+    from radiology_assistant.models import ReportDraftRequest
 
 # Set up logging
 logging.basicConfig(
@@ -24,8 +24,10 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def load_request_from_file(filepath: str) -> ReportDraftRequest:
+def load_request_from_file(filepath: str) -> "ReportDraftRequest":
     """Load a ReportDraftRequest from a JSON file."""
+    from radiology_assistant.models import ReportDraftRequest
+
     with open(filepath, 'r') as f:
         data = json.load(f)
     return ReportDraftRequest(**data)
@@ -56,6 +58,10 @@ def main(request_file: Optional[str] = None):
         
         # Initialize LLM client and agent
         logger.info("Initializing LLM client and agent...")
+        from radiology_assistant.config import Config
+        from radiology_assistant.llm_client import LLMClient
+        from radiology_assistant.agents import ReportDraftingAgent
+
         try:
             Config.validate()
         except ValueError as e:
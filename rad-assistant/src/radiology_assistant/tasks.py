@@ -3,21 +3,40 @@ Celery tasks for the Radiology Assistant.
 """
 
 import logging
+from celery.signals import worker_process_init
 from .celery_app import app as celery_app
 from .models import StudyOrchestrationRequest, StudyOrchestrationResponse
-from .database import SessionLocal
-from .repositories import ReportRepository, SQLLearningEventRepository
 
 logger = logging.getLogger(__name__)
 
 
+@worker_process_init.connect
+def _warm_worker_process(**_kwargs):
+    """
+    Import the API module and build the LLM client and LLM-backed agent
+    singletons once per worker process, so the first task does not pay for
+    them. The CV agent is left to the first task: loading the DenseNet
+    weights here could outlast Celery's worker_proc_alive_timeout and get
+    the child killed. Failures are not fatal: the task retries the
+    initialization and reports the error itself.
+    """
+    try:
+        from . import api
+        api.get_llm_client()
+        api.get_agent()
+        api.get_followup_agent()
+        api.get_report_qa_agent()
+        api.get_patient_explainer_agent()
+    except Exception:
+        logger.exception("Failed to pre-initialize agents in worker")
+
+
 @celery_app.task(bind=True, name="radiology_assistant.tasks.orchestrate_study_task")
 def orchestrate_study_task(self, request_dict: dict):
     """
     Background task to run the full study orchestration pipeline.
     """
-    from .agents.study_orchestrator import StudyOrchestratorAgent
-    from .api import get_orchestrator_agent
+    from .api import get_orchestrator_agent  # already imported by _warm_worker_process
     
     task_id = self.request.id
     logger.info("Starting background orchestration task_id=%s study_id=%s", 
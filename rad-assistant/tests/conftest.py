@@ -1,21 +1,89 @@
-import os
-import sys
-import pytest
+import base64
+from contextlib import asynccontextmanager
+from unittest.mock import Mock
 
-# Ensure src is in path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+import pytest
+from fastapi.testclient import TestClient
 
 from radiology_assistant.api import app
 from radiology_assistant.auth import get_current_user, TokenData, UserRole
+from radiology_assistant.models import (
+    FollowUpExtractionResponse, FollowUpInterval, FollowUpType, IncidentalFinding,
+    IncidentalFindingCategory, RecommendationStrength,
+)
 
 # Mock user for all tests
 mock_user = TokenData(sub="test_user", role=UserRole.RADIOLOGIST)
 
-@pytest.fixture(autouse=True)
-def bypass_auth(monkeypatch):
+@pytest.fixture(autouse=True, scope="session")
+def bypass_auth():
     """
-    Automatically override the get_current_user dependency for all tests.
+    Override the get_current_user dependency once for the whole test session.
     """
     app.dependency_overrides[get_current_user] = lambda: mock_user
     yield
-    app.dependency_overrides = {}
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@asynccontextmanager
+async def _no_lifespan(_app):
+    yield
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    One TestClient for the whole session, entered once so its event loop
+    thread is reused by every request. The app's lifespan (DB init, agent and
+    CV model warm-up) is swapped out: tests patch the agents they call.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(app.router, "lifespan_context", _no_lifespan)
+        with TestClient(app) as c:
+            yield c
+
+
+@pytest.fixture(scope="class")
+def mock_llm_client():
+    """
+    One mock LLM client per test class (reset before each test). Modules that
+    need a differently shaped client define their own `mock_llm_client`.
+    """
+    return Mock()
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_llm_client(request):
+    """Clear per-test return values, side effects and calls on the class-shared client."""
+    if request.cls is not None and "mock_llm_client" in request.fixturenames:
+        request.getfixturevalue("mock_llm_client").reset_mock(return_value=True, side_effect=True)
+
+
+# A 100x100 mid-grey ('L' mode, value 128) PNG
+_DUMMY_PNG_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAGQAAABkCAAAAABVicqIAAAAP0lEQVR42u3NQQ0AAAgEoNPkRjeFDzcoQE3udSQSiUQikUgk"
+    "EolEIpFIJBKJRCKRSCQSiUQikUgkEolEInmfLExRAUgH9lcEAAAAAElFTkSuQmCC"
+)
+
+
+@pytest.fixture(scope="session")
+def dummy_png_bytes():
+    """A 100x100 mid-grey PNG, decoded from a literal instead of encoded with PIL."""
+    return base64.b64decode(_DUMMY_PNG_B64)
+
+
+@pytest.fixture(scope="module")
+def sample_followup_response():
+    """One pulmonary nodule needing 6-month imaging follow-up (treat as read-only)."""
+    return FollowUpExtractionResponse(
+        incidental_findings=[
+            IncidentalFinding(
+                id="IF1", category=IncidentalFindingCategory.pulmonary_nodule,
+                description="nodule", followup_required=True,
+                followup_type=FollowUpType.imaging, recommendation_strength=RecommendationStrength.explicit,
+                verbatim_snippet="nodule",
+                followup_interval=FollowUpInterval(months=6)
+            )
+        ],
+        has_any_followup=True
+    )
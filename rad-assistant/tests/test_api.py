@@ -1,27 +1,52 @@
 import json
-from unittest.mock import Mock
+from unittest.mock import create_autospec
 
-from fastapi.testclient import TestClient
-
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
 
 import radiology_assistant.api as api
-from radiology_assistant.models import ReportDraft
+from radiology_assistant.auth import TokenData, UserRole
+from radiology_assistant.agents import ReportDraftingAgent
+from radiology_assistant.agents.followup_extractor import FollowUpExtractorAgent
+from radiology_assistant.agents.patient_report_explainer import LLMJsonParseError as ExplainerParseError
+from radiology_assistant.agents.patient_report_explainer import PatientReportExplainerAgent
+from radiology_assistant.agents.report_qa_agent import LLMJsonParseError as QAParseError
+from radiology_assistant.agents.report_qa_agent import ReportQAAgent
+from radiology_assistant.agents.visual_highlighter import VisualHighlightingAgent
+from radiology_assistant.agents.worklist_triage import WorklistTriageAgent
+from radiology_assistant.models import (
+    CVHighlightResult, CVRegionHighlight, FollowUpExtractionResponse,
+    PatientReportSummaryResponse, QASummary, RadiologistLearningDigestRequest,
+    ReportDraft, ReportQAResponse,
+    TriageLabel, WorklistTriageItem, WorklistTriageResponse,
+)
+
+
+# Autospecced agent stand-ins, built once: calling a method the real agent
+# does not have (or with the wrong arguments) fails instead of passing silently
+DRAFT_AGENT = create_autospec(ReportDraftingAgent, instance=True)
+CV_AGENT = create_autospec(VisualHighlightingAgent, instance=True)
+FOLLOWUP_AGENT = create_autospec(FollowUpExtractorAgent, instance=True)
+QA_AGENT = create_autospec(ReportQAAgent, instance=True)
+EXPLAINER_AGENT = create_autospec(PatientReportExplainerAgent, instance=True)
+TRIAGE_AGENT = create_autospec(WorklistTriageAgent, instance=True)
+
 
+@pytest.fixture(autouse=True)
+def _reset_agent_mocks():
+    for agent in (DRAFT_AGENT, CV_AGENT, FOLLOWUP_AGENT, QA_AGENT, EXPLAINER_AGENT, TRIAGE_AGENT):
+        agent.reset_mock(return_value=True, side_effect=True)
 
-def test_health_endpoint_returns_ok():
-    client = TestClient(api.app)
+
+def test_health_endpoint_returns_ok(client):
     resp = client.get("/health")
     assert resp.status_code == 200
     data = resp.json()
     assert data.get("status") == "ok"
 
 
-def test_draft_report_endpoint_success(monkeypatch):
+def test_draft_report_endpoint_success(monkeypatch, client):
     # Prepare a mock agent that returns a known ReportDraft
-    mock_agent = Mock()
+    mock_agent = DRAFT_AGENT
     mock_report = ReportDraft(
         report_text="Mock report text...",
         key_findings=[],
@@ -33,8 +58,6 @@ def test_draft_report_endpoint_success(monkeypatch):
     # Patch the module-level _agent so the API uses the mock
     monkeypatch.setattr(api, "_agent", mock_agent)
 
-    client = TestClient(api.app)
-
     payload = {
         "findings": [
             {
@@ -55,19 +78,13 @@ def test_draft_report_endpoint_success(monkeypatch):
 
     resp = client.post("/draft_report", json=payload)
     assert resp.status_code == 200, resp.text
-    data = resp.json()
-    # Ensure response contains the expected keys
-    assert "report_text" in data
-    assert "key_findings" in data
-    assert "used_cv_signals" in data
-    assert "confidence_score" in data
+    # The response body must round-trip to exactly what the agent returned
+    assert ReportDraft.model_validate_json(resp.content) == mock_report
 
 
-def test_cv_highlight_endpoint_success(monkeypatch):
-    from radiology_assistant.models import CVHighlightResult, CVRegionHighlight
-    
+def test_cv_highlight_endpoint_success(monkeypatch, client, dummy_png_bytes):
     # Mock the CV agent
-    mock_agent = Mock()
+    mock_agent = CV_AGENT
     mock_result = CVHighlightResult(
         modality="DX",
         summary="Mock summary",
@@ -81,18 +98,8 @@ def test_cv_highlight_endpoint_success(monkeypatch):
     # Patch the module-level _cv_agent
     monkeypatch.setattr(api, "_cv_agent", mock_agent)
     
-    client = TestClient(api.app)
-    
-    # Create dummy image bytes
-    import io
-    from PIL import Image
-    img = Image.new('L', (100, 100), color=128)
-    buf = io.BytesIO()
-    img.save(buf, format='PNG')
-    image_bytes = buf.getvalue()
-    
     # Send request
-    files = {"file": ("test.png", image_bytes, "image/png")}
+    files = {"file": ("test.png", dummy_png_bytes, "image/png")}
     params = {"modality": "DX"}
     
     resp = client.post("/cv/highlight", params=params, files=files)
@@ -106,35 +113,14 @@ def test_cv_highlight_endpoint_success(monkeypatch):
     assert data["heatmap_png_base64"] == "mockbase64"
 
 
-def test_followup_extraction_endpoint_success(monkeypatch):
-    from radiology_assistant.models import (
-        FollowUpExtractionResponse, IncidentalFinding, IncidentalFindingCategory, 
-        FollowUpType, RecommendationStrength
-    )
-    
+def test_followup_extraction_endpoint_success(monkeypatch, client, sample_followup_response):
     # Mock the follow-up agent
-    mock_agent = Mock()
-    mock_response = FollowUpExtractionResponse(
-        incidental_findings=[
-            IncidentalFinding(
-                id="IF1",
-                description="Test nodule",
-                verbatim_snippet="snippet",
-                category=IncidentalFindingCategory.pulmonary_nodule,
-                followup_required=True,
-                followup_type=FollowUpType.imaging,
-                recommendation_strength=RecommendationStrength.explicit
-            )
-        ],
-        has_any_followup=True
-    )
-    mock_agent.extract_followups.return_value = mock_response
+    mock_agent = FOLLOWUP_AGENT
+    mock_agent.extract_followups.return_value = sample_followup_response
     
     # Patch the module-level _followup_agent
     monkeypatch.setattr(api, "_followup_agent", mock_agent)
     
-    client = TestClient(api.app)
-    
     payload = {
         "exam_metadata": {"modality": "CT"},
         "report_text": "Sample report text"
@@ -142,18 +128,20 @@ def test_followup_extraction_endpoint_success(monkeypatch):
     
     resp = client.post("/v1/reports/extract_followups", json=payload)
     assert resp.status_code == 200, resp.text
-    data = resp.json()
-    
-    assert data["has_any_followup"] is True
-    assert len(data["incidental_findings"]) == 1
-    assert data["incidental_findings"][0]["id"] == "IF1"
+    assert FollowUpExtractionResponse.model_validate_json(resp.content) == sample_followup_response
 
 
-def test_report_qa_endpoint_success(monkeypatch):
-    from radiology_assistant.models import (
-        ReportQAResponse, QASummary
-    )
-    
+def _mock_agent_method(agent, method, outcome):
+    """Make agent.method return outcome, or raise it if it is an exception."""
+    if isinstance(outcome, Exception):
+        getattr(agent, method).side_effect = outcome
+    else:
+        getattr(agent, method).return_value = outcome
+    return agent
+
+
+@pytest.mark.parametrize("parse_error, status", [(False, 200), (True, 502)])
+def test_report_qa_endpoint(monkeypatch, client, parse_error, status):
     msg = ReportQAResponse(
         original_report_text="text",
         issues=[],
@@ -163,43 +151,24 @@ def test_report_qa_endpoint_success(monkeypatch):
             comments="None"
         )
     )
+    outcome = QAParseError("fail") if parse_error else msg
     
-    mock_agent = Mock()
-    mock_agent.review_report.return_value = msg
+    monkeypatch.setattr(api, "_qa_agent", _mock_agent_method(QA_AGENT, "review_report", outcome))
     
-    monkeypatch.setattr(api, "_qa_agent", mock_agent)
-    
-    client = TestClient(api.app)
     resp = client.post("/v1/reports/qa", json={
         "exam_metadata": {"modality": "XR"},
         "report_text": "Sample"
     })
     
-    assert resp.status_code == 200
-    data = resp.json()
-    assert data["summary"]["overall_quality"] == "good"
-
-def test_report_qa_parse_error_502(monkeypatch):
-    from radiology_assistant.agents.report_qa_agent import LLMJsonParseError
-    
-    mock_agent = Mock()
-    mock_agent.review_report.side_effect = LLMJsonParseError("fail")
-    
-    monkeypatch.setattr(api, "_qa_agent", mock_agent)
-    
-    client = TestClient(api.app)
-    resp = client.post("/v1/reports/qa", json={
-        "exam_metadata": {"modality": "XR"},
-        "report_text": "Sample"
-    })
-    
-    assert resp.status_code == 502
-    assert "Failed to parse" in resp.json()["detail"]
+    assert resp.status_code == status
+    if parse_error:
+        assert "Failed to parse" in resp.json()["detail"]
+    else:
+        assert ReportQAResponse.model_validate_json(resp.content) == msg
 
 
-def test_patient_summary_endpoint_success(monkeypatch):
-    from radiology_assistant.models import PatientReportSummaryResponse
-    
+@pytest.mark.parametrize("parse_error, status", [(False, 200), (True, 502)])
+def test_patient_summary_endpoint(monkeypatch, client, parse_error, status):
     msg = PatientReportSummaryResponse(
         version="v1",
         patient_summary_text="Summary",
@@ -208,13 +177,10 @@ def test_patient_summary_endpoint_success(monkeypatch):
         glossary=[],
         original_report_text="orig"
     )
+    outcome = ExplainerParseError("fail") if parse_error else msg
     
-    mock_agent = Mock()
-    mock_agent.explain.return_value = msg
-    
-    monkeypatch.setattr(api, "_patient_explainer_agent", mock_agent)
+    monkeypatch.setattr(api, "_patient_explainer_agent", _mock_agent_method(EXPLAINER_AGENT, "explain", outcome))
     
-    client = TestClient(api.app)
     resp = client.post("/v1/reports/patient_summary", json={
         "exam_metadata": {"modality": "XR"},
         "report_text": "Sample",
@@ -222,33 +188,13 @@ def test_patient_summary_endpoint_success(monkeypatch):
         "tone": "neutral"
     })
     
-    assert resp.status_code == 200
-    data = resp.json()
-    assert data["patient_summary_text"] == "Summary"
-
-def test_patient_summary_error_502(monkeypatch):
-    from radiology_assistant.agents.patient_report_explainer import LLMJsonParseError
-    
-    mock_agent = Mock()
-    mock_agent.explain.side_effect = LLMJsonParseError("fail")
-    
-    monkeypatch.setattr(api, "_patient_explainer_agent", mock_agent)
-    
-    client = TestClient(api.app)
-    resp = client.post("/v1/reports/patient_summary", json={
-        "exam_metadata": {"modality": "XR"},
-        "report_text": "Sample"
-    })
-    
-    assert resp.status_code == 502
+    assert resp.status_code == status
+    if not parse_error:
+        assert PatientReportSummaryResponse.model_validate_json(resp.content) == msg
 
 
-def test_worklist_triage_endpoint_success(monkeypatch):
-    from radiology_assistant.models import (
-        WorklistTriageResponse, WorklistTriageItem, TriageLabel
-    )
-    
-    mock_agent = Mock()
+def test_worklist_triage_endpoint_success(monkeypatch, client):
+    mock_agent = TRIAGE_AGENT
     mock_agent.triage.return_value = WorklistTriageResponse(
         version="v1",
         items=[
@@ -264,7 +210,6 @@ def test_worklist_triage_endpoint_success(monkeypatch):
     
     monkeypatch.setattr(api, "_triage_agent", mock_agent)
     
-    client = TestClient(api.app)
     # The actual payload sent to the API
     resp = client.post("/v1/worklist/triage", json={
         "worklist_items": [
@@ -277,20 +222,14 @@ def test_worklist_triage_endpoint_success(monkeypatch):
     })
     
     assert resp.status_code == 200, resp.text
-    data = resp.json()
-    assert data["version"] == "v1"
-    assert len(data["items"]) == 1
-    assert data["items"][0]["study_id"] == "123"
-    assert data["items"][0]["triage_label"] == "CRITICAL"
+    parsed = WorklistTriageResponse.model_validate_json(resp.content)
+    assert parsed == mock_agent.triage.return_value
+    assert parsed.items[0].triage_label is TriageLabel.CRITICAL
 
 
-def test_learning_digest_endpoint(monkeypatch):
-    from radiology_assistant.models import RadiologistLearningDigestRequest
-    
+def test_learning_digest_endpoint(monkeypatch, client):
     # We don't need to patch _learning_agent because api.py mocks the repo by default
     # But let's act as a client
-    client = TestClient(api.app)
-    
     req = RadiologistLearningDigestRequest(
         radiologist_id="rad_123",
         start_date="2023-01-01",
@@ -305,3 +244,40 @@ def test_learning_digest_endpoint(monkeypatch):
     assert "No significant learning events" in data["summary_text"]
     assert data["version"] == "v1"
 
+
+def test_worklist_triage_requires_auth_before_reading_body(monkeypatch, client):
+    monkeypatch.delitem(api.app.dependency_overrides, api.get_current_user)
+    resp = client.post("/v1/worklist/triage", json={"worklist_items": [{"study_id": "123"}]})
+    assert resp.status_code == 401
+
+
+def test_worklist_triage_rejects_invalid_body_with_422(client):
+    resp = client.post("/v1/worklist/triage", json={"worklist_items": [{"study_id": "123"}]})
+
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["loc"] == ["body", "worklist_items", 0, "modality"]
+    schema = api.app.openapi()["paths"]["/v1/worklist/triage"]["post"]["requestBody"]["content"]["application/json"]["schema"]
+    assert "modality" in schema["properties"]["worklist_items"]["items"]["properties"]
+
+
+def test_update_triage_config_validates_body_and_keeps_file_mode(monkeypatch, client, tmp_path):
+    config_path = tmp_path / "triage_config.yaml"
+    config_path.write_text("thresholds: []\n")
+    config_path.chmod(0o644)
+    monkeypatch.setattr(api, "TRIAGE_CONFIG_PATH", str(config_path))
+    monkeypatch.setattr(api, "_triage_agent", None)
+    # The role check runs before the body is read
+    assert client.put("/v1/admin/triage_config", json={"thresholds": 1}).status_code == 403
+    monkeypatch.setitem(api.app.dependency_overrides, api.get_current_user, lambda: TokenData(sub="admin", role=UserRole.ADMIN))
+
+    resp = client.put("/v1/admin/triage_config", json={"thresholds": [{"modality_group": "PET"}]})
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["loc"] == ["body", "thresholds", 0, "modality_group"]
+
+    resp = client.put("/v1/admin/triage_config", json={"thresholds": [{"modality_group": "CT"}]})
+    assert resp.status_code == 200, resp.text
+    assert json.loads(config_path.read_text())["thresholds"][0]["modality_group"] == "CT"
+    assert config_path.stat().st_mode & 0o777 == 0o644
+
+    schema = api.app.openapi()["paths"]["/v1/admin/triage_config"]["put"]["requestBody"]["content"]["application/json"]["schema"]
+    assert "thresholds" in schema["properties"]
@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+import radiology_assistant.auth as auth_module
+from radiology_assistant.auth import UserRole, create_access_token, decode_token
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    auth_module._token_cache.clear()
+    yield
+    auth_module._token_cache.clear()
+
+
+def test_decode_token_verifies_each_token_once(monkeypatch):
+    token = create_access_token("dr_smith", UserRole.RADIOLOGIST)
+    calls = []
+    real_decode = auth_module.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(1)
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth_module.jwt, "decode", counting_decode)
+
+    first = decode_token(token)
+    second = decode_token(token)
+
+    assert (first.sub, first.role) == ("dr_smith", UserRole.RADIOLOGIST)
+    assert second == first
+    assert len(calls) == 1
+
+
+def test_decode_token_rejects_expired_token_even_if_cached(monkeypatch):
+    token = create_access_token("dr_smith", UserRole.RADIOLOGIST, expires_delta=timedelta(seconds=30))
+    decode_token(token)
+    (key,) = auth_module._token_cache
+    exp, data = auth_module._token_cache[key]
+    auth_module._token_cache[key] = (exp - 60, data)
+
+    def expired(*args, **kwargs):
+        raise auth_module.JWTError("Signature has expired.")
+
+    monkeypatch.setattr(auth_module.jwt, "decode", expired)
+    with pytest.raises(HTTPException):
+        decode_token(token)
@@ -0,0 +1,17 @@
+from kombu.serialization import dumps, loads, prepare_accept_content
+
+from radiology_assistant.celery_app import app
+from radiology_assistant.models import PipelineStatus
+
+
+def test_task_payloads_round_trip_through_configured_serializer():
+    payload = {"study_id": "s1", "pipeline_status": PipelineStatus.SUCCESS, "stages": [1, 2]}
+    content_type, encoding, body = dumps(payload, serializer=app.conf.task_serializer)
+    accept = prepare_accept_content(app.conf.accept_content)
+
+    assert loads(body, content_type, encoding, accept=accept) == {
+        "study_id": "s1", "pipeline_status": "SUCCESS", "stages": [1, 2],
+    }
+    # Messages encoded with plain json are still accepted
+    content_type, encoding, body = dumps(payload, serializer="json")
+    assert loads(body, content_type, encoding, accept=accept)["pipeline_status"] == "SUCCESS"
@@ -0,0 +1,41 @@
+import os
+import radiology_assistant.config as config_module
+from radiology_assistant.config import Config
+
+_YAML = """
+max_batch_size: {batch}
+thresholds:
+  - modality_group: XR
+    body_region: Chest
+    critical_threshold: 0.9
+    high_threshold: 0.7
+    low_threshold: 0.3
+"""
+
+def test_triage_config_cached_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "triage_config.yaml"
+    path.write_text(_YAML.format(batch=7))
+    monkeypatch.setattr(config_module, "TRIAGE_CONFIG_PATH", str(path))
+
+    first = Config.get_triage_config()
+    assert first.max_batch_size == 7
+    assert Config.get_triage_config() is first
+
+    path.write_text(_YAML.format(batch=12))
+    os.utime(path, ns=(0, 123456789))
+    assert Config.get_triage_config().max_batch_size == 12
+
+def test_triage_config_missing_file_falls_back(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_module, "TRIAGE_CONFIG_PATH", str(tmp_path / "missing.yaml"))
+
+    cfg = Config.get_triage_config()
+
+    assert cfg.max_batch_size == 10
+    assert "XR/Chest" in cfg.model_mapping
+
+def test_config_dict_is_cached_and_masks_key():
+    first = Config.get_config_dict()
+
+    assert Config.get_config_dict() is first
+    assert first["gemini_api_key"] in ("***", None)
+    assert "llm_provider" in first
@@ -0,0 +1,19 @@
+import threading
+from radiology_assistant.cv.buffers import scratch_uint8
+
+def test_scratch_buffer_reused_per_slot_and_shape():
+    a = scratch_uint8("test", (4, 4))
+    assert scratch_uint8("test", (4, 4)) is a
+    assert scratch_uint8("other", (4, 4)) is not a
+
+    b = scratch_uint8("test", (8, 8))
+    assert b.shape == (8, 8)
+    assert scratch_uint8("test", (8, 8)) is b
+
+def test_scratch_buffer_is_per_thread():
+    main = scratch_uint8("thread", (2, 2))
+    seen = []
+    t = threading.Thread(target=lambda: seen.append(scratch_uint8("thread", (2, 2))))
+    t.start()
+    t.join()
+    assert seen[0] is not main
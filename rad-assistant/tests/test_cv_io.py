@@ -1,17 +1,10 @@
 import io
 import pytest
 import numpy as np
-from PIL import Image
-from radiology_assistant.cv.io import load_image_from_bytes, InvalidDICOMError, load_dicom_from_bytes
+from radiology_assistant.cv.io import load_image_from_bytes, InvalidDICOMError, load_dicom_from_bytes, apply_windowing
 
-def test_load_image_from_bytes_png():
-    # Create a dummy PNG
-    img = Image.new('L', (100, 100), color=128)
-    buf = io.BytesIO()
-    img.save(buf, format='PNG')
-    data = buf.getvalue()
-
-    loaded = load_image_from_bytes(data)
+def test_load_image_from_bytes_png(dummy_png_bytes):
+    loaded = load_image_from_bytes(dummy_png_bytes)
     assert isinstance(loaded, np.ndarray)
     assert loaded.shape == (100, 100)
     assert loaded.dtype == np.float32
@@ -25,3 +18,120 @@ def test_load_dicom_from_bytes_invalid():
     # Just test that it raises InvalidDICOMError on garbage
     with pytest.raises(InvalidDICOMError):
         load_dicom_from_bytes(b"not a dicom")
+
+def test_apply_windowing_maps_window_to_uint8():
+    image = np.array([[-200.0, 0.0], [40.0, 500.0]], dtype=np.float32)
+    original = image.copy()
+
+    windowed = apply_windowing(image, center=40.0, width=400.0)
+
+    assert windowed.dtype == np.uint8
+    assert windowed[0, 0] == 0
+    assert windowed[1, 1] == 255
+    assert windowed[1, 0] == 127
+    # Input must not be modified
+    assert np.array_equal(image, original)
+
+    out = np.empty(image.shape, dtype=np.uint8)
+    assert apply_windowing(image, 40.0, 400.0, out=out) is out
+    assert np.array_equal(out, windowed)
+
+def _make_dicom_bytes(**extra):
+    from pydicom.dataset import Dataset, FileMetaDataset
+    from pydicom.uid import ExplicitVRLittleEndian, generate_uid
+
+    meta = FileMetaDataset()
+    meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.1"
+    meta.MediaStorageSOPInstanceUID = generate_uid()
+    meta.TransferSyntaxUID = ExplicitVRLittleEndian
+
+    ds = Dataset()
+    ds.file_meta = meta
+    ds.AccessionNumber = "ACC123"
+    ds.Modality = "CR"
+    ds.PatientSex = "F"
+    ds.Rows = 4
+    ds.Columns = 4
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.BitsAllocated = 16
+    ds.BitsStored = 16
+    ds.HighBit = 15
+    ds.PixelRepresentation = 0
+    ds.PixelData = np.arange(16, dtype=np.uint16).reshape(4, 4).tobytes()
+    for keyword, value in extra.items():
+        setattr(ds, keyword, value)
+
+    buf = io.BytesIO()
+    ds.save_as(buf, enforce_file_format=True)
+    return buf.getvalue()
+
+def test_load_dicom_with_metadata_parses_once(monkeypatch):
+    import pydicom
+    from radiology_assistant.cv.io import load_dicom_with_metadata
+
+    data = _make_dicom_bytes()
+    calls = []
+    real_dcmread = pydicom.dcmread
+
+    def counting_dcmread(*args, **kwargs):
+        calls.append(1)
+        return real_dcmread(*args, **kwargs)
+
+    monkeypatch.setattr(pydicom, "dcmread", counting_dcmread)
+
+    image, metadata = load_dicom_with_metadata(data)
+
+    assert len(calls) == 1
+    assert image.shape == (4, 4)
+    assert image.dtype == np.float32
+    assert metadata["accession"] == "ACC123"
+    assert metadata["modality"] == "CR"
+
+def test_load_dicom_metadata_only_skips_pixels():
+    from radiology_assistant.cv.io import load_dicom_metadata_only
+
+    metadata = load_dicom_metadata_only(_make_dicom_bytes())
+
+    assert metadata["accession"] == "ACC123"
+    assert metadata["modality"] == "CR"
+    assert metadata["patient_sex"] == "F"
+
+def test_load_dicom_metadata_only_invalid():
+    from radiology_assistant.cv.io import load_dicom_metadata_only
+
+    with pytest.raises(InvalidDICOMError):
+        load_dicom_metadata_only(b"not a dicom")
+
+def test_load_dicom_metadata_only_specific_tags():
+    from radiology_assistant.cv.io import load_dicom_metadata_only
+
+    metadata = load_dicom_metadata_only(_make_dicom_bytes(), specific_tags=["Modality"])
+
+    assert metadata["modality"] == "CR"
+    assert metadata["accession"] is None
+    assert metadata["photometric_interpretation"] == "MONOCHROME2"
+
+def test_load_dicom_applies_rescale():
+    data = _make_dicom_bytes(RescaleSlope="2", RescaleIntercept="-1024")
+
+    image = load_dicom_from_bytes(data, apply_dicom_windowing=False)
+
+    expected = np.arange(16, dtype=np.float32).reshape(4, 4) * 2 - 1024
+    assert image.dtype == np.float32
+    assert np.array_equal(image, expected)
+
+def test_load_dicom_batch_preserves_order():
+    from radiology_assistant.cv.io import load_dicom_batch
+
+    data = [
+        _make_dicom_bytes(RescaleSlope="1", RescaleIntercept=str(offset))
+        for offset in (0, 100, 200)
+    ]
+
+    images = load_dicom_batch(data, apply_dicom_windowing=False)
+
+    assert [float(img[0, 0]) for img in images] == [0.0, 100.0, 200.0]
+
+    with pytest.raises(InvalidDICOMError):
+        load_dicom_batch([data[0], b"not a dicom"])
@@ -0,0 +1,16 @@
+from radiology_assistant.cv.postprocess import regions_to_models
+
+def test_regions_to_models_clamps_and_validates():
+    regions = regions_to_models([
+        {"label": "Effusion", "score": 0.4, "bbox": [1.7, 2, 3, 4]},
+        {"label": "Mass", "score": 1.5, "bbox": [1, 2, 3]},
+        {"score": -0.2},
+        {"label": "Nodule", "score": float("nan")},
+    ])
+
+    assert [r.score for r in regions[:3]] == [0.4, 1.0, 0.0]
+    assert regions[3].score == 1.0
+    assert regions[0].bbox == (1, 2, 3, 4)
+    assert regions[1].bbox is None
+    assert regions[2].label == "unknown"
+    assert regions[0].mask_present is False
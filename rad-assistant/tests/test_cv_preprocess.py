@@ -0,0 +1,22 @@
+import numpy as np
+import torch
+from radiology_assistant.cv.preprocess import preprocess_for_model
+
+def test_preprocess_maps_range_to_xrv():
+    img = np.linspace(0, 255, 100 * 100, dtype=np.float32).reshape(100, 100)
+
+    tensor = preprocess_for_model(img)
+
+    assert isinstance(tensor, torch.Tensor)
+    assert tensor.shape == (1, 1, 224, 224)
+    assert tensor.dtype == torch.float32
+    assert np.isclose(tensor.min().item(), -1024.0, atol=1e-3)
+    assert np.isclose(tensor.max().item(), 1024.0, atol=1e-3)
+
+def test_preprocess_constant_image_is_zero():
+    img = np.full((64, 64), 42.0, dtype=np.float32)
+
+    tensor = preprocess_for_model(img)
+
+    assert tensor.shape == (1, 1, 224, 224)
+    assert torch.count_nonzero(tensor).item() == 0
@@ -0,0 +1,34 @@
+import numpy as np
+from radiology_assistant.cv.visualize import make_heatmap_overlay
+
+def test_overlay_resizes_heatmap_to_image():
+    image = np.linspace(0, 1000, 300 * 200, dtype=np.float32).reshape(300, 200)
+    heatmap = np.random.rand(224, 224).astype(np.float32)
+
+    overlay = make_heatmap_overlay(image, heatmap)
+
+    assert overlay.shape == (300, 200, 3)
+    assert overlay.dtype == np.uint8
+
+def test_overlay_constant_heatmap():
+    image = np.zeros((64, 64), dtype=np.uint8)
+    heatmap = np.ones((32, 32), dtype=np.float32)
+
+    overlay = make_heatmap_overlay(image, heatmap)
+
+    # Constant heatmap maps to the lowest JET color (dark blue) blended at 0.3
+    assert overlay.shape == (64, 64, 3)
+    assert overlay[..., 2].max() == 0
+
+def test_encode_png_base64_roundtrip():
+    import base64
+    import cv2
+    from radiology_assistant.cv.visualize import encode_png_base64
+
+    img = np.zeros((8, 8, 3), dtype=np.uint8)
+    img[..., 0] = 255  # Blue in BGR
+
+    encoded = encode_png_base64(img)
+    decoded = cv2.imdecode(np.frombuffer(base64.b64decode(encoded), np.uint8), cv2.IMREAD_UNCHANGED)
+
+    assert np.array_equal(decoded, img)
@@ -1,10 +1,6 @@
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import MagicMock
 import json
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from radiology_assistant.agents.followup_extractor import FollowUpExtractorAgent
 from radiology_assistant.models import (
@@ -40,12 +36,10 @@ SAMPLE_LLM_RESPONSE = {
     "has_any_followup": True
 }
 
+SAMPLE_LLM_RESPONSE_JSON = json.dumps(SAMPLE_LLM_RESPONSE)
+
 class TestFollowUpExtractorAgent:
     
-    @pytest.fixture
-    def mock_llm_client(self):
-        return Mock()
-
     @pytest.fixture
     def agent(self, mock_llm_client):
         return FollowUpExtractorAgent(llm_client=mock_llm_client)
@@ -62,7 +56,7 @@ class TestFollowUpExtractorAgent:
 
     def test_extract_followups_success(self, agent, mock_llm_client, sample_request):
         # Arrange
-        mock_llm_client.generate.return_value = json.dumps(SAMPLE_LLM_RESPONSE)
+        mock_llm_client.generate.return_value = SAMPLE_LLM_RESPONSE_JSON
         
         # Act
         response = agent.extract_followups(sample_request)
@@ -88,7 +82,7 @@ class TestFollowUpExtractorAgent:
         # Arrange: First call returns garbage, second returns proper JSON
         mock_llm_client.generate.side_effect = [
             "This is not JSON",
-            json.dumps(SAMPLE_LLM_RESPONSE)
+            SAMPLE_LLM_RESPONSE_JSON
         ]
         
         # Act
@@ -0,0 +1,73 @@
+from radiology_assistant.knowledge_base import RadiologyKnowledgeBase
+
+_CHUNKS = [
+    {"id": "a", "title": "Nodule follow-up", "body": "solid nodule 6mm follow-up CT", "tags": ["lung"]},
+    {"id": "b", "title": "Thyroid", "body": "thyroid nodule TI-RADS", "tags": ["thyroid"]},
+    {"id": "c", "title": "Breast", "body": "BI-RADS breast mammography", "tags": ["breast"]},
+    {"id": "d", "title": "Liver", "body": "LI-RADS arterial washout", "tags": ["liver"]},
+]
+
+def test_retrieve_ranks_matching_chunk_first():
+    kb = RadiologyKnowledgeBase(_CHUNKS)
+
+    results = kb.retrieve("thyroid TI-RADS", top_k=2)
+
+    assert results[0].startswith("[Guideline: Thyroid]")
+    assert len(results) == 1  # No other chunk scores above zero
+
+def test_retrieve_no_match_or_empty_query():
+    kb = RadiologyKnowledgeBase(_CHUNKS)
+
+    assert kb.retrieve("zzz unknown") == []
+    assert kb.retrieve("   ") == []
+
+def test_retrieve_respects_top_k():
+    kb = RadiologyKnowledgeBase()
+
+    assert len(kb.retrieve("pulmonary nodule follow-up", top_k=2)) == 2
+
+def test_repeated_query_terms_count_multiple_times():
+    kb = RadiologyKnowledgeBase(_CHUNKS)
+
+    # "breast" repeated outweighs a single "thyroid"
+    results = kb.retrieve("thyroid breast breast", top_k=2)
+
+    assert results[0].startswith("[Guideline: Breast]")
+    assert results[1].startswith("[Guideline: Thyroid]")
+
+def test_tied_scores_keep_document_order():
+    chunks = [
+        {"id": "x", "title": "Other", "body": "unrelated text", "tags": []},
+        {"id": "1", "title": "First", "body": "adrenal washout", "tags": []},
+        {"id": "2", "title": "Second", "body": "adrenal washout", "tags": []},
+        {"id": "3", "title": "Third", "body": "adrenal washout", "tags": []},
+        {"id": "y", "title": "Another", "body": "more unrelated text", "tags": []},
+    ]
+    kb = RadiologyKnowledgeBase(chunks)
+
+    results = kb.retrieve("adrenal washout", top_k=2)
+
+    assert [r.splitlines()[0] for r in results] == ["[Guideline: First]", "[Guideline: Second]"]
+
+def test_get_knowledge_base_is_singleton():
+    from radiology_assistant.knowledge_base import get_knowledge_base
+
+    assert get_knowledge_base() is get_knowledge_base()
+
+def test_retrieve_caches_normalized_queries():
+    kb = RadiologyKnowledgeBase()
+    first = kb.retrieve("Adrenal Washout ", top_k=2)
+    second = kb.retrieve("adrenal washout", top_k=2)
+    assert first == second
+    assert first is not second
+    assert kb._retrieve_cached.cache_info().hits == 1
+
+def test_bm25_prefers_shorter_doc():
+    chunks = [
+        {"id": "long", "title": "Long", "body": "washout " + "filler " * 20, "tags": []},
+        {"id": "short", "title": "Short", "body": "washout", "tags": []},
+        {"id": "y", "title": "Nodule", "body": "nodule lesion", "tags": []},
+        {"id": "x", "title": "Other", "body": "unrelated text", "tags": []},
+    ]
+    kb = RadiologyKnowledgeBase(chunks)
+    assert kb.retrieve("washout", top_k=1)[0].startswith("[Guideline: Short]")
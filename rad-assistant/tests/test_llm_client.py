@@ -0,0 +1,314 @@
+import asyncio
+import gzip
+import io
+import json
+
+import httpx
+import pytest
+import requests
+
+import radiology_assistant.llm_client as llm_client_module
+from radiology_assistant import phi_scrubber
+from radiology_assistant.llm_client import LLMClient
+
+
+@pytest.fixture(autouse=True)
+def _reset_circuit():
+    llm_client_module._BREAKERS.clear()
+    yield
+    llm_client_module._BREAKERS.clear()
+
+
+def _gemini_echo(request: httpx.Request) -> httpx.Response:
+    body = request.content
+    if request.headers.get("content-encoding") == "gzip":
+        body = gzip.decompress(body)
+    prompt = json.loads(body)["contents"][0]["parts"][0]["text"]
+    text = f'Here you go: {{"echo": "{prompt}"}}'
+    return httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": text}]}}]})
+
+
+def test_agenerate_runs_concurrently_and_parses_json():
+    client = LLMClient(api_key="test-key", scrub_phi=False)
+    client._aclient = httpx.AsyncClient(transport=httpx.MockTransport(_gemini_echo))
+
+    async def run():
+        texts = await asyncio.gather(*(client.agenerate(f"p{i}") for i in range(3)))
+        parsed = await client.agenerate_json("q")
+        await client.aclose()
+        return texts, parsed
+
+    texts, parsed = asyncio.run(run())
+    assert texts == [f'Here you go: {{"echo": "p{i}"}}' for i in range(3)]
+    assert parsed == {"echo": "q"}
+    assert client._aclient is None
+
+
+def test_agenerate_raises_on_api_error():
+    client = LLMClient(api_key="test-key", scrub_phi=False)
+    client._aclient = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(400, text="bad request"))
+    )
+
+    with pytest.raises(ValueError, match="Gemini API error 400"):
+        asyncio.run(client.agenerate("p"))
+    assert client._breaker.failures == 1
+
+
+def _streamed_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def test_generate_stream_yields_gemini_sse_chunks(monkeypatch):
+    client = LLMClient(api_key="test-key", scrub_phi=False)
+    events = [
+        {"candidates": [{"content": {"parts": [{"text": "No acute "}]}}]},
+        {"candidates": [{"content": {"parts": [{"text": "findings."}]}}]},
+        {"candidates": [{"content": {"parts": []}, "finishReason": "STOP"}]},
+    ]
+    body = "".join(f"data: {json.dumps(e)}\r\n\r\n" for e in events).encode()
+    calls = []
+
+    def fake_post(**kwargs):
+        calls.append(kwargs)
+        return _streamed_response(body)
+
+    monkeypatch.setattr(client._session, "post", fake_post)
+
+    assert list(client.generate_stream("p")) == ["No acute ", "findings."]
+    assert calls[0]["url"].endswith(":streamGenerateContent?alt=sse")
+    assert calls[0]["stream"] is True
+
+
+def test_large_gemini_bodies_are_gzipped():
+    client = LLMClient(api_key="test-key", scrub_phi=False)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("content-encoding"))
+        return _gemini_echo(request)
+
+    client._aclient = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    long_prompt = "x" * 4096
+
+    async def run():
+        short = await client.agenerate("p")
+        long = await client.agenerate(long_prompt)
+        await client.aclose()
+        return short, long
+
+    short, long = asyncio.run(run())
+    assert seen == [None, "gzip"]
+    assert long.endswith(f'"{long_prompt}"}}')
+
+
+def _json_response(status: int, payload: dict, headers: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload).encode()
+    response.headers.update(headers or {})
+    return response
+
+
+def test_rate_limit_honours_retry_after_then_succeeds(monkeypatch):
+    client = LLMClient(api_key="test-key", scrub_phi=False)
+    ok = {"candidates": [{"content": {"parts": [{"text": "done"}]}}]}
+    responses = iter([_json_response(429, {}, {"Retry-After": "2"}), _json_response(200, ok)])
+    monkeypatch.setattr(client._session, "post", lambda *a, **kw: next(responses))
+    sleeps = []
+    monkeypatch.setattr(llm_client_module.time, "sleep", sleeps.append)
+
+    assert client.generate("p") == "done"
+    assert sleeps == [2.0]
+    assert client._breaker.consecutive_429 == 0
+
+
+def test_repeated_rate_limits_start_a_cooldown(monkeypatch):
+    client = LLMClient(api_key="test-key", scrub_phi=False)
+    monkeypatch.setattr(client._session, "post", lambda *a, **kw: _json_response(429, {}))
+    monkeypatch.setattr(llm_client_module.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(LLMClient, "RATE_LIMIT_THRESHOLD", 3)
+
+    with pytest.raises(RuntimeError, match="failed after"):
+        client.generate("p")
+    with pytest.raises(RuntimeError, match="cooldown"):
+        client.generate("p")
+
+
+def test_deterministic_calls_are_cached(monkeypatch):
+    client = LLMClient(api_key="test-key", scrub_phi=False)
+    ok = {"candidates": [{"content": {"parts": [{"text": "cached"}]}}]}
+    calls = []
+
+    def fake_post(*args, **kwargs):
+        calls.append(kwargs)
+        return _json_response(200, ok)
+
+    monkeypatch.setattr(client._session, "post", fake_post)
+
+    assert client.generate("p", temperature=0.0) == "cached"
+    assert client.generate("p", temperature=0.0) == "cached"
+    assert len(calls) == 1
+
+    client.generate("p", temperature=0.7)
+    client.generate("p", temperature=0.7)
+    assert len(calls) == 3
+
+
+def test_parse_json_extracts_first_object_from_prose():
+    text = 'Here is the result:\n```json\n{"impression": "no {acute} findings", "n": {"x": 1}}\n```\nDone {}.'
+    assert LLMClient._parse_json(text) == {"impression": "no {acute} findings", "n": {"x": 1}}
+    with pytest.raises(json.JSONDecodeError):
+        LLMClient._parse_json("no json here")
+
+
+def test_circuit_breaker_is_per_provider_and_half_opens(monkeypatch):
+    gemini = LLMClient(api_key="test-key", scrub_phi=False)
+    ollama = LLMClient(provider="ollama", scrub_phi=False)
+    monkeypatch.setattr(gemini._session, "post", lambda *a, **kw: _json_response(500, {}))
+
+    for _ in range(LLMClient.CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(ValueError):
+            gemini.generate("p")
+    assert gemini._breaker.open
+    assert not ollama._breaker.open
+
+    with pytest.raises(RuntimeError, match="is open"):
+        gemini._check_circuit()
+
+    # Reset period elapsed: exactly one probe goes through; its failure re-opens
+    gemini._breaker.last_failure -= LLMClient.CIRCUIT_RESET_SECONDS
+    gemini._check_circuit()
+    with pytest.raises(RuntimeError, match="half-open"):
+        gemini._check_circuit()
+    gemini._record_failure()
+    assert gemini._breaker.open and gemini._breaker.probe_started == 0.0
+
+    gemini._breaker.last_failure -= LLMClient.CIRCUIT_RESET_SECONDS
+    gemini._check_circuit()
+    gemini._record_success()
+    assert not gemini._breaker.open
+
+
+def test_scrub_is_memoized_and_skippable(monkeypatch):
+    phi_scrubber.clear_scrub_cache()
+    client = LLMClient(api_key="test-key")
+    ok = {"candidates": [{"content": {"parts": [{"text": "ok"}]}}]}
+    sent = []
+    monkeypatch.setattr(client._session, "post", lambda *a, **kw: sent.append(kw) or _json_response(200, ok))
+    scrubbed = []
+    real_apply = phi_scrubber._apply_patterns
+    monkeypatch.setattr(phi_scrubber, "_apply_patterns", lambda text: scrubbed.append(text) or real_apply(text))
+
+    client.generate("Patient MRN: 12345678", temperature=0.7, system_prompt="sys")
+    client.generate("Patient MRN: 12345678", temperature=0.7, system_prompt="sys")
+    assert scrubbed == ["Patient MRN: 12345678", "sys"]
+    assert b"12345678" not in sent[1]["data"]
+
+    client.generate("already clean", temperature=0.7, already_scrubbed=True)
+    assert len(scrubbed) == 2
+
+
+def test_agenerate_stream_yields_ollama_chunks():
+    client = LLMClient(provider="ollama", scrub_phi=False)
+    lines = [
+        {"message": {"content": "No acute "}, "done": False},
+        {"message": {"content": "findings."}, "done": False},
+        {"message": {"content": ""}, "done": True},
+    ]
+    body = "".join(json.dumps(line) + "\n" for line in lines).encode()
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(json.loads(request.content)["stream"])
+        return httpx.Response(200, content=body)
+
+    client._aclient = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run():
+        chunks = [chunk async for chunk in client.agenerate_stream("p")]
+        await client.aclose()
+        return chunks
+
+    assert asyncio.run(run()) == ["No acute ", "findings."]
+    assert seen == [True]
+
+
+def test_system_prompt_scrub_is_cached_by_identity(monkeypatch):
+    client = LLMClient(api_key="test-key")
+    system_prompt = "You are a radiology assistant. Contact: dr@example.com"
+    hashed = []
+    scrubber_cls = type(client.phi_scrubber)
+    real_scrub = scrubber_cls.scrub
+    monkeypatch.setattr(scrubber_cls, "scrub", lambda self, text: hashed.append(text) or real_scrub(self, text))
+
+    first = client._scrub_system_prompt(system_prompt)
+    assert client._scrub_system_prompt(system_prompt) == first
+    assert hashed == [system_prompt]
+    assert "dr@example.com" not in first
+
+    client.phi_scrubber = type(client.phi_scrubber)()
+    client._scrub_system_prompt(system_prompt)
+    assert len(hashed) == 2
+
+
+def test_service_unavailable_honours_retry_after(monkeypatch):
+    client = LLMClient(api_key="test-key", scrub_phi=False)
+    ok = {"candidates": [{"content": {"parts": [{"text": "done"}]}}]}
+    responses = iter([_json_response(503, {}, {"Retry-After": "3"}), _json_response(200, ok)])
+    monkeypatch.setattr(client._session, "post", lambda *a, **kw: next(responses))
+    sleeps = []
+    monkeypatch.setattr(llm_client_module.time, "sleep", sleeps.append)
+
+    assert client.generate("p") == "done"
+    assert sleeps == [3.0]
+    assert client._breaker.consecutive_429 == 0
+
+
+def test_retry_budget_exhaustion_opens_the_breaker(monkeypatch):
+    client = LLMClient(api_key="test-key", scrub_phi=False)
+    monkeypatch.setattr(client._session, "post", lambda *a, **kw: _json_response(503, {}))
+    monkeypatch.setattr(llm_client_module.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(llm_client_module.Config, "RETRY_BUDGET_PER_MINUTE", 3)
+
+    with pytest.raises(RuntimeError, match="failed after"):
+        client.generate("p")
+    with pytest.raises(RuntimeError, match="retry budget exhausted"):
+        client.generate("p")
+    assert client._breaker.open
+    with pytest.raises(RuntimeError, match="is open"):
+        client.generate("p")
+
+
+def test_ollama_skips_phi_scrubbing_unless_asked(monkeypatch):
+    assert LLMClient(api_key="test-key").scrub_phi
+    assert not LLMClient(provider="ollama").scrub_phi
+    assert LLMClient(provider="ollama", scrub_phi=True).scrub_phi
+
+    monkeypatch.setattr(llm_client_module.Config, "FORCE_PHI_SCRUB_ON_OLLAMA", True)
+    assert LLMClient(provider="ollama").scrub_phi
+
+
+def test_agenerate_scrubs_long_prompts_off_the_event_loop(monkeypatch):
+    client = LLMClient(api_key="test-key")
+    client._aclient = httpx.AsyncClient(transport=httpx.MockTransport(_gemini_echo))
+    offloaded = []
+    real_to_thread = asyncio.to_thread
+
+    async def spy(func, *args):
+        offloaded.append(len(args[0]))
+        return await real_to_thread(func, *args)
+
+    monkeypatch.setattr(llm_client_module.asyncio, "to_thread", spy)
+    long_prompt = "x" * llm_client_module._SCRUB_OFFLOAD_MIN_CHARS
+
+    async def run():
+        await client.agenerate("short")
+        await client.agenerate(long_prompt)
+        await client.aclose()
+
+    asyncio.run(run())
+    assert offloaded == [len(long_prompt)]
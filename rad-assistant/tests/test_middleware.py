@@ -0,0 +1,62 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import radiology_assistant.middleware as middleware_module
+from radiology_assistant.database import Base
+from radiology_assistant.db_models import AuditLogDB
+from radiology_assistant.middleware import AuditLogWriter
+
+
+def _memory_session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def _entry(i):
+    return {"user_id": f"u{i}", "action": "GET", "resource": f"/v1/x/{i}", "status_code": 200}
+
+
+def test_audit_writer_flush_writes_queued_rows_in_batches(monkeypatch):
+    factory = _memory_session_factory()
+    monkeypatch.setattr(middleware_module, "SessionLocal", factory)
+    writer = AuditLogWriter(batch_size=2)
+    monkeypatch.setattr(writer, "_ensure_started", lambda: None)  # flush from this thread only
+
+    for i in range(5):
+        writer.submit(_entry(i))
+    writer.flush()
+
+    with factory() as db:
+        rows = db.query(AuditLogDB).order_by(AuditLogDB.id).all()
+    assert [r.resource for r in rows] == [f"/v1/x/{i}" for i in range(5)]
+
+
+def test_audit_writer_close_writes_rows_held_by_the_thread(monkeypatch):
+    factory = _memory_session_factory()
+    monkeypatch.setattr(middleware_module, "SessionLocal", factory)
+    writer = AuditLogWriter(batch_size=100, flush_interval=60.0)  # thread holds its batch until stopped
+
+    for i in range(3):
+        writer.submit(_entry(i))
+    thread = writer._thread
+    writer.close(timeout=2.0)
+
+    assert not thread.is_alive()
+    with factory() as db:
+        rows = db.query(AuditLogDB).order_by(AuditLogDB.id).all()
+    assert [r.resource for r in rows] == [f"/v1/x/{i}" for i in range(3)]
+
+
+def test_audit_writer_drops_oldest_when_full(monkeypatch):
+    writer = AuditLogWriter(max_queue=2)
+    monkeypatch.setattr(writer, "_ensure_started", lambda: None)
+
+    for i in range(3):
+        writer.submit(_entry(i))
+
+    assert writer.dropped == 1
+    assert [e["user_id"] for e in writer._drain(block=False)] == ["u1", "u2"]
@@ -0,0 +1,22 @@
+import ast
+import inspect
+
+from radiology_assistant import models
+
+
+def test_type_checking_imports_mirror_lazy_exports():
+    tree = ast.parse(inspect.getsource(models))
+    block = next(
+        node for node in tree.body
+        if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING"
+    )
+    imported = {alias.name: node.module for node in block.body for alias in node.names}
+    assert imported == models._NAME_TO_MODULE
+
+
+def test_learning_theme_is_hashable_and_dumps_lists():
+    theme = models.LearningTheme(
+        theme_id="t1", name="Nodules", description="Missed nodules", event_ids=["e1", "e2"], suggested_actions=["Review"],
+    )
+    assert hash(theme) == hash(theme.model_copy())
+    assert theme.model_dump(mode="json")["event_ids"] == ["e1", "e2"]
@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+
+from radiology_assistant.observability import AGENT_ERRORS_TOTAL, LLM_REQUEST_TOTAL, observe_agent
+
+
+def _count(metric, **labels) -> float:
+    return metric.labels(**labels)._value.get()
+
+
+def test_observe_agent_records_async_calls():
+    @observe_agent("test_async_agent")
+    async def call(fail: bool = False):
+        await asyncio.sleep(0)
+        if fail:
+            raise ValueError("boom")
+        return "ok"
+
+    labels = {"agent": "test_async_agent", "provider": "gemini"}
+    assert asyncio.iscoroutinefunction(call)
+    assert asyncio.run(call()) == "ok"
+    with pytest.raises(ValueError):
+        asyncio.run(call(fail=True))
+
+    assert _count(LLM_REQUEST_TOTAL, status="success", **labels) == 1
+    assert _count(LLM_REQUEST_TOTAL, status="error", **labels) == 1
+    assert _count(AGENT_ERRORS_TOTAL, agent="test_async_agent", error_type="ValueError") == 1
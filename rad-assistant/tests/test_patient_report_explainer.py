@@ -1,10 +1,5 @@
 import pytest
-from unittest.mock import Mock
 import json
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from radiology_assistant.agents.patient_report_explainer import (
     PatientReportExplainerAgent, 
@@ -16,12 +11,6 @@ from radiology_assistant.models import (
     ExamMetadata,
     PatientReadingLevel,
     PatientSummaryTone,
-    FollowUpExtractionResponse,
-    IncidentalFinding,
-    IncidentalFindingCategory,
-    FollowUpType,
-    RecommendationStrength,
-    FollowUpInterval
 )
 
 SAMPLE_GOOD_RESPONSE = {
@@ -49,11 +38,10 @@ SAMPLE_WITH_FOLLOWUP = {
     "original_report_text": "Nodule found."
 }
 
-class TestPatientReportExplainerAgent:
+SAMPLE_GOOD_RESPONSE_JSON = json.dumps(SAMPLE_GOOD_RESPONSE)
+SAMPLE_WITH_FOLLOWUP_JSON = json.dumps(SAMPLE_WITH_FOLLOWUP)
 
-    @pytest.fixture
-    def mock_llm_client(self):
-        return Mock()
+class TestPatientReportExplainerAgent:
 
     @pytest.fixture
     def agent(self, mock_llm_client):
@@ -68,7 +56,7 @@ class TestPatientReportExplainerAgent:
 
     def test_explain_happy_path(self, agent, mock_llm_client, base_request):
         # Arrange
-        mock_llm_client.generate.return_value = json.dumps(SAMPLE_GOOD_RESPONSE)
+        mock_llm_client.generate.return_value = SAMPLE_GOOD_RESPONSE_JSON
         
         # Act
         response = agent.explain(base_request)
@@ -78,27 +66,15 @@ class TestPatientReportExplainerAgent:
         assert response.patient_summary_text == "Normal exam."
         assert len(response.next_steps) == 0
 
-    def test_explain_with_followup_data(self, agent, mock_llm_client):
+    def test_explain_with_followup_data(self, agent, mock_llm_client, sample_followup_response):
         # Arrange
-        followup_data = FollowUpExtractionResponse(
-            incidental_findings=[
-                IncidentalFinding(
-                    id="IF1", category=IncidentalFindingCategory.pulmonary_nodule,
-                    description="nodule", followup_required=True,
-                    followup_type=FollowUpType.imaging, recommendation_strength=RecommendationStrength.explicit,
-                    verbatim_snippet="nodule",
-                    followup_interval=FollowUpInterval(months=6)
-                )
-            ],
-            has_any_followup=True
-        )
         request = PatientReportSummaryRequest(
             exam_metadata=ExamMetadata(modality="CT"),
             report_text="Nodule found.",
-            followup_data=followup_data,
+            followup_data=sample_followup_response,
             reading_level=PatientReadingLevel.STANDARD
         )
-        mock_llm_client.generate.return_value = json.dumps(SAMPLE_WITH_FOLLOWUP)
+        mock_llm_client.generate.return_value = SAMPLE_WITH_FOLLOWUP_JSON
         
         # Act
         response = agent.explain(request)
@@ -110,7 +86,7 @@ class TestPatientReportExplainerAgent:
 
     def test_no_followup_data_empty_steps(self, agent, mock_llm_client, base_request):
         # Arrange: Prompt returns no steps if report is normal
-        mock_llm_client.generate.return_value = json.dumps(SAMPLE_GOOD_RESPONSE)
+        mock_llm_client.generate.return_value = SAMPLE_GOOD_RESPONSE_JSON
         
         # Act
         response = agent.explain(base_request)
@@ -120,7 +96,7 @@ class TestPatientReportExplainerAgent:
 
     def test_retry_on_malformed_json(self, agent, mock_llm_client, base_request):
         # Arrange
-        mock_llm_client.generate.side_effect = ["BAD JSON", json.dumps(SAMPLE_GOOD_RESPONSE)]
+        mock_llm_client.generate.side_effect = ["BAD JSON", SAMPLE_GOOD_RESPONSE_JSON]
         
         # Act
         response = agent.explain(base_request)
@@ -134,5 +110,5 @@ class TestPatientReportExplainerAgent:
         mock_llm_client.generate.return_value = "REALLY BAD JSON"
         
         # Act & Assert
-        with pytest.raises(LLMJsonParseError):
+        with pytest.raises(LLMJsonParseError, match=r"^Failed to parse response"):
             agent.explain(base_request)
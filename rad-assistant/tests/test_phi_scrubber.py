@@ -0,0 +1,52 @@
+from radiology_assistant import phi_scrubber
+from radiology_assistant.phi_scrubber import PHIScrubber
+
+
+def test_scrub_replaces_phi_in_pattern_order():
+    scrubber = PHIScrubber()
+    assert scrubber.scrub("Patient: John Doe, DOB: 01/01/1980") == "[PROVIDER_OR_PATIENT], DOB: [DATE]"
+    assert scrubber.scrub("Seen by Dr. John Smith on January 15, 2024") == "Seen by [PROVIDER_OR_PATIENT] [DATE]"
+    assert scrubber.scrub("Contact dr@example.com") == "Contact [EMAIL]"
+
+
+def test_scrub_skips_patterns_whose_triggers_are_absent():
+    scrubber = PHIScrubber()
+    text = "The lungs are clear. No pleural effusion."
+    assert scrubber.scrub(text) is text
+
+    # IGNORECASE matches the dotted capital I; the triggers must not miss it
+    assert scrubber.scrub("Patient İD: AB1234") == "[PATIENT_ID]"
+
+
+def test_email_pattern_is_linear_on_long_local_part_runs():
+    # Took seconds before the local part was capped; now a few milliseconds
+    text = "@ " + "b." * 20000
+    assert PHIScrubber().scrub(text) == text
+
+
+def test_short_strings_are_memoized():
+    phi_scrubber.clear_scrub_cache()
+    scrubber = PHIScrubber()
+    scrubber.scrub_dict({"a": "MRN: 12345678", "b": ["MRN: 12345678"], "c": {"d": "MRN: 12345678"}})
+    assert list(phi_scrubber._scrub_cache.values()) == ["[MRN]"]
+    assert all("12345678" not in str(key) for key in phi_scrubber._scrub_cache)  # keyed on a digest
+
+    long_text = "MRN: 12345678 " * 200
+    assert scrubber.scrub(long_text) == "[MRN] " * 200
+    assert len(phi_scrubber._scrub_cache) == 1
+
+
+def test_scrub_dict_copies_and_scrubs_nested_containers():
+    data = {"id": 7, "notes": ["MRN: 12345678", ["a@b.com"], {"dob": "DOB: 01/01/1980"}], "meta": {"ok": "clear"}}
+    scrubbed = PHIScrubber().scrub_dict(data)
+
+    assert scrubbed == {"id": 7, "notes": ["[MRN]", ["[EMAIL]"], {"dob": "DOB: [DATE]"}], "meta": {"ok": "clear"}}
+    assert data["notes"][0] == "MRN: 12345678" and data["notes"][1] == ["a@b.com"]
+
+
+def test_ascii_fast_path_matches_str_semantics():
+    scrubber = PHIScrubber()
+    assert scrubber.scrub("Call 555-123-4567 now") == "Call [PHONE] now"
+    # str-mode \s matches the ASCII separators \x1c-\x1f; bytes-mode does not
+    assert scrubber.scrub("Call 555\x1e123\x1e4567 now") == "Call [PHONE] now"
+    assert scrubber.scrub("Call 555-123-4567 for café") == "Call [PHONE] for café"
@@ -4,15 +4,10 @@ Unit tests for Report Drafting Agent.
 Tests focus on Agent 1 behavior: input validation, report generation, and JSON output.
 """
 
-import unittest
 from unittest.mock import Mock
 import json
 
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
 
 from radiology_assistant.models import (
     Finding, ClinicalContext, ReportDraftRequest, ReportDraft,
@@ -22,61 +17,76 @@ from radiology_assistant.agents import ReportDraftingAgent
 from radiology_assistant.llm_client import LLMClient
 
 
-class TestReportDraftingAgent(unittest.TestCase):
-    """Test cases for ReportDraftingAgent - Agent 1."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create a mock LLM client
-        self.mock_llm_client = Mock(spec=LLMClient)
-        self.agent = ReportDraftingAgent(self.mock_llm_client)
-        
-        # Create sample request
-        self.sample_findings = [
-            Finding(
-                location="right lower lobe",
-                type="opacity",
-                severity="moderate"
-            ),
-            Finding(
-                location="cardiac silhouette",
-                type="cardiomegaly",
-                severity="mild"
-            )
-        ]
-        
-        self.sample_context = ClinicalContext(
-            patient_info="65-year-old male",
-            clinical_presentation="Fever and cough for 3 days",
-            relevant_history="History of COPD"
-        )
-        
-        # Create optional CV summary
-        self.cv_summary = CVHighlightResult(
-            modality="DX",
-            summary="Opacity RLL",
-            regions=[
-                CVRegionHighlight(label="Opacity", score=0.88),
-            ]
-        )
-        
-        self.sample_request = ReportDraftRequest(
-            findings=self.sample_findings,
-            clinical_context=self.sample_context,
-            modality="Chest X-ray",
-            view="PA & lateral",
-            cv_summary=self.cv_summary
+# Built once per module and shared by every test: treat as read-only
+@pytest.fixture(scope="module")
+def sample_findings():
+    return [
+        Finding(
+            location="right lower lobe",
+            type="opacity",
+            severity="moderate"
+        ),
+        Finding(
+            location="cardiac silhouette",
+            type="cardiomegaly",
+            severity="mild"
         )
+    ]
+
+
+@pytest.fixture(scope="module")
+def sample_context():
+    return ClinicalContext(
+        patient_info="65-year-old male",
+        clinical_presentation="Fever and cough for 3 days",
+        relevant_history="History of COPD"
+    )
+
+
+@pytest.fixture(scope="module")
+def cv_summary():
+    return CVHighlightResult(
+        modality="DX",
+        summary="Opacity RLL",
+        regions=[
+            CVRegionHighlight(label="Opacity", score=0.88),
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_request(sample_findings, sample_context, cv_summary):
+    return ReportDraftRequest(
+        findings=sample_findings,
+        clinical_context=sample_context,
+        modality="Chest X-ray",
+        view="PA & lateral",
+        cv_summary=cv_summary
+    )
+
+
+@pytest.fixture
+def mock_llm_client():
+    return Mock(spec=LLMClient)
+
+
+@pytest.fixture
+def agent(mock_llm_client):
+    return ReportDraftingAgent(mock_llm_client)
+
+
+class TestReportDraftingAgent:
+    """Test cases for ReportDraftingAgent - Agent 1."""
     
     # ========== Input Validation Tests ==========
-    def test_report_draft_request_creation(self):
+    def test_report_draft_request_creation(self, sample_request):
         """Test that ReportDraftRequest is properly created and validated."""
-        request = self.sample_request
+        request = sample_request
         
-        self.assertEqual(len(request.findings), 2)
-        self.assertEqual(request.clinical_context.patient_info, "65-year-old male")
-        self.assertEqual(request.modality, "Chest X-ray")
-        self.assertIsNotNone(request.cv_summary)
+        assert len(request.findings) == 2
+        assert request.clinical_context.patient_info == "65-year-old male"
+        assert request.modality == "Chest X-ray"
+        assert request.cv_summary is not None
     
     # ========== Output Validation Tests ==========
     def test_report_draft_response_validation(self):
@@ -93,46 +103,46 @@ class TestReportDraftingAgent(unittest.TestCase):
         )
         
         # Verify all fields are present
-        self.assertIsNotNone(report.report_text)
-        self.assertEqual(len(report.key_findings), 1)
-        self.assertEqual(len(report.used_cv_signals), 1)
+        assert report.report_text is not None
+        assert len(report.key_findings) == 1
+        assert len(report.used_cv_signals) == 1
         
         # Verify confidence_score is in valid range
-        self.assertGreaterEqual(report.confidence_score, 0.0)
-        self.assertLessEqual(report.confidence_score, 1.0)
+        assert report.confidence_score >= 0.0
+        assert report.confidence_score <= 1.0
     
     # ========== Agent Logic Tests ==========
-    def test_agent_format_findings(self):
+    def test_agent_format_findings(self, agent, sample_request):
         """Test that findings are correctly formatted for prompt."""
-        formatted = self.agent._format_findings(self.sample_request)
+        formatted = agent._format_findings(sample_request)
         
         # Check all finding information is present
-        self.assertIn("right lower lobe", formatted.lower())
-        self.assertIn("opacity", formatted.lower())
-        self.assertIn("moderate", formatted.lower())
+        assert "right lower lobe" in formatted.lower()
+        assert "opacity" in formatted.lower()
+        assert "moderate" in formatted.lower()
     
-    def test_agent_format_cv_summary(self):
+    def test_agent_format_cv_summary(self, agent, sample_request):
         """Test that CV summary is correctly formatted."""
-        formatted = self.agent._format_cv_summary(self.sample_request)
+        formatted = agent._format_cv_summary(sample_request)
         
-        self.assertIn("Opacity RLL", formatted)
-        self.assertIn("Opacity", formatted)
-        self.assertIn("0.88", formatted)
+        assert "Opacity RLL" in formatted
+        assert "Opacity" in formatted
+        assert "0.88" in formatted
 
-    def test_agent_build_prompt(self):
+    def test_agent_build_prompt(self, agent, sample_request):
         """Test that prompt includes all necessary information."""
-        prompt = self.agent._build_prompt(self.sample_request)
+        prompt = agent._build_prompt(sample_request)
         
         # Verify prompt contains clinical context
-        self.assertIn("65-year-old male", prompt)
-        self.assertIn("Fever and cough", prompt)
+        assert "65-year-old male" in prompt
+        assert "Fever and cough" in prompt
         
         # Verify CV summary inclusion
-        self.assertIn("COMPUTER VISION ASSISTANT SUMMARY", prompt)
-        self.assertIn("Opacity RLL", prompt)
+        assert "COMPUTER VISION ASSISTANT SUMMARY" in prompt
+        assert "Opacity RLL" in prompt
     
     # ========== Report Generation Tests ==========
-    def test_agent_draft_report_success(self):
+    def test_agent_draft_report_success(self, agent, mock_llm_client, sample_request):
         """Test successful report generation with valid LLM response."""
         # Mock LLM to return valid JSON
         mock_response = json.dumps({
@@ -146,35 +156,32 @@ class TestReportDraftingAgent(unittest.TestCase):
             "confidence_score": 0.87
         })
         
-        self.mock_llm_client.generate.return_value = mock_response
+        mock_llm_client.generate.return_value = mock_response
         
         # Generate report
-        report = self.agent.draft_report(self.sample_request)
+        report = agent.draft_report(sample_request)
         
         # Validate output is ReportDraft
-        self.assertIsInstance(report, ReportDraft)
+        assert isinstance(report, ReportDraft)
         
         # Validate content
-        self.assertIn("Pneumonia", report.report_text)
-        self.assertEqual(report.confidence_score, 0.87)
-        self.assertEqual(report.key_findings[0].label, "RLL Opacity")
+        assert "Pneumonia" in report.report_text
+        assert report.confidence_score == 0.87
+        assert report.key_findings[0].label == "RLL Opacity"
     
-    def test_agent_draft_report_fallback_on_invalid_json(self):
+    def test_agent_draft_report_fallback_on_invalid_json(self, agent, mock_llm_client, sample_request):
         """Test fallback report when JSON parsing fails completely."""
         # Mock LLM to return invalid response
-        self.mock_llm_client.generate.return_value = "This is not valid JSON"
+        mock_llm_client.generate.return_value = "This is not valid JSON"
         
         # Generate report - should fallback gracefully
-        report = self.agent.draft_report(self.sample_request)
+        report = agent.draft_report(sample_request)
         
         # Validate fallback report is returned
-        self.assertIsInstance(report, ReportDraft)
-        self.assertIn("Unable to generate", report.report_text)
+        assert isinstance(report, ReportDraft)
+        assert "Unable to generate" in report.report_text
         
         # Fallback should have low confidence
-        self.assertLess(report.confidence_score, 0.2)
-        self.assertEqual(len(report.key_findings), 0)
-
+        assert report.confidence_score < 0.2
+        assert len(report.key_findings) == 0
 
-if __name__ == '__main__':
-    unittest.main()
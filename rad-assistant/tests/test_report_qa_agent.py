@@ -1,10 +1,5 @@
 import pytest
-from unittest.mock import Mock
 import json
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from radiology_assistant.agents.report_qa_agent import ReportQAAgent, LLMJsonParseError
 from radiology_assistant.models import (
@@ -54,11 +49,10 @@ SAMPLE_BAD_RESPONSE = {
     }
 }
 
-class TestReportQAAgent:
+SAMPLE_GOOD_RESPONSE_JSON = json.dumps(SAMPLE_GOOD_RESPONSE)
+SAMPLE_BAD_RESPONSE_JSON = json.dumps(SAMPLE_BAD_RESPONSE)
 
-    @pytest.fixture
-    def mock_llm_client(self):
-        return Mock()
+class TestReportQAAgent:
 
     @pytest.fixture
     def agent(self, mock_llm_client):
@@ -73,7 +67,7 @@ class TestReportQAAgent:
 
     def test_review_report_clean_happy_path(self, agent, mock_llm_client, sample_request):
         # Arrange
-        mock_llm_client.generate.return_value = json.dumps(SAMPLE_GOOD_RESPONSE)
+        mock_llm_client.generate.return_value = SAMPLE_GOOD_RESPONSE_JSON
 
         # Act
         response = agent.review_report(sample_request)
@@ -85,7 +79,7 @@ class TestReportQAAgent:
 
     def test_review_report_with_issues(self, agent, mock_llm_client, sample_request):
         # Arrange
-        mock_llm_client.generate.return_value = json.dumps(SAMPLE_BAD_RESPONSE)
+        mock_llm_client.generate.return_value = SAMPLE_BAD_RESPONSE_JSON
 
         # Act
         response = agent.review_report(sample_request)
@@ -98,7 +92,7 @@ class TestReportQAAgent:
         # Arrange: Fail first, succeed second
         mock_llm_client.generate.side_effect = [
             "NOT JSON",
-            json.dumps(SAMPLE_GOOD_RESPONSE)
+            SAMPLE_GOOD_RESPONSE_JSON
         ]
 
         # Act
@@ -113,7 +107,7 @@ class TestReportQAAgent:
         mock_llm_client.generate.return_value = "NOT JSON"
 
         # Act & Assert
-        with pytest.raises(LLMJsonParseError):
+        with pytest.raises(LLMJsonParseError, match=r"^Failed to parse QA response"):
             agent.review_report(sample_request)
 
     def test_clean_json_blocks(self, agent):
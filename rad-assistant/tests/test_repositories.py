@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from radiology_assistant.database import _JSON_ENGINE_ARGS, Base
+from radiology_assistant.db_models import FollowupReminderDB, LearningEventDB
+from radiology_assistant.models import DiscrepancySeverity, ExamMetadata, LearningEvent, LearningEventType
+from radiology_assistant.repositories import FollowupReminderRepository, SQLLearningEventRepository
+
+
+def _memory_session():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool, **_JSON_ENGINE_ARGS
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def _event(i):
+    return LearningEvent(
+        event_id=f"e{i}",
+        radiologist_id="rad1",
+        exam_metadata=ExamMetadata(modality="CT", body_region="Chest"),
+        event_type=LearningEventType.QA_ISSUE,
+        severity=DiscrepancySeverity.MINOR,
+        source="qa_agent",
+        timestamp="2024-01-15T10:00:00",
+        tags=["qa"],
+    )
+
+
+def test_save_many_inserts_rows_like_save():
+    db = _memory_session()
+    repo = SQLLearningEventRepository(db)
+
+    repo.save(_event(0))
+    repo.save_many([_event(i) for i in range(1, 4)])
+    repo.save_many([])
+
+    rows = db.query(LearningEventDB).order_by(LearningEventDB.id).all()
+    assert [row.id for row in rows] == ["e0", "e1", "e2", "e3"]
+    assert {(row.modality, row.body_region, row.source, tuple(row.get_tags())) for row in rows} == {
+        ("CT", "Chest", "qa_agent", ("qa",))
+    }
+
+
+def test_get_events_round_trips_saved_events():
+    db = _memory_session()
+    repo = SQLLearningEventRepository(db)
+    repo.save_many([_event(i) for i in range(3)])
+
+    events = repo.get_events("rad1", start_date="2024-01-01", end_date="2024-02-01")
+    assert sorted(event.event_id for event in events) == ["e0", "e1", "e2"]
+    event = events[0]
+    assert event.event_type is LearningEventType.QA_ISSUE
+    assert event.exam_metadata == ExamMetadata(modality="CT", body_region="Chest")
+    assert event.source == "qa_agent" and event.tags == ["qa"]
+    assert datetime.fromisoformat(event.timestamp).replace(tzinfo=None) == datetime(2024, 1, 15, 10, 0)
+    assert repo.get_events("rad1", start_date="2024-02-01") == []
+
+    row = db.get(LearningEventDB, "e0")
+    assert (row.hour_of_day, row.day_of_week) == (10, 0)
+
+
+def test_iter_events_streams_in_batches(monkeypatch):
+    db = _memory_session()
+    repo = SQLLearningEventRepository(db)
+    repo.save_many([_event(i) for i in range(5)])
+    monkeypatch.setattr(SQLLearningEventRepository, "EVENT_BATCH_SIZE", 2)
+
+    events = repo.iter_events("rad1")
+    assert next(events).radiologist_id == "rad1"
+    assert len(list(events)) == 4
+
+
+def test_get_due_reminders_returns_pending_rows_by_due_date():
+    db = _memory_session()
+    repo = FollowupReminderRepository(db)
+    now = datetime.now(timezone.utc)
+    for rid, days, status in [("late", 5, "pending"), ("soon", 1, "pending"), ("sent", 2, "sent"), ("far", 30, "pending")]:
+        repo.save_reminder(FollowupReminderDB(
+            id=rid, study_id="s1", followup_text="CT chest", due_date=now + timedelta(days=days), status=status,
+        ))
+
+    assert [row.id for row in repo.get_due_reminders(within_days=7)] == ["soon", "late"]
+
+
+def test_json_columns_round_trip_through_engine_serializer():
+    db = _memory_session()
+    event = _event(0).model_copy(update={"tags": ["qa", "ünïcode"]})
+    SQLLearningEventRepository(db).save(event)
+    db.expire_all()
+
+    row = db.query(LearningEventDB).one()
+    assert row.get_tags() == ["qa", "ünïcode"]
+    raw = db.connection().exec_driver_sql("SELECT tags_json FROM learning_events").scalar()
+    assert raw in ('["qa","ünïcode"]', '["qa", "\\u00fcn\\u00efcode"]')
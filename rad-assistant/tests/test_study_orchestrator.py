@@ -1,12 +1,8 @@
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 from datetime import datetime
-import sys
-import os
-
-# Ensure src is in path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from radiology_assistant.models import (
     StudyOrchestrationRequest, PipelineOptions, ExamMetadata, ClinicalContext,
@@ -16,16 +12,34 @@ from radiology_assistant.models import (
 )
 from radiology_assistant.agents.study_orchestrator import StudyOrchestratorAgent
 
+# Canned sub-agent results, built once; the orchestrator only reads them
+_DRAFT_REPORT = ReportDraft(
+    report_text="Draft Report", key_findings=[], used_cv_signals=[], confidence_score=0.9
+)
+_QA_GOOD = ReportQAResponse(
+    version="v1", original_report_text="Draft Report", normalized_report_text="Clean Report",
+    issues=[], summary=QASummary(overall_quality="good", num_critical=0, num_major=0, num_minor=0, comments=None)
+)
+_FOLLOWUP_EMPTY = FollowUpExtractionResponse(
+    incidental_findings=[], has_any_followup=False
+)
+_EXPLAINER_OK = PatientReportSummaryResponse(
+    version="v1", patient_summary_text="Clean Report", key_points=[], next_steps=[],
+    glossary=[], original_report_text="Clean Report"
+)
+
 # Mocks
+# One mock per method the orchestrator calls: any other attribute access
+# raises AttributeError instead of silently returning a child mock
 @pytest.fixture
 def mock_subagents():
     return {
-        "drafter": MagicMock(),
-        "qa": MagicMock(),
-        "followup": MagicMock(),
-        "explainer": MagicMock(),
-        "cv": MagicMock(),
-        "repo": MagicMock()
+        "drafter": SimpleNamespace(draft_report=MagicMock()),
+        "qa": SimpleNamespace(review_report=MagicMock()),
+        "followup": SimpleNamespace(extract_followups=MagicMock()),
+        "explainer": SimpleNamespace(explain=MagicMock()),
+        "cv": SimpleNamespace(highlight=MagicMock()),
+        "repo": SimpleNamespace(save=MagicMock())
     }
 
 @pytest.fixture
@@ -51,20 +65,10 @@ def sample_request():
 def test_orchestrate_happy_path(orchestrator, mock_subagents, sample_request):
     """Test full pipeline compliance."""
     # Setup mocks with real Pydantic objects
-    mock_subagents["drafter"].draft_report.return_value = ReportDraft(
-        report_text="Draft Report", key_findings=[], used_cv_signals=[], confidence_score=0.9
-    )
-    mock_subagents["qa"].review_report.return_value = ReportQAResponse(
-        version="v1", original_report_text="Draft Report", normalized_report_text="Clean Report",
-        issues=[], summary=QASummary(overall_quality="good", num_critical=0, num_major=0, num_minor=0, comments=None)
-    )
-    mock_subagents["followup"].extract_followups.return_value = FollowUpExtractionResponse(
-        incidental_findings=[], has_any_followup=False
-    )
-    mock_subagents["explainer"].explain.return_value = PatientReportSummaryResponse(
-        version="v1", patient_summary_text="Clean Report", key_points=[], next_steps=[], 
-        glossary=[], original_report_text="Clean Report"
-    )
+    mock_subagents["drafter"].draft_report.return_value = _DRAFT_REPORT
+    mock_subagents["qa"].review_report.return_value = _QA_GOOD
+    mock_subagents["followup"].extract_followups.return_value = _FOLLOWUP_EMPTY
+    mock_subagents["explainer"].explain.return_value = _EXPLAINER_OK
     
     # Run
     response = orchestrator.orchestrate_study(sample_request)
@@ -80,6 +84,13 @@ def test_orchestrate_happy_path(orchestrator, mock_subagents, sample_request):
         else:
              assert stage.status == StageStatus.SKIPPED
 
+    # Child requests share the validated ExamMetadata instead of re-validating copies
+    shared = sample_request.exam_metadata
+    assert response.bundle.exam_metadata is shared
+    assert mock_subagents["qa"].review_report.call_args[0][0].exam_metadata is shared
+    assert mock_subagents["followup"].extract_followups.call_args[0][0].exam_metadata is shared
+    assert mock_subagents["explainer"].explain.call_args[0][0].exam_metadata is shared
+
 def test_orchestrate_draft_failure(orchestrator, mock_subagents, sample_request):
     """Test critical failure at draft stage."""
     mock_subagents["drafter"].draft_report.side_effect = Exception("LLM Error")
@@ -96,9 +107,7 @@ def test_orchestrate_draft_failure(orchestrator, mock_subagents, sample_request)
 
 def test_orchestrate_qa_failure_fail_soft(orchestrator, mock_subagents, sample_request):
     """Test non-critical failure at QA stage."""
-    mock_subagents["drafter"].draft_report.return_value = ReportDraft(
-        report_text="Draft Report", key_findings=[], used_cv_signals=[], confidence_score=0.9
-    )
+    mock_subagents["drafter"].draft_report.return_value = _DRAFT_REPORT
     mock_subagents["qa"].review_report.side_effect = Exception("QA Error")
     
     response = orchestrator.orchestrate_study(sample_request)
@@ -116,9 +125,7 @@ def test_options_skip_stages(orchestrator, mock_subagents, sample_request):
     """Test disabling stages via options."""
     sample_request.pipeline_options.run_qa_review = False
     
-    mock_subagents["drafter"].draft_report.return_value = ReportDraft(
-        report_text="Draft Report", key_findings=[], used_cv_signals=[], confidence_score=0.9
-    )
+    mock_subagents["drafter"].draft_report.return_value = _DRAFT_REPORT
     
     response = orchestrator.orchestrate_study(sample_request)
     
@@ -1,35 +1,45 @@
+import io
 import pytest
 from unittest.mock import MagicMock
 import numpy as np
+from PIL import Image
 from radiology_assistant.agents.visual_highlighter import VisualHighlightingAgent
 from radiology_assistant.models import CVHighlightRequest, CVHighlightResult
 from radiology_assistant.cv.models import ChestXrayAnomalyModel
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def chest_png_bytes():
+    # 224x224 grayscale PNG, encoded once
+    buf = io.BytesIO()
+    Image.new('L', (224, 224), color=100).save(buf, format='PNG')
+    return buf.getvalue()
+
+# Shared across tests; read-only so an in-place write by the agent fails loudly
+_ZERO_HEATMAP = np.zeros((224, 224), dtype=np.float32)
+_ZERO_HEATMAP.flags.writeable = False
+
+def _set_predict(model, heatmap, regions):
+    model.predict.return_value = {"heatmap": heatmap, "regions": regions}
+
+@pytest.fixture(scope="module")
 def mock_model():
-    model = MagicMock(spec=ChestXrayAnomalyModel)
-    # Mock predict return
-    model.predict.return_value = {
-        "heatmap": np.zeros((224, 224), dtype=np.float32),
-        "regions": [
-            {"label": "opacity", "score": 0.9, "bbox": [10, 10, 50, 50]}
-        ]
-    }
-    return model
-
-def test_highlight_success(mock_model):
+    # Built once: spec= introspects ChestXrayAnomalyModel on construction
+    return MagicMock(spec=ChestXrayAnomalyModel)
+
+@pytest.fixture(autouse=True)
+def _default_prediction(mock_model):
+    mock_model.reset_mock(return_value=True, side_effect=True)
+    _set_predict(
+        mock_model,
+        heatmap=_ZERO_HEATMAP,
+        regions=[{"label": "opacity", "score": 0.9, "bbox": [10, 10, 50, 50]}],
+    )
+
+def test_highlight_success(mock_model, chest_png_bytes):
     agent = VisualHighlightingAgent(model=mock_model)
     
-    # Create dummy image bytes (PNG)
-    import io
-    from PIL import Image
-    img = Image.new('L', (224, 224), color=100)
-    buf = io.BytesIO()
-    img.save(buf, format='PNG')
-    image_bytes = buf.getvalue()
-
     request = CVHighlightRequest(modality="DX")
-    result = agent.highlight(request, image_bytes)
+    result = agent.highlight(request, chest_png_bytes)
 
     assert isinstance(result, CVHighlightResult)
     assert result.modality == "DX"
@@ -40,23 +50,12 @@ def test_highlight_success(mock_model):
     assert len(result.heatmap_png_base64) > 0
     assert "opacity" in result.summary
 
-def test_highlight_no_anomalies(mock_model):
-    mock_model.predict.return_value = {
-        "heatmap": None,
-        "regions": []
-    }
+def test_highlight_no_anomalies(mock_model, chest_png_bytes):
+    _set_predict(mock_model, heatmap=None, regions=[])
     agent = VisualHighlightingAgent(model=mock_model)
     
-    # Create dummy image bytes
-    import io
-    from PIL import Image
-    img = Image.new('L', (224, 224), color=100)
-    buf = io.BytesIO()
-    img.save(buf, format='PNG')
-    image_bytes = buf.getvalue()
-
     request = CVHighlightRequest(modality="DX")
-    result = agent.highlight(request, image_bytes)
+    result = agent.highlight(request, chest_png_bytes)
 
     assert len(result.regions) == 0
     assert "No significant anomalies" in result.summary
@@ -3,7 +3,7 @@ Unit tests for Agent 6: Worklist Triage.
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 from radiology_assistant.models import (
     WorklistTriageRequest,
     WorklistItem,
@@ -15,7 +15,8 @@ from radiology_assistant.models import (
 )
 from radiology_assistant.agents.worklist_triage import WorklistTriageAgent, CVRouter
 
-@pytest.fixture
+# Built once per module and shared by every test: treat as read-only
+@pytest.fixture(scope="module")
 def mock_config():
     return TriageConfig(
         thresholds=[
@@ -41,71 +42,56 @@ def mock_llm():
 def triage_agent(mock_config, mock_llm):
     return WorklistTriageAgent(config=mock_config, llm_client=mock_llm)
 
-def test_triage_happy_path(triage_agent):
-    """Test standard triage with STAT priority boost."""
-    # Mock CV router to return a mock agent
+@pytest.fixture(scope="session")
+def thumbnail_path(tmp_path_factory):
+    # The agent reads the thumbnail itself; the stub CV agent ignores the bytes
+    path = tmp_path_factory.mktemp("thumbs") / "dummy.png"
+    path.write_bytes(b"\x00")
+    return str(path)
+
+@pytest.mark.parametrize("cv_outcome, priority, expected_labels, min_score", [
+    # CV score 0.5 is boosted by the STAT order priority to at least 0.8
+    (("Opacities", 0.5), "STAT", {TriageLabel.HIGH, TriageLabel.CRITICAL}, 0.8),
+    (("Pneumothorax", 0.95), None, {TriageLabel.CRITICAL}, 0.95),
+    # A failing CV model is skipped: the item is scored without it (0 < low threshold)
+    (Exception("CV Model Failed"), None, {TriageLabel.LOW, TriageLabel.ROUTINE}, 0.0),
+], ids=["stat_boost", "critical_cv", "cv_error"])
+def test_triage_cv_scoring(triage_agent, thumbnail_path, cv_outcome, priority, expected_labels, min_score):
+    """CV region scores (or a CV failure) and order priority map to triage labels."""
     mock_cv_agent = MagicMock()
-    # Mock result with high score
-    mock_result = MagicMock()
-    mock_region = MagicMock()
-    mock_region.score = 0.5
-    mock_region.label = "Opacities"
-    mock_result.regions = [mock_region]
-    mock_cv_agent.highlight.return_value = mock_result
+    if isinstance(cv_outcome, Exception):
+        mock_cv_agent.highlight.side_effect = cv_outcome
+    else:
+        mock_region = MagicMock()
+        mock_region.label, mock_region.score = cv_outcome
+        mock_cv_agent.highlight.return_value = MagicMock(regions=[mock_region])
     
     triage_agent.cv_router.get_model_for_item = MagicMock(return_value=mock_cv_agent)
     
-    # Input item: Score 0.5 (CV) -> boosted by STAT if applicable
     item = WorklistItem(
-        study_id="123",
+        study_id="cv",
         modality="XR",
         body_region="Chest",
-        priority_flag_from_order="STAT",
-        image_reference={"thumbnail_path": "dummy.png"}
+        priority_flag_from_order=priority,
+        image_reference={"thumbnail_path": thumbnail_path}
     )
-    request = WorklistTriageRequest(worklist_items=[item])
     
-    # We need to mock open() since the agent tries to read the file
-    with patch("builtins.open", MagicMock()):
-        response = triage_agent.triage(request)
-        
+    response = triage_agent.triage(WorklistTriageRequest(worklist_items=[item]))
+    
+    assert mock_cv_agent.highlight.call_args[0][1] == b"\x00"
     assert len(response.items) == 1
     t_item = response.items[0]
-    assert t_item.study_id == "123"
-    # STAT boosts score to min 0.8
-    assert t_item.triage_score >= 0.8
-    assert t_item.triage_label == TriageLabel.HIGH or t_item.triage_label == TriageLabel.CRITICAL
+    assert t_item.study_id == "cv"
+    assert t_item.triage_label in expected_labels
+    assert t_item.triage_score >= min_score
+    # CV failures are swallowed, so no item-level error
+    assert t_item.error is None
     
-    # Check reasons
     reasons = [r.type for r in t_item.reasons]
-    assert TriageReasonType.MODEL_PREDICTION in reasons
-    assert TriageReasonType.CLINICAL_INDICATION in reasons
-
-def test_triage_critical_cv(triage_agent):
-    """Test critical CV score leads to CRITICAL label."""
-    mock_cv_agent = MagicMock()
-    mock_result = MagicMock()
-    mock_region = MagicMock()
-    mock_region.score = 0.95
-    mock_region.label = "Pneumothorax"
-    mock_result.regions = [mock_region]
-    mock_cv_agent.highlight.return_value = mock_result
-    
-    triage_agent.cv_router.get_model_for_item = MagicMock(return_value=mock_cv_agent)
-    
-    item = WorklistItem(
-        study_id="crit",
-        modality="XR",
-        body_region="Chest",
-        image_reference={"thumbnail_path": "dummy.png"}
-    )
-    
-    with patch("builtins.open", MagicMock()):
-        response = triage_agent.triage(WorklistTriageRequest(worklist_items=[item]))
-        
-    t_item = response.items[0]
-    assert t_item.triage_label == TriageLabel.CRITICAL
-    assert t_item.triage_score >= 0.95
+    if not isinstance(cv_outcome, Exception):
+        assert TriageReasonType.MODEL_PREDICTION in reasons
+    if priority == "STAT":
+        assert TriageReasonType.CLINICAL_INDICATION in reasons
 
 def test_missing_config_fallback(triage_agent):
     """Test item with no matching config."""
@@ -121,32 +107,6 @@ def test_missing_config_fallback(triage_agent):
     assert t_item.triage_label == TriageLabel.UNTRIAGED
     assert t_item.error is not None
 
-def test_fail_soft_cv_error(triage_agent):
-    """Test that if CV model raises exception, item is still processed/returned with error."""
-    mock_cv_agent = MagicMock()
-    mock_cv_agent.highlight.side_effect = Exception("CV Model Failed")
-    triage_agent.cv_router.get_model_for_item = MagicMock(return_value=mock_cv_agent)
-    
-    item = WorklistItem(
-        study_id="failcv",
-        modality="XR",
-        body_region="Chest",
-        image_reference={"thumbnail_path": "dummy.png"}
-    )
-    
-    with patch("builtins.open", MagicMock()):
-        response = triage_agent.triage(WorklistTriageRequest(worklist_items=[item]))
-        
-    t_item = response.items[0]
-    # It might return LOW/ROUTINE (0 score) if logic just swallows exception and continues scoring based on 0 CV score
-    # OR unhandled processing exception makes it UNTRIAGED.
-    # In my implementation: "We continue without CV result" -> Score 0 -> Label LOW or ROUTINE (depending on threshold)
-    # Thresholds: low=0.3. Score 0 < 0.3 -> LOW.
-    assert t_item.study_id == "failcv"
-    assert t_item.triage_label == TriageLabel.LOW or t_item.triage_label == TriageLabel.ROUTINE
-    # Note: Logic captures specific CV fail as "continue without result", so no global error on item unless calc fails.
-    assert t_item.error is None # Should proceed to calculation
-
 def test_fail_soft_unexpected_error(triage_agent):
     """Test unexpected error during processing."""
     # Force error by making get_thresholds raise or something core
@@ -157,7 +117,7 @@ def test_fail_soft_unexpected_error(triage_agent):
     
     t_item = response.items[0]
     assert t_item.triage_label == TriageLabel.UNTRIAGED
-    assert "Boom" in (t_item.error or "")
+    assert t_item.error == "Internal error: Boom"
 
 def test_llm_explanation_failure(triage_agent):
     """Test that LLM failure doesn't crash triage."""
@@ -171,3 +131,32 @@ def test_llm_explanation_failure(triage_agent):
     t_item = response.items[0]
     assert t_item.explanation_text is None
     assert t_item.triage_label in [TriageLabel.HIGH, TriageLabel.CRITICAL]
+
+def test_get_thresholds_prefers_first_matching_entry(mock_llm):
+    def thresholds(region, critical):
+        return TriageThresholdConfig(
+            modality_group=ModalityGroup.CT, body_region=region,
+            critical_threshold=critical, high_threshold=0.5, low_threshold=0.1,
+        )
+
+    config = TriageConfig(thresholds=[thresholds("Head", 0.9), thresholds(None, 0.8), thresholds("Chest", 0.7)])
+    agent = WorklistTriageAgent(config=config, llm_client=mock_llm)
+
+    assert agent._get_thresholds("CT", "HEAD").critical_threshold == 0.9
+    # The generic CT entry comes before the Chest one, so it wins
+    assert agent._get_thresholds("CT", "chest").critical_threshold == 0.8
+    assert agent._get_thresholds("CT", None).critical_threshold == 0.8
+    assert agent._get_thresholds("MR", "Head") is None
+
+
+def test_find_thresholds_follows_replaced_thresholds():
+    def thresholds(critical):
+        return TriageThresholdConfig(modality_group=ModalityGroup.CT, critical_threshold=critical)
+
+    config = TriageConfig(thresholds=[thresholds(0.9)])
+    assert config.find_thresholds("CT", None).critical_threshold == 0.9
+
+    copied = config.model_copy(update={"thresholds": [thresholds(0.6)]})
+    assert copied.find_thresholds("CT", None).critical_threshold == 0.6
+    config.thresholds = [thresholds(0.5)]
+    assert config.find_thresholds("CT", None).critical_threshold == 0.5